@@ -0,0 +1,106 @@
+"""
+Benchmark of BlogReadTimeEngine word counting on large blog bodies.
+
+Compares the current engine against the previous implementation, which
+    split title, body, description and tags into one list of words.
+
+Usage:
+    python -m benchmarks.read_time [--body-kb 50 200] [--repeat 20]
+"""
+import argparse
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable, List
+
+from faker import Faker
+
+from core_apps.blogs.read_time_engine import (
+    BlogReadTimeEngine,
+    batch_read_times,
+    count_words,
+)
+
+
+def legacy_word_count(blog: Any) -> int:
+    """Count words the way the engine did before streaming counts."""
+    details: List[str] = []
+    details.extend(blog.title.split())
+    details.extend(blog.body.split())
+    details.extend(blog.description.split())
+    for tag in blog.list_of_tags:
+        details.extend(tag.split())
+    return len(details)
+
+
+def make_blog(
+    faker: Faker, body_kb: int, pkid: int = 1, markup: bool = True
+) -> SimpleNamespace:
+    """Build a blog-like object with a body of about body_kb KB."""
+    paragraphs: List[str] = []
+    size = 0
+    while size < body_kb * 1024:
+        paragraph = faker.paragraph(nb_sentences=12)
+        if markup:
+            paragraph = f"## {faker.sentence()}\n\n{paragraph}"
+            paragraph += f" See [the docs]({faker.url()}) for **more**."
+        paragraph += "\n"
+        paragraphs.append(paragraph)
+        size += len(paragraph)
+    return SimpleNamespace(
+        pkid=pkid,
+        title=faker.sentence(nb_words=6),
+        description=faker.sentence(nb_words=12),
+        body="\n".join(paragraphs),
+        banner_image="/house_sample.jpg",
+        list_of_tags=["django", "rest framework", "performance"],
+    )
+
+
+def measure(label: str, func: Callable[[], Any], repeat: int) -> None:
+    """Print the mean time and peak allocation of func."""
+    seconds = timeit.timeit(func, number=repeat) / repeat
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<22} {seconds * 1000:9.2f} ms {peak / 1024:10.1f} KiB peak")
+
+
+def main() -> None:
+    """Run the benchmark for each requested body size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--body-kb", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--batch", type=int, default=50)
+    args = parser.parse_args()
+
+    faker = Faker()
+    Faker.seed(0)
+    for body_kb in args.body_kb:
+        blog = make_blog(faker, body_kb)
+        blogs = [blog] * args.batch
+        print(f"{body_kb} KB body ({len(blog.body)} characters)")
+        measure("legacy split", lambda: legacy_word_count(blog), args.repeat)
+        measure("count_words", lambda: count_words(blog.body), args.repeat)
+        measure(
+            "engine (strip+stream)",
+            lambda: BlogReadTimeEngine(blog).get_word_count(),
+            args.repeat,
+        )
+        plain = make_blog(faker, body_kb, markup=False)
+        measure("legacy split (plain)", lambda: legacy_word_count(plain), args.repeat)
+        measure(
+            "engine (plain)",
+            lambda: BlogReadTimeEngine(plain).get_word_count(),
+            args.repeat,
+        )
+        measure(
+            f"batch_read_times x{args.batch}",
+            lambda: batch_read_times(blogs),
+            max(1, args.repeat // 10),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark of the envelope JSON renderers on a page of serialized blogs.
+
+Compares the previous renderer, which called json.dumps on the whole
+    envelope, with EnvelopeJSONRenderer encoding through DRF's encoder
+    and through orjson (when installed).
+
+Usage:
+    python -m benchmarks.renderers [--blogs 100] [--repeat 200]
+"""
+import argparse
+import json
+import timeit
+import uuid
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from faker import Faker  # noqa: E402
+
+from core_apps.common import renderers  # noqa: E402
+from core_apps.common.renderers import EnvelopeJSONRenderer  # noqa: E402
+
+
+class BlogsRenderer(EnvelopeJSONRenderer):
+    """Renderer under test, as used by the blog list."""
+
+    envelope_key = "blogs"
+
+
+def make_blog(faker: Faker) -> Dict[str, Any]:
+    """Build a dict shaped like a BlogSerializer representation."""
+    return OrderedDict(
+        id=str(uuid.uuid4()),
+        title=faker.sentence(nb_words=6),
+        slug=faker.slug(),
+        tagList=["django", "performance"],
+        description=faker.sentence(nb_words=20),
+        body=faker.paragraph(nb_sentences=40),
+        banner_image="/mediafiles/house_sample.jpg",
+        read_time="2 minute(s)",
+        author_info={
+            "username": faker.user_name(),
+            "fullname": faker.name(),
+            "about_me": faker.sentence(),
+            "profile_photo": "/mediafiles/profile_default.png",
+            "email": faker.email(),
+            "twitter_handle": "",
+            "facebook_account": "",
+            "github_account": "",
+        },
+        likes=faker.pyint(),
+        dislikes=faker.pyint(),
+        ratings=[],
+        num_ratings=3,
+        average_rating=4.33,
+        rating_histogram={1: 0, 2: 0, 3: 0, 4: 2, 5: 1},
+        views=faker.pyint(),
+        num_comments=faker.pyint(),
+        created_at="03/20/2024, 15:51:02",
+        updated_at="03/20/2024, 15:51:02",
+    )
+
+
+def measure(label: str, func: Callable[[], bytes], repeat: int) -> None:
+    """Print the mean time of func and the size of its output."""
+    seconds = timeit.timeit(func, number=repeat) / repeat
+    print(f"  {label:<22} {seconds * 1000:8.3f} ms {len(func()) / 1024:8.1f} KiB")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blogs", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    Faker.seed(0)
+    faker = Faker()
+    data: List[Dict[str, Any]] = [make_blog(faker) for _ in range(args.blogs)]
+    page = OrderedDict(next=None, previous=None, results=data)
+    context = {"response": SimpleNamespace(status_code=200)}
+    renderer = BlogsRenderer()
+
+    print(f"{args.blogs} blogs")
+    measure(
+        "legacy json.dumps",
+        lambda: json.dumps({"status_code": 200, "blogs": page}).encode(),
+        args.repeat,
+    )
+    orjson = renderers.orjson
+    renderers.orjson = None
+    measure(
+        "envelope, DRF encoder",
+        lambda: renderer.render(page, renderer_context=context),
+        args.repeat,
+    )
+    renderers.orjson = orjson
+    if orjson is not None:
+        measure(
+            "envelope, orjson",
+            lambda: renderer.render(page, renderer_context=context),
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
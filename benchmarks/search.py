@@ -0,0 +1,127 @@
+"""
+Benchmark of the Whoosh and PostgreSQL search backends.
+
+Creates --blogs blogs inside a transaction that is rolled back at the
+    end, indexes them into a temporary Whoosh index and into
+    Blog.search_vector, then times indexing and prefix queries on each
+    backend. Needs DATABASE_URL to point at PostgreSQL.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=modern_blog_api.settings.development \\
+        python -m benchmarks.search [--blogs 100000] [--repeat 20]
+"""
+import argparse
+import shutil
+import tempfile
+import time
+from typing import Callable, List
+
+import django
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+from faker import Faker  # noqa: E402
+from haystack import connections as haystack_connections  # noqa: E402
+from haystack.query import SearchQuerySet  # noqa: E402
+
+from core_apps.blogs.models import Blog  # noqa: E402
+from core_apps.search.indexing import get_blog_index  # noqa: E402
+
+# Typeahead style queries, matched as word prefixes by both backends
+QUERIES = ["dja", "python perf", "data", "the quick", "zzzz"]
+
+
+class Rollback(Exception):
+    """Raised to roll back the benchmark data."""
+
+
+def timed(label: str, func: Callable[[], object], repeat: int = 1) -> None:
+    """Print the mean time of func."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    seconds = (time.perf_counter() - start) / repeat
+    print(f"  {label:<34} {seconds * 1000:10.2f} ms")
+
+
+def create_blogs(count: int, faker: Faker) -> List[Blog]:
+    """Bulk create count blogs by one author."""
+    author = get_user_model().objects.create(
+        username="search-benchmark",
+        email="search-benchmark@example.com",
+        first_name="Search",
+        last_name="Benchmark",
+    )
+    blogs = [
+        Blog(
+            author=author,
+            title=faker.sentence(nb_words=6),
+            slug=f"search-benchmark-{n}",
+            description=faker.sentence(nb_words=20),
+            body=faker.paragraph(nb_sentences=30),
+        )
+        for n in range(count)
+    ]
+    return Blog.objects.bulk_create(blogs, batch_size=5000)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blogs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    if connection.vendor != "postgresql":
+        parser.error("DATABASE_URL must point at PostgreSQL")
+
+    Faker.seed(0)
+    faker = Faker()
+    whoosh_dir = tempfile.mkdtemp(prefix="whoosh-benchmark-")
+    haystack_connections.connections_info["benchmark"] = {
+        "ENGINE": "haystack.backends.whoosh_backend.WhooshEngine",
+        "PATH": whoosh_dir,
+    }
+    print(f"{args.blogs} blogs, postgres config {settings.SEARCH_POSTGRES_CONFIG!r}")
+    try:
+        with transaction.atomic():
+            timed("create blogs", lambda: create_blogs(args.blogs, faker))
+            blogs = Blog.objects.filter(author__username="search-benchmark")
+            backend = haystack_connections["benchmark"].get_backend()
+            index = get_blog_index("benchmark")
+            timed(
+                "index: whoosh",
+                lambda: backend.update(
+                    index, index.build_queryset().filter(pk__in=blogs)
+                ),
+            )
+            timed("index: postgres search_vector", blogs.refresh_search_vectors)
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {Blog._meta.db_table}")
+
+            whoosh = SearchQuerySet(using="benchmark").models(Blog)
+            for query in QUERIES:
+                print(f"q={query!r}")
+                timed(
+                    "whoosh, first page",
+                    lambda: list(whoosh.autocomplete(autocomplete=query)[:10]),
+                    args.repeat,
+                )
+                timed(
+                    "postgres, first page",
+                    lambda: list(
+                        blogs.search(query).values_list("pkid", flat=True)[:10]
+                    ),
+                    args.repeat,
+                )
+            raise Rollback
+    except Rollback:
+        pass
+    finally:
+        shutil.rmtree(whoosh_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
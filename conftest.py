@@ -1,11 +1,53 @@
 import pytest
+from django.core.cache import cache
+from haystack import connections as haystack_connections
 from pytest_factoryboy import register
 from core_apps.users.tests.factories import UserFactory
 from core_apps.profiles.tests.factories import ProfileFactory
+from core_apps.blogs.tests.factories import BlogFactory
 
 
 register(UserFactory)
 register(ProfileFactory)
+register(BlogFactory)
+
+
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    """Use an in-process cache so tests don't need a running Redis"""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def search_backend():
+    """Keep model saves from writing to the committed whoosh index"""
+    original = haystack_connections.connections_info
+    haystack_connections.connections_info = {
+        "default": {"ENGINE": "haystack.backends.simple_backend.SimpleEngine"}
+    }
+    haystack_connections.reload("default")
+    yield
+    haystack_connections.connections_info = original
+    haystack_connections.reload("default")
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Point the Redis consumers at an in-process fake Redis"""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    client = fakeredis.FakeRedis()
+    for module in (
+        "core_apps.blogs.feed",
+        "core_apps.profiles.graph",
+        "core_apps.profiles.notifications",
+    ):
+        monkeypatch.setattr(f"{module}.get_redis", lambda url=None: client)
+    yield client
+    client.flushall()
 
 @pytest.fixture
 def base_user(db, user_factory):
@@ -1,6 +1,8 @@
-from typing import List
+from typing import List, Union
 
 from django.contrib import admin
+from django.db.models import QuerySet
+from django.http import HttpRequest
 
 from . import models
 
@@ -17,10 +19,61 @@ class BlogAdmin(admin.ModelAdmin):
         in the admin list view.
     - list_display_links (list): List of fields to use
         as links in the admin list view.
+
+    Methods:
+    - get_queryset: Annotate rating stats on the admin queryset.
+    - average_rating: Display the annotated average rating.
+    - num_ratings: Display the annotated number of ratings.
     """
 
-    list_display: List[str] = ["pkid", "author", "slug", "blog_read_time", "views"]
+    list_display: List[str] = [
+        "pkid",
+        "author",
+        "slug",
+        "read_time",
+        "views",
+        "average_rating",
+        "num_ratings",
+    ]
     list_display_links: List[str] = ["pkid", "author"]
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """Fetch authors and rating stats with the admin list query."""
+        queryset = super().get_queryset(request)
+        return queryset.select_related("author").with_rating_stats()
+
+    @admin.display(description="average rating", ordering="rating_average")
+    def average_rating(self, obj: models.Blog) -> Union[float, int]:
+        """Display the annotated average rating."""
+        return obj.get_average_rating()
+
+    @admin.display(description="ratings", ordering="rating_count")
+    def num_ratings(self, obj: models.Blog) -> int:
+        """Display the annotated number of ratings."""
+        return obj.rating_count
+
+
+class BlogStatsAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the BlogStats model.
+
+    Attributes:
+    - list_display (list): List of fields to display
+        in the admin list view.
+    - list_select_related (list): Relations fetched with
+        the admin list query.
+    """
+
+    list_display: List[str] = [
+        "blog",
+        "likes_count",
+        "dislikes_count",
+        "comments_count",
+        "favorites_count",
+        "ratings_count",
+    ]
+    list_select_related: List[str] = ["blog__author"]
+
 
 admin.site.register(models.Blog, BlogAdmin)
+admin.site.register(models.BlogStats, BlogStatsAdmin)
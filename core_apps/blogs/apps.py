@@ -19,3 +19,6 @@ class BlogsConfig(AppConfig):
     default_auto_field: str = "django.db.models.BigAutoField"
     name: str = "core_apps.blogs"
     verbose_name: str = _("Blogs")
+
+    def ready(self) -> None:
+        from core_apps.blogs import signals  # noqa: F401
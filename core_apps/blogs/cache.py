@@ -0,0 +1,186 @@
+import hashlib
+from typing import Any, Dict, Iterable, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import QuerySet
+from rest_framework.request import Request
+from rest_framework.serializers import BaseSerializer
+
+from core_apps.common.cache import bump_versions_on_commit, get_versions, versioned_key
+
+# Blog columns fragment_cache_key and serialize_blogs read
+FRAGMENT_KEY_FIELDS = ["pkid", "id", "slug", "updated_at"]
+
+# Every cached blog list that isn't filtered by tag
+BLOG_LIST_NAMESPACE = "blogs:list"
+# Every cached blog list filtered by tag, bumped when tags are renamed
+TAG_LISTS_NAMESPACE = "blogs:tags"
+
+
+def blog_namespace(slug: str) -> str:
+    """Namespace of the entries cached for a single blog."""
+    return f"blogs:blog:{slug}"
+
+
+def tag_namespace(tag: str) -> str:
+    """Namespace of the blog lists filtered by a tag."""
+    return f"blogs:tag:{tag}"
+
+
+def list_cache_key(request: Request) -> str:
+    """
+    Build the cache key of a blog list response.
+
+    Lists filtered by tag only depend on the versions of those tags, so
+        activity on other blogs doesn't invalidate them; every other
+        list depends on the global list version.
+
+    Args:
+    - request (Request): The list request.
+
+    Returns:
+    - str: The cache key.
+    """
+    params = request.query_params
+    tags = params.get("tags")
+    if tags and set(params) <= {"tags", "cursor", "page_size", "ordering"}:
+        namespaces = [TAG_LISTS_NAMESPACE]
+        namespaces.extend(
+            tag_namespace(tag) for tag in tags.replace(" ", "").split(",")
+        )
+    else:
+        namespaces = [BLOG_LIST_NAMESPACE]
+    return versioned_key("blogs:list", namespaces, request.path, sorted(params.lists()))
+
+
+def detail_cache_key(slug: str, *parts: Any) -> str:
+    """
+    Build the cache key of a blog detail response.
+
+    Args:
+    - slug (str): The slug of the blog.
+    - parts (Any): Further values the response depends on, e.g. the
+        number of embedded comments.
+
+    Returns:
+    - str: The cache key.
+    """
+    return versioned_key("blogs:detail", [blog_namespace(slug)], slug, *parts)
+
+
+def blog_namespaces(blogs: QuerySet) -> List[str]:
+    """
+    Collect the namespaces cached entries of the given blogs live in.
+
+    Args:
+    - blogs (QuerySet): The blogs, read with a single query.
+
+    Returns:
+    - List[str]: The list namespace and the blog and tag namespaces
+        of each blog.
+    """
+    namespaces = [BLOG_LIST_NAMESPACE]
+    for slug, tag in blogs.values_list("slug", "tags__tag"):
+        namespaces.append(blog_namespace(slug))
+        if tag is not None:
+            namespaces.append(TAG_LISTS_NAMESPACE)
+            namespaces.append(tag_namespace(tag))
+    return namespaces
+
+
+def invalidate_blogs(blogs: QuerySet, extra_namespaces: Iterable[str] = ()) -> None:
+    """
+    Invalidate the cached entries of blogs once the transaction commits.
+
+    The namespaces are read now, while deleted rows still exist, and
+        bumped after the commit.
+
+    Args:
+    - blogs (QuerySet): The blogs that changed.
+    - extra_namespaces (Iterable[str]): Further namespaces to bump.
+    """
+    bump_versions_on_commit([*blog_namespaces(blogs), *extra_namespaces])
+
+
+def field_signature(serializer: BaseSerializer) -> str:
+    """
+    Fingerprint the fields a serializer outputs.
+
+    Args:
+    - serializer (BaseSerializer): The serializer for a single blog,
+        possibly pruned to a sparse fieldset.
+
+    Returns:
+    - str: A short digest of the serializer's field names.
+    """
+    return hashlib.md5(",".join(serializer.fields).encode()).hexdigest()[:12]
+
+
+def fragment_cache_key(blog: Any, version: int, signature: str = "") -> str:
+    """
+    Build the cache key of a serialized blog.
+
+    Args:
+    - blog (Blog): The blog; only id, slug and updated_at are read.
+    - version (int): The current version of the blog's namespace,
+        bumped by activity on the blog and changes to its author.
+    - signature (str): The field_signature of the serializer, so
+        each sparse fieldset is cached separately.
+
+    Returns:
+    - str: The cache key.
+    """
+    updated = blog.updated_at.timestamp()
+    return f"blogs:fragment:{blog.id}:{updated}:{version}:{signature}"
+
+
+def serialize_blogs(blogs: Iterable[Any], serializer: BaseSerializer) -> List[Dict]:
+    """
+    Serialize blogs, reusing cached representations where possible.
+
+    The versions of every blog's namespace and then the cached
+        fragments are read with one get_many each. Only the misses are
+        loaded, with the serializer's get_list_queryset() when it has
+        one so only what its fields read is fetched, and serialized;
+        they are stored back with one set_many, so the blogs passed in
+        only need FRAGMENT_KEY_FIELDS loaded.
+
+    Args:
+    - blogs (Iterable[Blog]): The blogs to serialize, in output order.
+    - serializer (BaseSerializer): The serializer for a single blog.
+
+    Returns:
+    - List[Dict]: The serialized blogs, skipping blogs deleted since
+        they were listed.
+    """
+    blogs = list(blogs)
+    if not blogs:
+        return []
+    signature = field_signature(serializer)
+    versions = get_versions(blog_namespace(blog.slug) for blog in blogs)
+    keys = {
+        blog.pkid: fragment_cache_key(
+            blog, versions[blog_namespace(blog.slug)], signature
+        )
+        for blog in blogs
+    }
+    fragments = cache.get_many(keys.values())
+
+    missing = [pkid for pkid, key in keys.items() if key not in fragments]
+    if missing:
+        if hasattr(serializer, "get_list_queryset"):
+            queryset = serializer.get_list_queryset()
+        else:
+            queryset = serializer.Meta.model.objects.for_list()
+        loaded = queryset.in_bulk(missing, field_name="pkid")
+        fresh = {
+            keys[pkid]: serializer.to_representation(blog)
+            for pkid, blog in loaded.items()
+        }
+        cache.set_many(fresh, settings.BLOG_CACHE_TIMEOUT)
+        fragments.update(fresh)
+
+    return [
+        fragments[keys[blog.pkid]] for blog in blogs if keys[blog.pkid] in fragments
+    ]
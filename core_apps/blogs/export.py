@@ -0,0 +1,161 @@
+import csv
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+
+from .models import Blog
+
+# Columns of an exported blog, in CSV order
+EXPORT_FIELDS = [
+    "id",
+    "title",
+    "slug",
+    "author",
+    "tags",
+    "description",
+    "body",
+    "banner_image",
+    "word_count",
+    "read_time",
+    "views",
+    "likes",
+    "dislikes",
+    "num_comments",
+    "num_ratings",
+    "average_rating",
+    "created_at",
+    "updated_at",
+]
+
+# Blogs fetched from the server-side cursor per round-trip, which is also
+# the batch their tags are prefetched for
+EXPORT_CHUNK_SIZE = 500
+
+
+def export_blogs(
+    updated_since: Optional[datetime] = None, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[List[Blog]]:
+    """
+    Iterate over blogs in batches for export.
+
+    Blogs are read with .iterator(), a server-side cursor on
+        PostgreSQL, so only chunk_size rows are held at a time; tags
+        are prefetched per batch since .iterator() skips
+        prefetch_related.
+
+    Args:
+    - updated_since (Optional[datetime]): Only export blogs updated at
+        or after this time.
+    - chunk_size (int): Number of blogs per batch.
+
+    Yields:
+    - List[Blog]: Batches of blogs with their author, stats and tags
+        loaded, in pkid order.
+    """
+    blogs = (
+        Blog.objects.select_related("author", "stats")
+        .defer("search_vector")
+        .order_by("pkid")
+    )
+    if updated_since is not None:
+        blogs = blogs.filter(updated_at__gte=updated_since)
+
+    # Streaming runs after the request's transaction has committed; a
+    # transaction of its own keeps PostgreSQL from materializing the
+    # whole result for a WITH HOLD cursor
+    with transaction.atomic():
+        batch: List[Blog] = []
+        for blog in blogs.iterator(chunk_size=chunk_size):
+            batch.append(blog)
+            if len(batch) == chunk_size:
+                prefetch_related_objects(batch, "tags")
+                yield batch
+                batch = []
+        if batch:
+            prefetch_related_objects(batch, "tags")
+            yield batch
+
+
+def blog_row(blog: Blog) -> Dict[str, Any]:
+    """
+    Flatten a blog into an export row.
+
+    Args:
+    - blog (Blog): The blog, with author, stats and tags loaded.
+
+    Returns:
+    - Dict[str, Any]: The EXPORT_FIELDS of the blog.
+    """
+    try:
+        stats = blog.stats
+    except ObjectDoesNotExist:
+        stats = None
+    return {
+        "id": str(blog.id),
+        "title": blog.title,
+        "slug": blog.slug,
+        "author": blog.author.username,
+        "tags": [tag.tag for tag in blog.tags.all()],
+        "description": blog.description,
+        "body": blog.body,
+        "banner_image": blog.banner_image.name,
+        "word_count": blog.word_count,
+        "read_time": blog.read_time,
+        "views": blog.views,
+        "likes": stats.likes_count if stats else 0,
+        "dislikes": stats.dislikes_count if stats else 0,
+        "num_comments": stats.comments_count if stats else 0,
+        "num_ratings": stats.ratings_count if stats else 0,
+        "average_rating": stats.average_rating if stats else 0,
+        "created_at": blog.created_at.isoformat(),
+        "updated_at": blog.updated_at.isoformat(),
+    }
+
+
+def stream_ndjson(batches: Iterator[List[Blog]]) -> Iterator[str]:
+    """
+    Render batches of blogs as newline delimited JSON.
+
+    Args:
+    - batches (Iterator[List[Blog]]): Batches from export_blogs.
+
+    Yields:
+    - str: One chunk of lines per batch.
+    """
+    for batch in batches:
+        yield "".join(json.dumps(blog_row(blog)) + "\n" for blog in batch)
+
+
+class _Echo:
+    """File-like object handing csv.writer's output straight back."""
+
+    def write(self, value: str) -> str:
+        """Return the written value instead of buffering it."""
+        return value
+
+
+def stream_csv(batches: Iterator[List[Blog]]) -> Iterator[str]:
+    """
+    Render batches of blogs as CSV with a header row.
+
+    Tags are joined with commas into a single column.
+
+    Args:
+    - batches (Iterator[List[Blog]]): Batches from export_blogs.
+
+    Yields:
+    - str: The header, then one chunk of rows per batch.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for batch in batches:
+        rows = []
+        for blog in batch:
+            row = blog_row(blog)
+            row["tags"] = ",".join(row["tags"])
+            rows.append(writer.writerow([row[field] for field in EXPORT_FIELDS]))
+        yield "".join(rows)
@@ -0,0 +1,291 @@
+import base64
+import binascii
+import json
+import logging
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from redis import Redis
+from redis.exceptions import RedisError
+from rest_framework.exceptions import NotFound
+
+from core_apps.blogs.models import Blog
+from core_apps.common.redis_client import get_redis
+from core_apps.profiles import graph
+from core_apps.profiles.models import Profile
+
+from .cache import FRAGMENT_KEY_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Sorted set of the blogs in a profile's home feed, scored by creation
+# time, formatted with the profile pkid
+TIMELINE_KEY = "feed:{pkid}"
+# Member every built timeline holds, scored 0 below every blog, so a
+# profile with an empty feed is told apart from one not built yet
+LOADED_MARKER = ""
+# Followers whose timelines are written per script by fan_out
+FAN_OUT_BATCH_SIZE = 1000
+
+# Add a blog (ARGV[2], scored ARGV[1]) to every timeline of KEYS that
+# is built, keeping the marker and the newest ARGV[3] blogs. Timelines
+# that aren't built, e.g. expired ones of inactive users, are left
+# alone and rebuilt from the database when next read.
+_ADD_IF_BUILT = """
+local added = 0
+for _, key in ipairs(KEYS) do
+    if redis.call("EXISTS", key) == 1 then
+        redis.call("ZADD", key, ARGV[1], ARGV[2])
+        redis.call("ZREMRANGEBYRANK", key, 1, -(tonumber(ARGV[3]) + 1))
+        added = added + 1
+    end
+end
+return added
+"""
+
+# A feed position, the (score, pkid) of the last blog seen
+Cursor = Tuple[float, int]
+
+
+def blog_score(created_at: datetime) -> float:
+    """Score of a blog in timelines, its creation time as a timestamp."""
+    return created_at.timestamp()
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Encode a feed position as an opaque token."""
+    payload = json.dumps(list(cursor), separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(encoded: str) -> Cursor:
+    """
+    Decode a token made by encode_cursor.
+
+    Raises:
+    - NotFound: If the token is malformed.
+    """
+    try:
+        padded = encoded + "=" * (-len(encoded) % 4)
+        score, pkid = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(score), int(pkid)
+    except (binascii.Error, ValueError, TypeError):
+        raise NotFound("Invalid cursor")
+
+
+def followed_authors(profile_pkid: int) -> Tuple[List[int], List[int]]:
+    """
+    Split the authors a profile follows by how their blogs reach it.
+
+    Args:
+    - profile_pkid (int): The pkid of the reading profile.
+
+    Returns:
+    - Tuple[List[int], List[int]]: The user pkids of the authors whose
+        blogs are fanned out to timelines, and of those with more than
+        FEED_FAN_OUT_LIMIT followers, whose blogs are read from the
+        database when the feed is.
+    """
+    pushed, pulled = [], []
+    authors = Profile.objects.filter(
+        pkid__in=graph.following_pkids(profile_pkid)
+    ).values_list("user_id", "followers_count")
+    for user_pkid, followers in authors:
+        if followers > settings.FEED_FAN_OUT_LIMIT:
+            pulled.append(user_pkid)
+        else:
+            pushed.append(user_pkid)
+    return pushed, pulled
+
+
+def _latest(author_pkids: List[int], cursor: Optional[Cursor], limit: int) -> Any:
+    """Query the (pkid, created_at) of authors' newest blogs after a cursor."""
+    blogs = Blog.objects.filter(author_id__in=author_pkids)
+    if cursor is not None:
+        created_at = datetime.fromtimestamp(cursor[0], tz=timezone.utc)
+        blogs = blogs.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, pkid__lt=cursor[1])
+        )
+    return blogs.order_by("-created_at", "-pkid").values_list("pkid", "created_at")[
+        :limit
+    ]
+
+
+def build_timeline(client: Redis, profile_pkid: int, author_pkids: List[int]) -> None:
+    """
+    Build a profile's timeline from the newest blogs of the authors.
+
+    Args:
+    - client (Redis): The Redis client.
+    - profile_pkid (int): The pkid of the reading profile.
+    - author_pkids (List[int]): User pkids of the fanned out authors
+        the profile follows.
+    """
+    key = TIMELINE_KEY.format(pkid=profile_pkid)
+    entries = {LOADED_MARKER: 0}
+    if author_pkids:
+        for pkid, created_at in _latest(author_pkids, None, settings.FEED_MAX_LENGTH):
+            entries[pkid] = blog_score(created_at)
+    pipeline = client.pipeline(transaction=True)
+    pipeline.delete(key)
+    pipeline.zadd(key, entries)
+    pipeline.expire(key, settings.FEED_TIMEOUT)
+    pipeline.execute()
+
+
+def _read_timeline(
+    client: Redis, profile_pkid: int, cursor: Optional[Cursor], limit: int
+) -> List[Cursor]:
+    """
+    Read up to limit timeline entries after a cursor, newest first.
+
+    Entries sharing the cursor's score are read separately and kept if
+        their pkid is lower, so equal timestamps never repeat or skip
+        a blog. Reading refreshes the timeline's expiry.
+    """
+    key = TIMELINE_KEY.format(pkid=profile_pkid)
+    pipeline = client.pipeline(transaction=False)
+    if cursor is None:
+        pipeline.zrevrangebyscore(key, "+inf", "(0", 0, limit, withscores=True)
+    else:
+        pipeline.zrangebyscore(key, cursor[0], cursor[0], withscores=True)
+        pipeline.zrevrangebyscore(
+            key, f"({cursor[0]!r}", "(0", 0, limit, withscores=True
+        )
+    pipeline.expire(key, settings.FEED_TIMEOUT)
+    *pages, _ = pipeline.execute()
+
+    entries = [(score, int(member)) for page in pages for member, score in page]
+    if cursor is not None:
+        entries = [entry for entry in entries if entry < cursor]
+    return sorted(entries, reverse=True)[:limit]
+
+
+def read_feed(
+    profile_pkid: int, cursor: Optional[Cursor], page_size: int
+) -> Tuple[List[Blog], Optional[Cursor]]:
+    """
+    Read a page of a profile's home feed, newest first.
+
+    Blogs of most authors come from the profile's timeline, built from
+        the database on first read and kept up to date by fan_out.
+        Blogs of authors with more than FEED_FAN_OUT_LIMIT followers
+        are queried when the feed is read and merged in. Without Redis
+        every blog is queried.
+
+    Args:
+    - profile_pkid (int): The pkid of the reading profile.
+    - cursor (Optional[Cursor]): The position to read from, None for
+        the newest blogs.
+    - page_size (int): Number of blogs to read.
+
+    Returns:
+    - Tuple[List[Blog], Optional[Cursor]]: The blogs, with only
+        FRAGMENT_KEY_FIELDS and created_at loaded, and the cursor of
+        the next page, None on the last one.
+    """
+    pushed, pulled = followed_authors(profile_pkid)
+    entries: List[Cursor] = []
+    try:
+        client = get_redis()
+        if not client.exists(TIMELINE_KEY.format(pkid=profile_pkid)):
+            build_timeline(client, profile_pkid, pushed)
+        entries = _read_timeline(client, profile_pkid, cursor, page_size + 1)
+    except RedisError as exc:
+        logger.warning(f"feed timeline unavailable: {exc}")
+        pulled += pushed
+    if pulled:
+        entries += [
+            (blog_score(created_at), pkid)
+            for pkid, created_at in _latest(pulled, cursor, page_size + 1)
+        ]
+    # An author who crossed FEED_FAN_OUT_LIMIT has blogs on both sides
+    entries = sorted(set(entries), reverse=True)[: page_size + 1]
+    next_cursor = entries[page_size - 1] if len(entries) > page_size else None
+    entries = entries[:page_size]
+
+    loaded = Blog.objects.only(*FRAGMENT_KEY_FIELDS, "created_at").in_bulk(
+        [pkid for _, pkid in entries], field_name="pkid"
+    )
+    deleted = [pkid for _, pkid in entries if pkid not in loaded]
+    if deleted:
+        forget_blogs(profile_pkid, deleted)
+    return [loaded[pkid] for _, pkid in entries if pkid in loaded], next_cursor
+
+
+def forget_blogs(profile_pkid: int, blog_pkids: Iterable[int]) -> None:
+    """
+    Remove blogs, e.g. deleted ones, from a profile's timeline.
+
+    Deleted blogs are not removed from every follower's timeline when
+        they are deleted; each reader drops them when it meets them.
+    """
+    try:
+        get_redis().zrem(TIMELINE_KEY.format(pkid=profile_pkid), *blog_pkids)
+    except RedisError as exc:
+        logger.warning(f"could not update feed timeline: {exc}")
+
+
+def forget_timelines(profile_pkids: Iterable[int]) -> None:
+    """
+    Drop timelines, to be rebuilt from the database when next read.
+
+    Args:
+    - profile_pkids (Iterable[int]): The pkids of the reading profiles.
+    """
+    keys = [TIMELINE_KEY.format(pkid=pkid) for pkid in profile_pkids]
+    if not keys:
+        return
+    try:
+        get_redis().delete(*keys)
+    except RedisError as exc:
+        logger.warning(f"could not drop feed timelines: {exc}")
+
+
+def fan_out(blog_pkid: int) -> int:
+    """
+    Add a new blog to the timelines of its author's followers.
+
+    Followers are read from the social graph and written in batches of
+        FAN_OUT_BATCH_SIZE, one script per batch. Blogs of authors with
+        more than FEED_FAN_OUT_LIMIT followers are skipped; read_feed
+        queries them instead.
+
+    Args:
+    - blog_pkid (int): The pkid of the created blog.
+
+    Returns:
+    - int: Number of timelines the blog was added to.
+    """
+    blog = Blog.objects.filter(pkid=blog_pkid).values("author_id", "created_at").first()
+    if blog is None:
+        return 0
+    author = (
+        Profile.objects.filter(user_id=blog["author_id"])
+        .values("pkid", "followers_count")
+        .first()
+    )
+    if author is None or author["followers_count"] > settings.FEED_FAN_OUT_LIMIT:
+        return 0
+
+    client = get_redis()
+    score = blog_score(blog["created_at"])
+    keys = [
+        TIMELINE_KEY.format(pkid=pkid)
+        for pkid in sorted(graph.follower_pkids(author["pkid"]))
+    ]
+    added = 0
+    while keys:
+        batch, keys = keys[:FAN_OUT_BATCH_SIZE], keys[FAN_OUT_BATCH_SIZE:]
+        added += client.eval(
+            _ADD_IF_BUILT,
+            len(batch),
+            *batch,
+            score,
+            blog_pkid,
+            settings.FEED_MAX_LENGTH,
+        )
+    return added
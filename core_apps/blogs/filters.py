@@ -3,6 +3,9 @@ from django.db.models import QuerySet
 
 from core_apps.blogs.models import Blog
 
+# ?match= modes of the text filters, with the lookup each one uses
+MATCH_LOOKUPS = {"contains": "icontains", "prefix": "istartswith"}
+
 
 class BlogFilter(filters.FilterSet):
     """
@@ -11,18 +14,29 @@ class BlogFilter(filters.FilterSet):
     This filter set provides filters for querying blog
         articles based on various criteria.
 
+    The text filters match anywhere in the value by default, served by
+        pg_trgm GIN indexes, or only at its start with ?match=prefix,
+        served by text_pattern_ops btree indexes (see the blogs and
+        users migrations).
+
     Attributes:
     - author: Filter for filtering by author's first name.
+    - author_username: Filter for filtering by author's username.
     - title: Filter for filtering by title.
+    - match: How the text filters match, "contains" or "prefix".
     - tags: Filter for filtering by tags associated with the blog.
     - created_at: Filter for filtering by creation date.
     - updated_at: Filter for filtering by last update date.
     """
 
-    author = filters.CharFilter(
-        field_name="author__first_name", lookup_expr="icontains"
+    author = filters.CharFilter(field_name="author__first_name", method="filter_text")
+    author_username = filters.CharFilter(
+        field_name="author__username", method="filter_text"
+    )
+    title = filters.CharFilter(field_name="title", method="filter_text")
+    match = filters.ChoiceFilter(
+        choices=[(mode, mode) for mode in MATCH_LOOKUPS], method="filter_match"
     )
-    title = filters.CharFilter(field_name="title", lookup_expr="icontains")
     tags = filters.CharFilter(
         field_name="tags", method="get_blog_tags", lookup_expr="iexact"
     )
@@ -33,7 +47,44 @@ class BlogFilter(filters.FilterSet):
         """Meta class for BlogFilter."""
 
         model = Blog
-        fields = ["author", "title", "tags", "created_at", "updated_at"]
+        fields = [
+            "author",
+            "author_username",
+            "title",
+            "match",
+            "tags",
+            "created_at",
+            "updated_at",
+        ]
+
+    def filter_text(self, queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """
+        Filter a text field with the lookup of the requested match mode.
+
+        Args:
+        - queryset (QuerySet): The queryset to filter.
+        - name (str): The field to filter.
+        - value (str): Value to filter by.
+
+        Returns:
+        - QuerySet: Filtered queryset.
+        """
+        mode = self.form.cleaned_data.get("match") or "contains"
+        return queryset.filter(**{f"{name}__{MATCH_LOOKUPS[mode]}": value})
+
+    def filter_match(self, queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """
+        Leave the queryset alone; the match mode is read by filter_text.
+
+        Args:
+        - queryset (QuerySet): The queryset to filter.
+        - name (str): Name of the match field.
+        - value (str): The match mode.
+
+        Returns:
+        - QuerySet: The queryset unchanged.
+        """
+        return queryset
 
     def get_blog_tags(self, queryset: QuerySet, tags: str, value: str) -> QuerySet:
         """
@@ -0,0 +1,34 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core_apps.blogs.models import Blog
+
+
+class Command(BaseCommand):
+    """
+    Management command to backfill the stored blog read times.
+
+    Recomputes word_count and read_time for every blog, e.g. for rows
+        written before the columns existed.
+    """
+
+    help = "Recompute the stored word count and read time of every blog"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command line arguments."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of blogs recomputed per batch",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Backfill the read times and report how many blogs were updated."""
+        updated = Blog.objects.all().refresh_read_times(
+            batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated read time for {updated} blog(s)")
+        )
@@ -0,0 +1,30 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core_apps.blogs.models import BlogStats
+
+
+class Command(BaseCommand):
+    """
+    Management command to rebuild the denormalized blog counters.
+
+    Recomputes every BlogStats row from the reaction, rating, comment
+        and favorite tables, creating rows for blogs that don't have one.
+    """
+
+    help = "Rebuild BlogStats counters from the source tables"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command line arguments."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of blogs recomputed per transaction",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Rebuild the counters and report how many rows were written."""
+        written = BlogStats.objects.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {written} blog(s)"))
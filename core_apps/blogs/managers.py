@@ -0,0 +1,480 @@
+import re
+import uuid
+from typing import Any, Collection, Iterable, List, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections, models, router, transaction
+from django.db.models import (
+    Avg,
+    Count,
+    F,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Prefetch,
+    Subquery,
+    Sum,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .read_time_engine import batch_read_times
+
+# Counter columns on BlogStats, as annotated by BlogQuerySet.with_counts
+STATS_COUNTER_FIELDS = [
+    "likes_count",
+    "dislikes_count",
+    "comments_count",
+    "favorites_count",
+    "ratings_count",
+    "ratings_sum",
+]
+
+# Possible Rating.value choices, one histogram bucket each
+RATING_VALUES = range(1, 6)
+
+# Related data BlogQuerySet.for_list can load up front
+LIST_RELATIONS = ("author", "stats", "tags", "ratings", "rating_stats")
+
+
+class BlogQuerySet(models.QuerySet):
+    """
+    Custom queryset for the Blog model.
+
+    This queryset builds the select_related/prefetch_related and
+        annotation pipeline needed to serialize blogs without issuing
+        per-row queries.
+
+    Methods:
+    - with_counts: Annotate reaction, rating, comment and favorite
+        aggregates computed from the source tables.
+    - with_rating_stats: Annotate rating average, count and histogram.
+    - for_list: Queryset used by the blog list and detail views.
+    - refresh_read_times: Recompute the stored word count and read time.
+    - search: Full-text search ranked with ts_rank (PostgreSQL only).
+    - refresh_search_vectors: Recompute the stored search vectors
+        (PostgreSQL only).
+    """
+
+    def _related_subquery(
+        self, related_name: str, aggregate: Any, output_field: Any, **filters: Any
+    ) -> Subquery:
+        """
+        Build a correlated subquery aggregating a reverse relation of Blog.
+
+        A subquery is used rather than a join so that several aggregates
+            over different relations don't multiply each other's rows.
+
+        Args:
+        - related_name (str): The reverse accessor on Blog (e.g. "comments").
+        - aggregate (Any): The aggregate expression to compute.
+        - output_field (Any): The output field of the subquery.
+        - filters (Any): Extra filters applied to the related rows.
+
+        Returns:
+        - Subquery: The correlated subquery.
+        """
+        relation = self.model._meta.get_field(related_name)
+        related_rows = (
+            relation.related_model._default_manager.filter(
+                **{relation.field.name: OuterRef("pkid")}, **filters
+            )
+            .order_by()
+            .values(relation.field.name)
+            .annotate(result=aggregate)
+            .values("result")
+        )
+        return Subquery(related_rows, output_field=output_field)
+
+    def with_counts(self) -> "BlogQuerySet":
+        """
+        Annotate each blog with aggregates computed from the source tables.
+
+        This is what BlogStats is rebuilt from; request paths read the
+            denormalized BlogStats row instead.
+
+        Returns:
+        - BlogQuerySet: Queryset annotated with likes_count, dislikes_count,
+            comments_count, favorites_count, ratings_count and ratings_sum.
+        """
+        return self.annotate(
+            likes_count=Coalesce(
+                self._related_subquery(
+                    "blog_reactions", Count("pkid"), IntegerField(), reaction__gt=0
+                ),
+                0,
+            ),
+            dislikes_count=Coalesce(
+                self._related_subquery(
+                    "blog_reactions", Count("pkid"), IntegerField(), reaction__lt=0
+                ),
+                0,
+            ),
+            comments_count=Coalesce(
+                self._related_subquery("comments", Count("pkid"), IntegerField()), 0
+            ),
+            favorites_count=Coalesce(
+                self._related_subquery("blog_favorites", Count("pkid"), IntegerField()),
+                0,
+            ),
+            ratings_count=Coalesce(
+                self._related_subquery("blog_ratings", Count("pkid"), IntegerField()),
+                0,
+            ),
+            ratings_sum=Coalesce(
+                self._related_subquery("blog_ratings", Sum("value"), IntegerField()),
+                0,
+            ),
+        )
+
+    def with_rating_stats(self) -> "BlogQuerySet":
+        """
+        Annotate each blog with its rating average, count and histogram.
+
+        Every aggregate is a subquery on the blog's own ratings, answered
+            from the (blog, value) index on Rating, so the cost depends on
+            the blog's ratings only and not on the size of the table.
+
+        Returns:
+        - BlogQuerySet: Queryset annotated with rating_average,
+            rating_count and rating_1 to rating_5.
+        """
+        histogram = {
+            f"rating_{value}": Coalesce(
+                self._related_subquery(
+                    "blog_ratings", Count("pkid"), IntegerField(), value=value
+                ),
+                0,
+            )
+            for value in RATING_VALUES
+        }
+        return self.annotate(
+            rating_average=self._related_subquery(
+                "blog_ratings", Avg("value"), FloatField()
+            ),
+            rating_count=Coalesce(
+                self._related_subquery("blog_ratings", Count("pkid"), IntegerField()),
+                0,
+            ),
+            **histogram,
+        )
+
+    def for_list(
+        self,
+        relations: Optional[Collection[str]] = None,
+        defer: Iterable[str] = (),
+    ) -> "BlogQuerySet":
+        """
+        Queryset carrying everything BlogSerializer reads.
+
+        Args:
+        - relations (Optional[Collection[str]]): The LIST_RELATIONS to
+            load, e.g. only those the requested fields read. All of
+            them when None.
+        - defer (Iterable[str]): Columns left unloaded, e.g. the body
+            when it isn't serialized.
+
+        Returns:
+        - BlogQuerySet: Queryset with author, profile, counters, tags
+            and ratings loaded up front and rating stats annotated.
+            Comments are not loaded; they are embedded on request by
+            the list serializer or paged through separately.
+        """
+        if relations is None:
+            relations = LIST_RELATIONS
+        # The search vector is only read by the database
+        queryset = self.defer("search_vector", *defer)
+
+        select_related = []
+        if "author" in relations:
+            select_related.extend(["author", "author__profile"])
+        if "stats" in relations:
+            select_related.append("stats")
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if "tags" in relations:
+            queryset = queryset.prefetch_related("tags")
+        if "ratings" in relations:
+            ratings = self.model._meta.get_field("blog_ratings").related_model
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "blog_ratings",
+                    queryset=ratings.objects.select_related("rated_by"),
+                )
+            )
+        if "rating_stats" in relations:
+            queryset = queryset.with_rating_stats()
+        return queryset
+
+    def refresh_read_times(self, batch_size: int = 500) -> int:
+        """
+        Recompute the stored word count and read time of the blogs.
+
+        Blogs are loaded in pkid order, batch_size at a time with their
+            tags prefetched, and written back with bulk_update.
+
+        Args:
+        - batch_size (int): Number of blogs recomputed per batch.
+
+        Returns:
+        - int: Number of blogs updated.
+        """
+        blogs = (
+            self.order_by("pkid")
+            .only("pkid", "title", "description", "body", "banner_image")
+            .prefetch_related("tags")
+        )
+        updated = 0
+        last_pkid = 0
+        while True:
+            batch = list(blogs.filter(pkid__gt=last_pkid)[:batch_size])
+            if not batch:
+                return updated
+            last_pkid = batch[-1].pkid
+            read_times = batch_read_times(batch)
+            for blog in batch:
+                blog.word_count, blog.read_time = read_times[blog.pkid]
+            self.model.objects.bulk_update(batch, ["word_count", "read_time"])
+            updated += len(batch)
+
+    def search(self, query: str) -> "BlogQuerySet":
+        """
+        Search blogs by prefix of every word in the query.
+
+        Words are matched as tsquery prefixes, like the autocomplete
+            field of the haystack index, against the GIN indexed
+            search_vector, and hits are ordered by ts_rank.
+
+        Args:
+        - query (str): The search text.
+
+        Returns:
+        - BlogQuerySet: Matching blogs annotated with their rank, best
+            first; every blog, newest first, when the query has no
+            words.
+        """
+        words = re.findall(r"\w+", query)
+        if not words:
+            return self.order_by("-created_at", "-pkid")
+        tsquery = SearchQuery(
+            " & ".join(f"{word}:*" for word in words),
+            search_type="raw",
+            config=settings.SEARCH_POSTGRES_CONFIG,
+        )
+        return (
+            self.filter(search_vector=tsquery)
+            .annotate(rank=SearchRank(F("search_vector"), tsquery))
+            .order_by("-rank", "-pkid")
+        )
+
+    def refresh_search_vectors(self) -> int:
+        """
+        Recompute the stored search vectors of the blogs in one UPDATE.
+
+        The title weighs most, then the description, author and tags,
+            then the body; the author's username and the tag names are
+            read with correlated subqueries.
+
+        Returns:
+        - int: Number of blogs updated.
+        """
+        username = Subquery(
+            get_user_model()
+            .objects.filter(pkid=OuterRef("author_id"))
+            .values("username")[:1]
+        )
+        tag_names = Subquery(
+            self.model.tags.through.objects.filter(blog_id=OuterRef("pkid"))
+            .values("blog_id")
+            .annotate(names=StringAgg("tag__tag", " "))
+            .values("names")
+        )
+        config = settings.SEARCH_POSTGRES_CONFIG
+        return self.order_by().update(
+            search_vector=SearchVector("title", weight="A", config=config)
+            + SearchVector(
+                "description", username, tag_names, weight="B", config=config
+            )
+            + SearchVector("body", weight="C", config=config)
+        )
+
+
+class BlogStatsManager(models.Manager):
+    """
+    Custom manager for the BlogStats model.
+
+    Methods:
+    - increment: Atomically apply counter deltas to a blog's stats row.
+    - rebuild: Recompute stats rows from the source tables.
+    """
+
+    def increment(self, blog: Any, **deltas: int) -> None:
+        """
+        Atomically apply counter deltas to a blog's stats row.
+
+        The update is a single UPDATE with F() expressions so concurrent
+            writers don't lose each other's changes. A missing row is
+            rebuilt from the source tables instead.
+
+        Args:
+        - blog (Blog): The blog whose counters changed.
+        - deltas (int): Counter field names mapped to the amount to add,
+            e.g. likes_count=1, dislikes_count=-1.
+        """
+        updated = self.filter(blog=blog).update(
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+        if not updated:
+            self.rebuild(blog_ids=[blog.pkid])
+
+    def rebuild(
+        self, blog_ids: Optional[Iterable[int]] = None, batch_size: int = 500
+    ) -> int:
+        """
+        Recompute stats rows from the source tables.
+
+        Args:
+        - blog_ids (Optional[Iterable[int]]): Restrict the rebuild to these
+            blog pkids. All blogs are rebuilt when omitted.
+        - batch_size (int): Number of blogs recomputed per batch.
+
+        Returns:
+        - int: Number of stats rows written.
+        """
+        blog_model = self.model._meta.get_field("blog").related_model
+        blogs = blog_model.objects.order_by("pkid")
+        if blog_ids is not None:
+            blogs = blogs.filter(pkid__in=list(blog_ids))
+
+        written = 0
+        last_pkid = 0
+        while True:
+            batch = list(
+                blogs.filter(pkid__gt=last_pkid)
+                .with_counts()
+                .values("pkid", *STATS_COUNTER_FIELDS)[:batch_size]
+            )
+            if not batch:
+                return written
+            last_pkid = batch[-1]["pkid"]
+
+            with transaction.atomic():
+                existing = {
+                    stats.blog_id: stats
+                    for stats in self.select_for_update().filter(
+                        blog_id__in=[row["pkid"] for row in batch]
+                    )
+                }
+                to_create = []
+                for row in batch:
+                    counters = {field: row[field] for field in STATS_COUNTER_FIELDS}
+                    stats = existing.get(row["pkid"])
+                    if stats is None:
+                        to_create.append(self.model(blog_id=row["pkid"], **counters))
+                    else:
+                        for field, value in counters.items():
+                            setattr(stats, field, value)
+                self.bulk_update(existing.values(), STATS_COUNTER_FIELDS)
+                self.bulk_create(to_create)
+            written += len(batch)
+
+
+class BlogViewsManager(models.Manager):
+    """
+    Custom manager for the BlogViews model.
+
+    Methods:
+    - record: Record a single view, reporting whether it was new.
+    - record_many: Record several views of a blog in one statement.
+    """
+
+    # Database vendors supporting INSERT ... ON CONFLICT DO NOTHING RETURNING
+    UPSERT_VENDORS = ("postgresql", "sqlite")
+
+    def record(self, blog_pkid: int, ip: str) -> bool:
+        """
+        Record a view of a blog by an IP address.
+
+        Args:
+        - blog_pkid (int): The pkid of the viewed blog.
+        - ip (str): The IP address of the viewer.
+
+        Returns:
+        - bool: True if this is the first view of the blog from the IP.
+        """
+        return bool(self.record_many(blog_pkid, [ip]))
+
+    def record_many(
+        self, blog_pkid: int, ips: Iterable[str], batch_size: int = 500
+    ) -> List[str]:
+        """
+        Record views of a blog, skipping IPs that already viewed it.
+
+        Relies on the unique (blog, ip) constraint: rows are inserted with
+            ON CONFLICT DO NOTHING and the inserted IPs read back with
+            RETURNING, so there is no check-then-insert race and each
+            batch is a single round-trip.
+
+        Args:
+        - blog_pkid (int): The pkid of the viewed blog.
+        - ips (Iterable[str]): The viewer IP addresses.
+        - batch_size (int): Number of rows inserted per statement.
+
+        Returns:
+        - List[str]: The IPs that were newly recorded.
+        """
+        ips = list(dict.fromkeys(ips))
+        connection = connections[router.db_for_write(self.model)]
+        if connection.vendor not in self.UPSERT_VENDORS:
+            return self._record_many_fallback(blog_pkid, ips)
+
+        opts = self.model._meta
+        fields = [
+            opts.get_field(name)
+            for name in ("id", "created_at", "updated_at", "ip", "blog")
+        ]
+        qn = connection.ops.quote_name
+        columns = ", ".join(qn(field.column) for field in fields)
+        ip_column, blog_column = (qn(field.column) for field in fields[3:])
+        now = timezone.now()
+
+        inserted = []
+        with connection.cursor() as cursor:
+            for start in range(0, len(ips), batch_size):
+                end = start + batch_size
+                batch = ips[start:end]
+                params = []
+                for ip in batch:
+                    values = (uuid.uuid4(), now, now, ip, blog_pkid)
+                    params.extend(
+                        field.get_db_prep_value(value, connection)
+                        for field, value in zip(fields, values)
+                    )
+                placeholders = ", ".join(
+                    ["(" + ", ".join(["%s"] * len(fields)) + ")"] * len(batch)
+                )
+                cursor.execute(
+                    f"INSERT INTO {qn(opts.db_table)} ({columns}) "
+                    f"VALUES {placeholders} "
+                    f"ON CONFLICT ({blog_column}, {ip_column}) DO NOTHING "
+                    f"RETURNING {ip_column}",
+                    params,
+                )
+                inserted.extend(row[0] for row in cursor.fetchall())
+        return inserted
+
+    def _record_many_fallback(self, blog_pkid: int, ips: List[str]) -> List[str]:
+        """Check-then-insert for databases without ON CONFLICT support."""
+        with transaction.atomic(using=router.db_for_write(self.model)):
+            seen = set(
+                self.filter(blog_id=blog_pkid, ip__in=ips).values_list("ip", flat=True)
+            )
+            new_ips = [ip for ip in ips if ip not in seen]
+            self.bulk_create(
+                [self.model(blog_id=blog_pkid, ip=ip) for ip in new_ips],
+                ignore_conflicts=True,
+            )
+        return new_ips
@@ -0,0 +1,77 @@
+# Generated by Django 3.2.11 on 2026-10-18 00:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def populate_blog_stats(apps, schema_editor):
+    """Create a stats row for every existing blog from the source tables."""
+    Blog = apps.get_model("blogs", "Blog")
+    BlogStats = apps.get_model("blogs", "BlogStats")
+    Reaction = apps.get_model("reactions", "Reaction")
+    Comment = apps.get_model("comments", "Comment")
+    Favorite = apps.get_model("favorites", "Favorite")
+    Rating = apps.get_model("ratings", "Rating")
+
+    def per_blog(queryset, aggregate):
+        rows = queryset.order_by().values("blog").annotate(result=aggregate)
+        return {row["blog"]: row["result"] for row in rows}
+
+    likes = per_blog(Reaction.objects.filter(reaction__gt=0), models.Count("pkid"))
+    dislikes = per_blog(Reaction.objects.filter(reaction__lt=0), models.Count("pkid"))
+    comments = per_blog(Comment.objects.all(), models.Count("pkid"))
+    favorites = per_blog(Favorite.objects.all(), models.Count("pkid"))
+    ratings_count = per_blog(Rating.objects.all(), models.Count("pkid"))
+    ratings_sum = per_blog(Rating.objects.all(), models.Sum("value"))
+
+    BlogStats.objects.bulk_create(
+        (
+            BlogStats(
+                blog_id=pkid,
+                likes_count=likes.get(pkid, 0),
+                dislikes_count=dislikes.get(pkid, 0),
+                comments_count=comments.get(pkid, 0),
+                favorites_count=favorites.get(pkid, 0),
+                ratings_count=ratings_count.get(pkid, 0),
+                ratings_sum=ratings_sum.get(pkid, 0),
+            )
+            for pkid in Blog.objects.values_list("pkid", flat=True).iterator()
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0001_initial'),
+        ('comments', '0001_initial'),
+        ('favorites', '0002_rename_article_favorite_blog'),
+        ('ratings', '0001_initial'),
+        ('reactions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlogStats',
+            fields=[
+                ('pkid', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('likes_count', models.IntegerField(default=0, verbose_name='likes')),
+                ('dislikes_count', models.IntegerField(default=0, verbose_name='dislikes')),
+                ('comments_count', models.IntegerField(default=0, verbose_name='comments')),
+                ('favorites_count', models.IntegerField(default=0, verbose_name='favorites')),
+                ('ratings_count', models.IntegerField(default=0, verbose_name='ratings')),
+                ('ratings_sum', models.IntegerField(default=0, verbose_name='sum of ratings')),
+                ('blog', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='blogs.blog')),
+            ],
+            options={
+                'verbose_name': 'Blog stats',
+                'verbose_name_plural': 'Blog stats',
+            },
+        ),
+        migrations.RunPython(populate_blog_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 3.2.11 on 2026-10-18 00:13
+
+from django.db import migrations, models, transaction
+
+CONSTRAINT_NAME = "unique_blog_view_ip"
+
+# Number of pkids scanned per deduplication transaction
+BATCH_SIZE = 10000
+
+
+def deduplicate_blog_views(apps, schema_editor):
+    """
+    Delete repeated (blog, ip) views, keeping the earliest row.
+
+    Works through the table in pkid windows, each in its own short
+        transaction, so no lock is held on the table for the whole run.
+    """
+    BlogViews = apps.get_model("blogs", "BlogViews")
+    db_alias = schema_editor.connection.alias
+    views = BlogViews.objects.using(db_alias)
+    last_pkid = views.aggregate(last=models.Max("pkid"))["last"] or 0
+
+    earlier_view = views.filter(
+        blog_id=models.OuterRef("blog_id"),
+        ip=models.OuterRef("ip"),
+        pkid__lt=models.OuterRef("pkid"),
+    )
+    for start in range(0, last_pkid + 1, BATCH_SIZE):
+        with transaction.atomic(using=db_alias):
+            views.filter(
+                pkid__gte=start,
+                pkid__lt=start + BATCH_SIZE,
+            ).filter(models.Exists(earlier_view)).delete()
+
+
+def add_unique_constraint(apps, schema_editor):
+    """
+    Add the (blog, ip) unique constraint.
+
+    On PostgreSQL the backing index is built CONCURRENTLY and then
+        attached to the constraint, so writes to the table are not
+        blocked while the index builds. A concurrent build that fails,
+        e.g. on a duplicate inserted after deduplication, leaves an
+        INVALID index behind, which is dropped so a rerun builds it
+        again. Other databases get a plain unique index.
+    """
+    BlogViews = apps.get_model("blogs", "BlogViews")
+    table = schema_editor.quote_name(BlogViews._meta.db_table)
+    name = schema_editor.quote_name(CONSTRAINT_NAME)
+    if schema_editor.connection.vendor != "postgresql":
+        schema_editor.execute(f'CREATE UNIQUE INDEX {name} ON {table} ("blog_id", "ip")')
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)",
+            [CONSTRAINT_NAME],
+        )
+        index = cursor.fetchone()
+    if index is not None and not index[0]:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY {name}")
+    schema_editor.execute(
+        f'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ("blog_id", "ip")'
+    )
+    schema_editor.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE USING INDEX {name}"
+    )
+
+
+def remove_unique_constraint(apps, schema_editor):
+    """Drop the (blog, ip) unique constraint."""
+    BlogViews = apps.get_model("blogs", "BlogViews")
+    table = schema_editor.quote_name(BlogViews._meta.db_table)
+    name = schema_editor.quote_name(CONSTRAINT_NAME)
+    if schema_editor.connection.vendor != "postgresql":
+        schema_editor.execute(f"DROP INDEX {name}")
+        return
+
+    schema_editor.execute(f"ALTER TABLE {table} DROP CONSTRAINT {name}")
+
+
+class Migration(migrations.Migration):
+
+    # Deduplication batches and CREATE INDEX CONCURRENTLY need autocommit
+    atomic = False
+
+    dependencies = [
+        ('blogs', '0002_blogstats'),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate_blog_views, migrations.RunPython.noop),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(add_unique_constraint, remove_unique_constraint),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='blogviews',
+                    constraint=models.UniqueConstraint(fields=('blog', 'ip'), name='unique_blog_view_ip'),
+                ),
+            ],
+        ),
+    ]
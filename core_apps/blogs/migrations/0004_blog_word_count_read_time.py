@@ -0,0 +1,23 @@
+# Generated by Django 3.2.11 on 2026-10-18 00:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0003_blogviews_unique_blog_ip'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blog',
+            name='read_time',
+            field=models.CharField(blank=True, default='', editable=False, max_length=32, verbose_name='read time'),
+        ),
+        migrations.AddField(
+            model_name='blog',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='word count'),
+        ),
+    ]
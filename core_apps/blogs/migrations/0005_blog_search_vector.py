@@ -0,0 +1,61 @@
+# Generated by Django 3.2.11 on 2026-10-18 00:42
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+INDEX_NAME = "blog_search_vector_gin"
+
+
+def add_search_index(apps, schema_editor):
+    """
+    Build the GIN index on search_vector.
+
+    Only PostgreSQL has tsvector columns to index; the index is built
+        CONCURRENTLY so writes to the blog table aren't blocked.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Blog = apps.get_model("blogs", "Blog")
+    table = schema_editor.quote_name(Blog._meta.db_table)
+    name = schema_editor.quote_name(INDEX_NAME)
+    schema_editor.execute(
+        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} USING gin ("search_vector")'
+    )
+
+
+def remove_search_index(apps, schema_editor):
+    """Drop the GIN index on search_vector."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    name = schema_editor.quote_name(INDEX_NAME)
+    schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY needs autocommit
+    atomic = False
+
+    dependencies = [
+        ('blogs', '0004_blog_word_count_read_time'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blog',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(add_search_index, remove_search_index),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='blog',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='blog_search_vector_gin'),
+                ),
+            ],
+        ),
+    ]
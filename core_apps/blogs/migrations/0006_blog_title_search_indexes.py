@@ -0,0 +1,55 @@
+# Generated by Django 3.2.11 on 2026-10-18 01:05
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Indexes on the expression icontains/istartswith filter title with,
+# UPPER("title"::text): trigram GIN for substring matches and
+# text_pattern_ops btree for prefix matches
+INDEXES = {
+    "blog_title_upper_trgm": 'USING gin (UPPER("title"::text) gin_trgm_ops)',
+    "blog_title_upper_prefix": '(UPPER("title"::text) text_pattern_ops)',
+}
+
+
+def add_title_indexes(apps, schema_editor):
+    """
+    Build the title search indexes CONCURRENTLY on PostgreSQL.
+
+    Other databases don't have pg_trgm or operator classes, so they
+        keep scanning the table.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Blog = apps.get_model("blogs", "Blog")
+    table = schema_editor.quote_name(Blog._meta.db_table)
+    for name, definition in INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {schema_editor.quote_name(name)} "
+            f"ON {table} {definition}"
+        )
+
+
+def remove_title_indexes(apps, schema_editor):
+    """Drop the title search indexes."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in INDEXES:
+        schema_editor.execute(
+            f"DROP INDEX CONCURRENTLY IF EXISTS {schema_editor.quote_name(name)}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY needs autocommit
+    atomic = False
+
+    dependencies = [
+        ('blogs', '0005_blog_search_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(add_title_indexes, remove_title_indexes),
+    ]
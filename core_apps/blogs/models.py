@@ -1,14 +1,21 @@
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from autoslug import AutoSlugField
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from django.db.models import Avg
+from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 
 from core_apps.common.models import TimeStampedUUIDModel
-from core_apps.ratings.models import Rating
 
+from .managers import (
+    RATING_VALUES,
+    BlogQuerySet,
+    BlogStatsManager,
+    BlogViewsManager,
+)
 from .read_time_engine import BlogReadTimeEngine
 
 User = get_user_model()
@@ -53,8 +60,17 @@ class Blog(TimeStampedUUIDModel):
     - banner_image (str): The URL of the banner image for the blog.
     - tags (QuerySet): The tags associated with the blog.
     - views (int): The number of views the blog has received.
+    - word_count (int): The number of words in the blog, stored on save.
+    - read_time (str): The estimated read time, stored on save.
+    - search_vector (SearchVectorField): Weighted tsvector of the blog,
+        maintained by the search index queue when the postgres search
+        backend is used.
+    - objects (BlogQuerySet): Custom manager for the Blog model.
     """
 
+    # Fields the stored word count and read time are computed from
+    READ_TIME_SOURCE_FIELDS = {"title", "description", "body", "banner_image"}
+
     author = models.ForeignKey(
         User, on_delete=models.CASCADE, verbose_name=_("user"), related_name="blogs"
     )
@@ -67,6 +83,32 @@ class Blog(TimeStampedUUIDModel):
     )
     tags = models.ManyToManyField(Tag, related_name="blogs")
     views = models.IntegerField(verbose_name=_("blog views"), default=0)
+    word_count = models.PositiveIntegerField(
+        verbose_name=_("word count"), default=0, editable=False
+    )
+    read_time = models.CharField(
+        verbose_name=_("read time"),
+        max_length=32,
+        blank=True,
+        default="",
+        editable=False,
+    )
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = BlogQuerySet.as_manager()
+
+    class Meta(TimeStampedUUIDModel.Meta):
+        """
+        Metadata options for the Blog model.
+
+        Attributes:
+        - indexes (list): GIN index serving full-text search on
+            search_vector.
+        """
+
+        indexes: List[models.Index] = [
+            GinIndex(fields=["search_vector"], name="blog_search_vector_gin"),
+        ]
 
     def __str__(self):
         """String representation of the blog."""
@@ -78,17 +120,113 @@ class Blog(TimeStampedUUIDModel):
         tags = [tag.tag for tag in self.tags.all()]
         return tags
 
-    @property
-    def blog_read_time(self) -> int:
-        """Calculate the estimated reading time of the blog."""
-        time_to_read = BlogReadTimeEngine(self)
-        return time_to_read.get_read_time()
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Save the blog, refreshing the stored word count and read time.
+
+        Tags are only counted once the blog has a primary key; adding or
+            removing tags refreshes the stored values through the
+            m2m_changed signal.
+        """
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.set_read_time(tags=self.list_of_tags if self.pkid else [])
+        elif self.READ_TIME_SOURCE_FIELDS.intersection(update_fields):
+            self.set_read_time()
+            kwargs["update_fields"] = {*update_fields, "word_count", "read_time"}
+        super().save(*args, **kwargs)
+
+    def set_read_time(self, tags: Optional[List[str]] = None) -> None:
+        """
+        Recompute word_count and read_time from the blog's content.
+
+        Args:
+        - tags (Optional[List[str]]): The blog's tag names. Read from
+            the database when omitted.
+        """
+        engine = BlogReadTimeEngine(self, tags=tags)
+        self.word_count = engine.get_word_count()
+        self.read_time = engine.get_read_time() or ""
 
     def get_average_rating(self) -> Union[float, int]:
-        """Calculate the average rating of the blog."""
-        if Rating.objects.all().count() > 0:
-            rating = Rating.objects.filter(blog=self.pkid).all().aggregate(Avg("value"))
-            return round(rating["value__avg"], 1) if rating["value__avg"] else 0
+        """
+        Get the average rating of the blog.
+
+        Reads the rating_average annotation from
+            BlogQuerySet.with_rating_stats when present, otherwise the
+            value cached on the blog's stats row.
+        """
+        if hasattr(self, "rating_average"):
+            average = self.rating_average
+            return round(average, 1) if average else 0
+        return self.stats.average_rating
+
+    def get_rating_histogram(self) -> Dict[int, int]:
+        """
+        Get the number of ratings given for each rating value.
+
+        Reads the rating_1 to rating_5 annotations from
+            BlogQuerySet.with_rating_stats when present, otherwise runs
+            a single grouped query over the blog's ratings.
+        """
+        if hasattr(self, "rating_1"):
+            return {value: getattr(self, f"rating_{value}") for value in RATING_VALUES}
+
+        histogram = dict.fromkeys(RATING_VALUES, 0)
+        counts = (
+            self.blog_ratings.order_by()
+            .values("value")
+            .annotate(count=Count("pkid"))
+            .values_list("value", "count")
+        )
+        histogram.update(counts)
+        return histogram
+
+
+class BlogStats(TimeStampedUUIDModel):
+    """
+    Model holding denormalized counters for a blog.
+
+    One row exists per blog. The counters are kept up to date by the
+        reaction, rating, comment and favorite views so that rendering
+        a blog reads columns instead of counting related rows.
+
+    Attributes:
+    - blog (Blog): The blog the counters belong to.
+    - likes_count (int): Number of likes.
+    - dislikes_count (int): Number of dislikes.
+    - comments_count (int): Number of comments.
+    - favorites_count (int): Number of times the blog was favorited.
+    - ratings_count (int): Number of ratings.
+    - ratings_sum (int): Sum of all rating values.
+    - objects (BlogStatsManager): Custom manager for the BlogStats model.
+    """
+
+    blog = models.OneToOneField(Blog, related_name="stats", on_delete=models.CASCADE)
+    likes_count = models.IntegerField(verbose_name=_("likes"), default=0)
+    dislikes_count = models.IntegerField(verbose_name=_("dislikes"), default=0)
+    comments_count = models.IntegerField(verbose_name=_("comments"), default=0)
+    favorites_count = models.IntegerField(verbose_name=_("favorites"), default=0)
+    ratings_count = models.IntegerField(verbose_name=_("ratings"), default=0)
+    ratings_sum = models.IntegerField(verbose_name=_("sum of ratings"), default=0)
+
+    objects = BlogStatsManager()
+
+    class Meta:
+        """Meta options for BlogStats model."""
+
+        verbose_name = "Blog stats"
+        verbose_name_plural = "Blog stats"
+
+    def __str__(self) -> str:
+        """String representation of the blog stats."""
+        return f"Stats for {self.blog.title}"
+
+    @property
+    def average_rating(self) -> Union[float, int]:
+        """Average rating computed from the stored count and sum."""
+        if self.ratings_count:
+            return round(self.ratings_sum / self.ratings_count, 1)
         return 0
 
 
@@ -101,11 +239,14 @@ class BlogViews(TimeStampedUUIDModel):
     Attributes:
     - ip (str): The IP address of the viewer.
     - blog (Blog): The blog article being viewed.
+    - objects (BlogViewsManager): Custom manager for the BlogViews model.
     """
 
     ip = models.CharField(verbose_name=_("ip address"), max_length=250)
     blog = models.ForeignKey(Blog, related_name="blog_views", on_delete=models.CASCADE)
 
+    objects = BlogViewsManager()
+
     def __str__(self) -> str:
         """String representation of the blog view."""
         return f"Total views on - {self.blog.title} is - \
@@ -116,3 +257,6 @@ class BlogViews(TimeStampedUUIDModel):
 
         verbose_name = "Total views on Blog"
         verbose_name_plural = "Total Blog Views"
+        constraints = [
+            models.UniqueConstraint(fields=["blog", "ip"], name="unique_blog_view_ip")
+        ]
@@ -1,12 +1,15 @@
-from rest_framework.pagination import PageNumberPagination
+from core_apps.common.pagination import KeysetPagination
 
 
-class BlogPagination(PageNumberPagination):
+class BlogPagination(KeysetPagination):
     """
     Custom pagination for blog posts.
 
-    This pagination class sets the default page size for blog posts.
+    This pagination class pages blog posts newest first with keyset
+        cursors over (created_at, pkid) and sets their default page
+        size.
     """
 
     # Set the default page size for blog posts
     page_size = 5
+    ordering = ("-created_at", "-pkid")
@@ -1,20 +1,199 @@
-from typing import Any, List
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+WORDS_PER_MINUTE = 250
+
+BANNER_IMAGE_ADJUSTMENT_TIME = round(1 / 6, 3)
+
+# Characters of text split per step when counting words, bounding the
+# size of the temporary word list regardless of the body length
+WORD_COUNT_CHUNK_SIZE = 4096
+
+# (character, pattern, replacement) triples removing Markdown and HTML
+# markup, in order. Every pattern starts with a literal so the regex engine
+# can skip ahead to candidate positions instead of trying each character
+# of the body, and a pattern is only run on text containing its first
+# character, which is far cheaper to look for than running the pattern.
+MARKUP_PATTERNS = [
+    # HTML comments, tags and entities
+    ("<", re.compile(r"<!--.*?-->", re.DOTALL), " "),
+    ("<", re.compile(r"<[^>\n]+>"), " "),
+    ("&", re.compile(r"&#?\w+;"), " "),
+    # Markdown links and images keep their text, drop their target
+    ("[", re.compile(r"\[([^\]\n]*)\]\([^)\n]*\)"), r"\1"),
+]
+
+# Markdown code fences, horizontal rules, headings, quotes and list
+# markers, anchored on the newline that starts their line
+LINE_MARKERS = re.compile(
+    r"\n[ \t]{0,3}(?:(?:```|~~~).*|(?:[-*_][ \t]*){3,}$"
+    r"|(?:#{1,6}|>+|[-*+]|\d+[.)])(?=[ \t]))",
+    re.MULTILINE,
+)
+# Cheap search for lines that may start with one of LINE_MARKERS
+LINE_MARKER_HINT = re.compile(r"\n[ \t]{0,3}[-*_#>+`~\d]")
+
+# Markdown emphasis and inline code markers, deleted with str.translate
+EMPHASIS_CHARACTERS = "*_~`"
+EMPHASIS_MARKERS = str.maketrans("", "", EMPHASIS_CHARACTERS)
+
+# Characters every markup removed by strip_markup, except line markers,
+# contains
+MARKUP_CHARACTERS = "<&[" + EMPHASIS_CHARACTERS
+
+
+def has_markup(text: str) -> bool:
+    """
+    Checks whether a text may contain markup strip_markup removes.
+
+    Args:
+        text (str): The text to check.
+
+    Returns:
+        bool: False if the text is plain, True if it may have markup.
+    """
+    if any(character in text for character in MARKUP_CHARACTERS):
+        return True
+    # The first line has no newline before it to anchor the hint on
+    return bool(
+        LINE_MARKER_HINT.match("\n" + text[:4]) or LINE_MARKER_HINT.search(text)
+    )
+
+
+def strip_markup(text: str) -> str:
+    """
+    Removes Markdown and HTML markup from a text.
+
+    Args:
+        text (str): The text to clean.
+
+    Returns:
+        str: The text with markup replaced by whitespace, keeping
+            the visible text of links and images.
+    """
+    # Lead with a newline so markers on the first line are matched too
+    text = "\n" + text
+    for character, pattern, replacement in MARKUP_PATTERNS:
+        if character in text:
+            text = pattern.sub(replacement, text)
+    if LINE_MARKER_HINT.search(text):
+        text = LINE_MARKERS.sub("\n ", text)
+    if any(character in text for character in EMPHASIS_CHARACTERS):
+        text = text.translate(EMPHASIS_MARKERS)
+    return text
+
+
+def iter_markup_free(text: str) -> Iterator[str]:
+    """
+    Yields a text with markup removed, a block of lines at a time.
+
+    Blocks of about WORD_COUNT_CHUNK_SIZE characters are cut before a
+        newline, and extended past any HTML comment left open, so no
+        markup spans two blocks and no word is cut. Only one block is
+        copied and stripped at once, however long the text. Plain text
+        is yielded whole, as it is.
+
+    Args:
+        text (str): The text to clean.
+
+    Returns:
+        Iterator[str]: The blocks of the text, each as strip_markup
+            returns it.
+    """
+    if not has_markup(text):
+        yield text
+        return
+    start = 0
+    while start < len(text):
+        end = start + WORD_COUNT_CHUNK_SIZE
+        while True:
+            end = text.find("\n", end)
+            if end == -1:
+                end = len(text)
+                break
+            opened = text.rfind("<!--", start, end)
+            if opened == -1 or text.find("-->", opened + 4, end) != -1:
+                break
+            closed = text.find("-->", end)
+            if closed == -1:
+                end = len(text)
+                break
+            end = closed + 3
+        yield strip_markup(text[start:end])
+        start = end
+
+
+def count_words(text: str) -> int:
+    """
+    Counts the whitespace separated words in a text.
+
+    The text is split a chunk at a time so only one chunk's words
+        exist at once; a word cut by a chunk boundary is counted once.
+
+    Args:
+        text (str): The text to count.
+
+    Returns:
+        int: The number of words in the text.
+    """
+    count = 0
+    previous_ends_in_word = False
+    for start in range(0, len(text), WORD_COUNT_CHUNK_SIZE):
+        end = start + WORD_COUNT_CHUNK_SIZE
+        chunk = text[start:end]
+        count += len(chunk.split())
+        if previous_ends_in_word and not chunk[0].isspace():
+            count -= 1
+        previous_ends_in_word = not chunk[-1].isspace()
+    return count
+
+
+def format_read_time(
+    word_count: int,
+    has_banner_image: bool,
+    words_per_minute: int = WORDS_PER_MINUTE,
+) -> Optional[str]:
+    """
+    Formats the estimated read time for a number of words.
+
+    Args:
+        word_count (int): The number of words to read.
+        has_banner_image (bool): Whether time to look at a banner
+            image is added.
+        words_per_minute (int): The assumed reading speed.
+
+    Returns:
+        Optional[str]: The estimated read time in minutes or
+            seconds, or None when there are no words.
+    """
+    if not word_count:
+        return None
+    adjustment_time = BANNER_IMAGE_ADJUSTMENT_TIME if has_banner_image else 0
+    time_to_read = word_count / words_per_minute
+    if time_to_read < 1:
+        return str(round((time_to_read + adjustment_time) * 60)) + " second(s)"
+    return str(round(time_to_read + adjustment_time)) + " minute(s)"
 
 
 class BlogReadTimeEngine:
-    def __init__(self, blog: Any) -> None:
+    def __init__(self, blog: Any, tags: Optional[List[str]] = None) -> None:
         """
         Initializes the BlogReadTimeEngine with the given
             blog object.
 
         Args:
             blog (Any): The blog object to analyze.
+            tags (Optional[List[str]]): The blog's tag names. Read
+                from the blog when omitted.
         """
         self.blog = blog
+        self.tags = tags
 
-        self.words_per_minute = 250
+        self.words_per_minute = WORDS_PER_MINUTE
 
-        self.banner_image_adjustment_time = round(1 / 6, 3)
+        self.banner_image_adjustment_time = BANNER_IMAGE_ADJUSTMENT_TIME
+
+        self._word_count: Optional[int] = None
 
     def check_blog_has_banner_image(self) -> bool:
         """
@@ -44,11 +223,9 @@ class BlogReadTimeEngine:
         Retrieves the tags associated with the blog.
 
         Returns:
-            List[str]: A list of tag words.
+            List[str]: The tag names of the blog.
         """
-        tag_words = []
-        [tag_words.extend(tag_word.split()) for tag_word in self.blog.list_of_tags]
-        return tag_words
+        return self.blog.list_of_tags if self.tags is None else self.tags
 
     def get_body(self) -> str:
         """
@@ -68,42 +245,65 @@ class BlogReadTimeEngine:
         """
         return self.blog.description
 
-    def get_blog_details(self) -> List[str]:
+    def get_blog_details(self) -> Iterator[str]:
+        """
+        Retrieves the texts the blog's words are counted from.
+
+        Returns:
+            Iterator[str]: The title, blocks of the body with markup
+                stripped, description, and tag names of the blog.
         """
-        Retrieves various details of the blog.
+        yield self.get_title()
+        yield from iter_markup_free(self.get_body())
+        yield self.get_description()
+        yield from self.get_tags()
+
+    def get_word_count(self) -> int:
+        """
+        Counts the words in the blog.
 
         Returns:
-            List[str]: A list containing the title, body,
-                description, and tags of the blog.
+            int: The number of words in the title, body,
+                description and tags of the blog.
         """
-        details = []
-        details.extend(self.get_title().split())
-        details.extend(self.get_body().split())
-        details.extend(self.get_description().split())
-        details.extend(self.get_tags())
-        return details
+        if self._word_count is None:
+            self._word_count = sum(
+                count_words(text) for text in self.get_blog_details()
+            )
+        return self._word_count
 
-    def get_read_time(self) -> str:
+    def get_read_time(self) -> Optional[str]:
         """
         Calculates the estimated read time of the blog.
 
         Returns:
-            str: The estimated read time in minutes or seconds.
-        """
-        word_length = len(self.get_blog_details())
-        read_time = 0
-        self.check_blog_has_banner_image()
-
-        if word_length:
-            time_to_read = word_length / self.words_per_minute
-            if time_to_read < 1:
-                read_time = (
-                    str(round((time_to_read + self.banner_image_adjustment_time) * 60))
-                    + " second(s)"
-                )
-            else:
-                read_time = (
-                    str(round(time_to_read + self.banner_image_adjustment_time))
-                    + " minute(s)"
-                )
-            return read_time
+            Optional[str]: The estimated read time in minutes or
+                seconds, or None when the blog has no words.
+        """
+        return format_read_time(
+            self.get_word_count(),
+            self.check_blog_has_banner_image(),
+            self.words_per_minute,
+        )
+
+
+def batch_read_times(blogs: Iterable[Any]) -> Dict[Any, Tuple[int, str]]:
+    """
+    Computes the word count and read time of several blogs.
+
+    Tags are read through each blog's list_of_tags, so callers should
+        prefetch them to keep this to the queries already made.
+
+    Args:
+        blogs (Iterable[Any]): The blogs to analyze.
+
+    Returns:
+        Dict[Any, Tuple[int, str]]: The (word count, read time) of
+            each blog, keyed by pkid; the read time is an empty string
+            for blogs with no words.
+    """
+    read_times = {}
+    for blog in blogs:
+        engine = BlogReadTimeEngine(blog)
+        read_times[blog.pkid] = (engine.get_word_count(), engine.get_read_time() or "")
+    return read_times
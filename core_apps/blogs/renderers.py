@@ -1,44 +1,34 @@
 import json
 from typing import Any, Dict, Optional
 
-from rest_framework.renderers import JSONRenderer
+from rest_framework.renderers import BaseRenderer
 
+from core_apps.common.renderers import EnvelopeJSONRenderer
 
-class BlogJSONRenderer(JSONRenderer):
+
+class BlogJSONRenderer(EnvelopeJSONRenderer):
     """JSON Renderer for individual blog"""
 
-    charset = "utf-8"
+    envelope_key = "blog"
 
-    def render(
-        self,
-        data: Any,
-        accepted_media_type: Optional[str] = None,
-        renderer_context: Optional[Dict[str, Any]] = None,
-    ) -> Any:
-        """
-        Render the data for an individual blog.
 
-        Args:
-        - data (Any): Data to be rendered.
-        - accepted_media_type (Optional[str]): Media type being
-            accepted.
-        - renderer_context (Optional[Dict[str, Any]]): Context
-            of the renderer.
+class BlogsJSONRenderer(EnvelopeJSONRenderer):
+    """JSON Renderer for multiple blogs"""
 
-        Returns:
-        - Any: Rendered JSON data.
-        """
-        status_code = renderer_context["response"].status_code
-        errors = data.get("errors", None)
+    envelope_key = "blogs"
 
-        if errors is not None:
-            return super(BlogJSONRenderer, self).render(data)
-        return json.dumps({"status_code": status_code, "blog": data})
 
+class BlogNDJSONRenderer(BaseRenderer):
+    """
+    Renderer selecting the NDJSON blog export.
 
-class BlogsJSONRenderer(JSONRenderer):
-    """JSON Renderer for multiple blogs"""
+    The export view streams its own body; this renderer only takes part
+        in content negotiation (?format=ndjson) and renders error
+        responses as JSON.
+    """
 
+    media_type = "application/x-ndjson"
+    format = "ndjson"
     charset = "utf-8"
 
     def render(
@@ -46,21 +36,13 @@ class BlogsJSONRenderer(JSONRenderer):
         data: Any,
         accepted_media_type: Optional[str] = None,
         renderer_context: Optional[Dict[str, Any]] = None,
-    ) -> Any:
-        """
-        Render the data for multiple blogs.
-
-        Args:
-        - data (Any): Data to be rendered.
-        - accepted_media_type (Optional[str]): Media type being accepted.
-        - renderer_context (Optional[Dict[str, Any]]): Context of the renderer.
-
-        Returns:
-        - Any: Rendered JSON data.
-        """
-        status_code = renderer_context["response"].status_code
-        errors = data.get("errors", None)
-
-        if errors is not None:
-            return super(BlogJSONRenderer, self).render(data)
-        return json.dumps({"status_code": status_code, "blogs": data})
+    ) -> bytes:
+        """Render an error response as a single JSON line."""
+        return (json.dumps(data) + "\n").encode(self.charset)
+
+
+class BlogCSVRenderer(BlogNDJSONRenderer):
+    """Renderer selecting the CSV blog export (?format=csv)"""
+
+    media_type = "text/csv"
+    format = "csv"
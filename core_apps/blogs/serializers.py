@@ -1,13 +1,67 @@
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
+from django.db.models import Manager, QuerySet
 from rest_framework import serializers
+from rest_framework.request import Request
 
 from core_apps.blogs.models import Blog, BlogViews
-from core_apps.comments.serializers import CommentListSerializer
+from core_apps.comments.models import Comment
+from core_apps.comments.serializers import CommentPreviewSerializer
+from core_apps.common.serializers import DATETIME_FORMAT, SparseFieldsetMixin
 from core_apps.ratings.serializers import RatingSerializer
 
+from .cache import serialize_blogs
 from .custom_tag_field import TagRelatedField
 
+# Comments embedded per blog with ?expand=comments, unless comments_limit
+# asks for fewer; the rest are paged through the comments endpoint
+DEFAULT_COMMENTS_LIMIT = 10
+MAX_COMMENTS_LIMIT = 50
+
+# Relations (see BlogQuerySet.for_list) each BlogSerializer field reads
+FIELD_RELATIONS = {
+    "author_info": {"author"},
+    "tagList": {"tags"},
+    "ratings": {"ratings"},
+    "num_ratings": {"stats"},
+    "average_rating": {"rating_stats"},
+    "rating_histogram": {"rating_stats"},
+    "likes": {"stats"},
+    "dislikes": {"stats"},
+    "num_comments": {"stats"},
+}
+# Large columns left unloaded unless their field is serialized
+DEFERRABLE_FIELDS = ["body", "description"]
+
+
+def get_comments_limit(request: Optional[Request]) -> Optional[int]:
+    """
+    Get how many comments to embed per blog for a request.
+
+    Args:
+    - request (Optional[Request]): The request, if any.
+
+    Returns:
+    - Optional[int]: The number of comments to embed, capped at
+        MAX_COMMENTS_LIMIT, or None unless ?expand=comments was given.
+
+    Raises:
+    - ValidationError: If comments_limit is not a whole number.
+    """
+    if request is None:
+        return None
+    params = getattr(request, "query_params", request.GET)
+    expand = {name.strip() for name in params.get("expand", "").split(",")}
+    if "comments" not in expand:
+        return None
+    try:
+        limit = int(params.get("comments_limit", DEFAULT_COMMENTS_LIMIT))
+    except ValueError:
+        raise serializers.ValidationError(
+            {"comments_limit": "A whole number is required."}
+        )
+    return max(0, min(limit, MAX_COMMENTS_LIMIT))
+
 
 class BlogViewsSerializer(serializers.ModelSerializer):
     """
@@ -34,56 +88,102 @@ class BlogViewsSerializer(serializers.ModelSerializer):
         exclude = ["updated_at", "pkid"]
 
 
-class BlogSerializer(serializers.ModelSerializer):
+class CachedBlogListSerializer(serializers.ListSerializer):
+    """
+    List serializer for BlogSerializer backed by the fragment cache.
+
+    Comments are not part of the cached fragments; with
+        ?expand=comments the first comments_limit comments of every
+        blog are loaded with one query and added to the output.
+
+    Methods:
+    - to_representation: Serialize the blogs, reusing cached fragments.
+    """
+
+    def to_representation(self, data: Any) -> List[Dict]:
+        """
+        Serialize the blogs, reusing cached fragments.
+
+        Args:
+        - data (Any): The blogs, as a queryset, manager or list.
+
+        Returns:
+        - List[Dict]: The serialized blogs.
+        """
+        blogs = data.all() if isinstance(data, (Manager, QuerySet)) else data
+        blogs = list(blogs)
+        representations = serialize_blogs(blogs, self.child)
+
+        limit = get_comments_limit(self.context.get("request"))
+        if limit is None:
+            return representations
+        comments = (
+            Comment.objects.first_per_blog([blog.pkid for blog in blogs], limit)
+            if limit
+            else {}
+        )
+        pkids = {str(blog.id): blog.pkid for blog in blogs}
+        return [
+            {
+                **representation,
+                "comments": CommentPreviewSerializer(
+                    comments.get(pkids[str(representation["id"])], []), many=True
+                ).data,
+            }
+            for representation in representations
+        ]
+
+
+class BlogSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Blog.
 
-    Serializes blog data.
+    Serializes blog data. ?fields= and ?omit= select the fields
+        returned, and get_list_queryset only loads what those read.
 
     Attributes:
     - author_info: Serializer method field for author information.
     - banner_image: Serializer method field for fetching banner image.
-    - read_time: Readonly field for blog read time.
+    - read_time: Readonly field for the stored blog read time.
     - ratings: Serializer method field for fetching ratings.
-    - num_ratings: Serializer method field for counting ratings.
-    - average_rating: Readonly field for average rating.
-    - likes: Readonly field for blog likes.
-    - dislikes: Readonly field for blog dislikes.
+    - num_ratings: Readonly field for the stored ratings count.
+    - average_rating: Readonly field for the average rating.
+    - rating_histogram: Readonly field for the number of ratings
+        per rating value.
+    - likes: Readonly field for the stored likes count.
+    - dislikes: Readonly field for the stored dislikes count.
     - tagList: Custom tag field for tags associated with the blog.
-    - comments: Serializer method field for fetching comments.
-    - num_comments: Serializer method field for counting comments.
-    - created_at: Serializer method field for fetching creation date.
-    - updated_at: Serializer method field for fetching update date.
+    - num_comments: Readonly field for the stored comments count.
+    - created_at: Creation date, formatted with DATETIME_FORMAT.
+    - updated_at: Update date, formatted with DATETIME_FORMAT.
 
     Methods:
     - get_banner_image: Get the banner image for the blog.
-    - get_created_at: Get the creation date of the blog.
-    - get_updated_at: Get the update date of the blog.
     - get_author_info: Get the information of the author of the blog.
     - get_ratings: Get the ratings of the blog.
-    - get_num_ratings: Get the count of ratings for the blog.
-    - get_comments: Get the comments on the blog.
-    - get_num_comments: Get the count of comments on the blog.
+    - get_list_queryset: Queryset loading what the fields read.
 
     Attributes:
     - Meta: Metadata class for BlogSerializer.
         - model: The model being serialized (Blog).
         - fields: Fields to include in serialization.
+        - list_serializer_class: Serializer used with many=True,
+            reading and writing the per-blog fragment cache.
     """
 
     author_info = serializers.SerializerMethodField(read_only=True)
     banner_image = serializers.SerializerMethodField()
-    read_time = serializers.ReadOnlyField(source="blog_read_time")
+    read_time = serializers.ReadOnlyField()
     ratings = serializers.SerializerMethodField()
-    num_ratings = serializers.SerializerMethodField()
+    num_ratings = serializers.ReadOnlyField(source="stats.ratings_count")
     average_rating = serializers.ReadOnlyField(source="get_average_rating")
-    likes = serializers.ReadOnlyField(source="blog_reactions.likes")
-    dislikes = serializers.ReadOnlyField(source="blog_reactions.dislikes")
+    rating_histogram = serializers.ReadOnlyField(source="get_rating_histogram")
+    likes = serializers.ReadOnlyField(source="stats.likes_count")
+    dislikes = serializers.ReadOnlyField(source="stats.dislikes_count")
     tagList = TagRelatedField(many=True, required=False, source="tags")
-    comments = serializers.SerializerMethodField()
-    num_comments = serializers.SerializerMethodField()
-    created_at = serializers.SerializerMethodField()
-    updated_at = serializers.SerializerMethodField()
+    num_comments = serializers.ReadOnlyField(source="stats.comments_count")
+    created_at = serializers.DateTimeField(format=DATETIME_FORMAT, read_only=True)
+    updated_at = serializers.DateTimeField(format=DATETIME_FORMAT, read_only=True)
 
     def get_banner_image(self, obj: Blog) -> str:
         """
@@ -97,34 +197,6 @@ class BlogSerializer(serializers.ModelSerializer):
         """
         return obj.banner_image.url
 
-    def get_created_at(self, obj: Blog) -> str:
-        """
-        Get the creation date of the blog.
-
-        Args:
-        - obj (Blog): Blog object.
-
-        Returns:
-        - str: Formatted creation date.
-        """
-        now = obj.created_at
-        formatted_date = now.strftime("%m/%d/%Y, %H:%M:%S")
-        return formatted_date
-
-    def get_updated_at(self, obj: Blog) -> str:
-        """
-        Get the update date of the blog.
-
-        Args:
-        - obj (Blog): Blog object.
-
-        Returns:
-        - str: Formatted update date.
-        """
-        then = obj.updated_at
-        formatted_date = then.strftime("%m/%d/%Y, %H:%M:%S")
-        return formatted_date
-
     def get_author_info(self, obj: Blog) -> Dict:
         """
         Get the information of the author of the blog.
@@ -160,45 +232,20 @@ class BlogSerializer(serializers.ModelSerializer):
         serializer = RatingSerializer(reviews, many=True)
         return serializer.data
 
-    def get_num_ratings(self, obj: Blog) -> int:
+    def get_list_queryset(self) -> QuerySet:
         """
-        Get the count of ratings for the blog.
-
-        Args:
-        - obj (Blog): Blog object.
-
-        Returns:
-        - int: Number of ratings.
-        """
-        num_reviews = obj.blog_ratings.all().count()
-        return num_reviews
-
-    def get_comments(self, obj: Blog) -> List:
-        """
-        Get the comments on the blog.
-
-        Args:
-        - obj (Blog): Blog object.
-
-        Returns:
-        - List: List of serialized comments.
-        """
-        comments = obj.comments.all()
-        serializer = CommentListSerializer(comments, many=True)
-        return serializer.data
-
-    def get_num_comments(self, obj: Blog) -> int:
-        """
-        Get the count of comments on the blog.
-
-        Args:
-        - obj (Blog): Blog object.
+        Get the queryset blogs are loaded with for serialization.
 
         Returns:
-        - int: Number of comments.
+        - QuerySet: Blog.objects.for_list() loading only the relations
+            and large columns the selected fields read.
         """
-        num_comments = obj.comments.all().count()
-        return num_comments
+        fields = set(self.fields)
+        relations = set()
+        for name in fields:
+            relations |= FIELD_RELATIONS.get(name, set())
+        defer = [name for name in DEFERRABLE_FIELDS if name not in fields]
+        return Blog.objects.for_list(relations=relations, defer=defer)
 
     class Meta:
         """
@@ -207,9 +254,11 @@ class BlogSerializer(serializers.ModelSerializer):
         Attributes:
         - model: The model being serialized (Blog).
         - fields: Fields to include in serialization.
+        - list_serializer_class: Serializer used with many=True.
         """
 
         model = Blog
+        list_serializer_class = CachedBlogListSerializer
         fields = [
             "id",
             "title",
@@ -225,9 +274,9 @@ class BlogSerializer(serializers.ModelSerializer):
             "ratings",
             "num_ratings",
             "average_rating",
+            "rating_histogram",
             "views",
             "num_comments",
-            "comments",
             "created_at",
             "updated_at",
         ]
@@ -242,12 +291,14 @@ class BlogCreateSerializer(serializers.ModelSerializer):
     Attributes:
     - Meta: Metadata class for BlogCreateSerializer.
         - model: The model being serialized (Blog).
-        - exclude: Fields to exclude from serialization (updated_at, pkid).
+        - exclude: Fields to exclude from serialization (updated_at, pkid,
+            word_count, search_vector).
+        - read_only_fields: Fields computed on save (read_time).
     """
 
     tags = TagRelatedField(many=True, required=False)
     banner_image = serializers.SerializerMethodField()
-    created_at = serializers.SerializerMethodField()
+    created_at = serializers.DateTimeField(format=DATETIME_FORMAT, read_only=True)
 
     class Meta:
         """
@@ -256,25 +307,13 @@ class BlogCreateSerializer(serializers.ModelSerializer):
         Attributes:
         - model: The model being serialized (Blog).
         - exclude: Fields to exclude from serialization
-        (updated_at, pkid).
+        (updated_at, pkid, word_count, search_vector).
+        - read_only_fields: Fields computed on save (read_time).
         """
 
         model = Blog
-        exclude = ["updated_at", "pkid"]
-
-    def get_created_at(self, obj: Blog) -> str:
-        """
-        Get the created at date.
-
-        Args:
-        - obj (Blog): The Blog object.
-
-        Returns:
-        - str: Formatted created at date.
-        """
-        now = obj.created_at
-        formatted_date = now.strftime("%m/%d/%Y, %H:%M:%S")
-        return formatted_date
+        exclude = ["updated_at", "pkid", "word_count", "search_vector"]
+        read_only_fields = ["read_time"]
 
     def get_banner_image(self, obj: Blog) -> str:
         """
@@ -304,7 +343,7 @@ class BlogUpdateSerializer(serializers.ModelSerializer):
     """
 
     tags = TagRelatedField(many=True, required=False)
-    updated_at = serializers.SerializerMethodField()
+    updated_at = serializers.DateTimeField(format=DATETIME_FORMAT, read_only=True)
 
     class Meta:
         """
@@ -318,17 +357,3 @@ class BlogUpdateSerializer(serializers.ModelSerializer):
 
         model = Blog
         fields = ["title", "description", "body", "banner_image", "tags", "updated_at"]
-
-    def get_updated_at(self, obj: Blog) -> str:
-        """
-        Get the updated at date.
-
-        Args:
-        - obj (Blog): The Blog object.
-
-        Returns:
-        - str: Formatted updated at date.
-        """
-        then = obj.updated_at
-        formatted_date = then.strftime("%m/%d/%Y, %H:%M:%S")
-        return formatted_date
@@ -0,0 +1,277 @@
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from core_apps.blogs.cache import (
+    TAG_LISTS_NAMESPACE,
+    blog_namespace,
+    invalidate_blogs,
+    tag_namespace,
+)
+from core_apps.blogs.feed import forget_timelines
+from core_apps.blogs.models import Blog, BlogStats, Tag
+from core_apps.blogs.tasks import fan_out_blog
+from core_apps.profiles.graph import following_changed
+
+
+# Signal to create the counters row for a newly created blog
+@receiver(post_save, sender=Blog)
+def create_blog_stats(
+    sender: Any, instance: Blog, created: bool, **kwargs: Any
+) -> None:
+    """
+    Creates the stats row for a newly created blog.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Blog): The blog that was saved.
+    - created (bool): Indicates if the instance is newly created.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    if created:
+        BlogStats.objects.create(blog=instance)
+
+
+# Signal to fan a newly created blog out to its author's followers' feeds
+@receiver(post_save, sender=Blog)
+def fan_out_created_blog(
+    sender: Any, instance: Blog, created: bool, **kwargs: Any
+) -> None:
+    """
+    Queues the fan out of a newly created blog once it is committed.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Blog): The blog that was saved.
+    - created (bool): Indicates if the instance is newly created.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    if created:
+        pkid = instance.pkid
+        transaction.on_commit(lambda: fan_out_blog.delay(pkid))
+
+
+# Signal to rebuild the feeds of profiles whose follows changed
+@receiver(following_changed)
+def rebuild_feeds(sender: Any, pkids: Any, **kwargs: Any) -> None:
+    """
+    Drops the feed timelines of profiles that followed or unfollowed.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - pkids (Any): The pkids of the profiles whose follows changed.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    forget_timelines(pkids)
+
+
+# Signal to refresh the stored read time when a blog's tags change
+@receiver(m2m_changed, sender=Blog.tags.through)
+def refresh_read_time_on_tags_change(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: Any, **kwargs: Any
+) -> None:
+    """
+    Refreshes the stored read time of blogs whose tags changed.
+
+    post_clear carries no pkids, so the blogs of a tag being cleared
+        are looked up in pre_clear.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Any): The blog, or the tag when changed from the tag side.
+    - action (str): The m2m_changed action.
+    - reverse (bool): Indicates if the change was made from the tag side.
+    - pk_set (Any): The pks of the added or removed objects.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    if reverse and action == "pre_clear":
+        instance._cleared_blog_pkids = list(
+            Blog.objects.filter(tags=instance).values_list("pkid", flat=True)
+        )
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        instance.set_read_time()
+        Blog.objects.filter(pkid=instance.pkid).update(
+            word_count=instance.word_count, read_time=instance.read_time
+        )
+        return
+    if action == "post_clear":
+        pk_set = instance.__dict__.pop("_cleared_blog_pkids", None)
+    if pk_set:
+        Blog.objects.filter(pkid__in=pk_set).refresh_read_times()
+
+
+# Signal to refresh the stored read time of a renamed tag's blogs
+@receiver(post_save, sender=Tag)
+def refresh_read_time_on_tag_rename(
+    sender: Any, instance: Tag, created: bool, **kwargs: Any
+) -> None:
+    """
+    Refreshes the stored read time of the blogs of an updated tag.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Tag): The tag that was saved.
+    - created (bool): Indicates if the instance is newly created.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    if not created:
+        Blog.objects.filter(tags=instance).refresh_read_times()
+
+
+# Signal to remember a blog's slug before AutoSlugField regenerates it
+@receiver(pre_save, sender=Blog)
+def remember_previous_slug(sender: Any, instance: Blog, **kwargs: Any) -> None:
+    """
+    Stores the slug a blog had before this save on the instance.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Blog): The blog being saved.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    instance._previous_slug = (
+        Blog.objects.filter(pkid=instance.pkid).values_list("slug", flat=True).first()
+        if instance.pkid
+        else None
+    )
+
+
+# Signal to invalidate cached responses of a created or updated blog
+@receiver(post_save, sender=Blog)
+def invalidate_saved_blog(
+    sender: Any, instance: Blog, created: bool, **kwargs: Any
+) -> None:
+    """
+    Invalidates the cached entries of a saved blog, under its old slug too.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Blog): The blog that was saved.
+    - created (bool): Indicates if the instance is newly created.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    previous_slug = getattr(instance, "_previous_slug", None)
+    extra_namespaces = [blog_namespace(previous_slug)] if previous_slug else []
+    invalidate_blogs(Blog.objects.filter(pkid=instance.pkid), extra_namespaces)
+
+
+# Signal to invalidate cached responses of a deleted blog
+@receiver(pre_delete, sender=Blog)
+def invalidate_deleted_blog(sender: Any, instance: Blog, **kwargs: Any) -> None:
+    """
+    Invalidates the cached entries of a blog about to be deleted.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Blog): The blog being deleted.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    invalidate_blogs(Blog.objects.filter(pkid=instance.pkid))
+
+
+# Signal to invalidate cached responses when tags are added or removed
+@receiver(m2m_changed, sender=Blog.tags.through)
+def invalidate_blog_tags(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: Any, **kwargs: Any
+) -> None:
+    """
+    Invalidates the blogs and tag lists affected by a tag change.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Any): The blog, or the tag when changed from the tag side.
+    - action (str): The m2m_changed action.
+    - reverse (bool): Indicates if the change was made from the tag side.
+    - pk_set (Any): The pks of the added or removed objects.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    if action not in ("pre_clear", "post_add", "post_remove"):
+        return
+    if reverse:
+        blogs = Blog.objects.filter(tags=instance)
+        if pk_set:
+            blogs = Blog.objects.filter(pkid__in=pk_set)
+        invalidate_blogs(blogs, [TAG_LISTS_NAMESPACE, tag_namespace(instance.tag)])
+        return
+
+    tags = Tag.objects.filter(pkid__in=pk_set or ())
+    invalidate_blogs(
+        Blog.objects.filter(pkid=instance.pkid),
+        [tag_namespace(tag) for tag in tags.values_list("tag", flat=True)],
+    )
+
+
+# Signal to invalidate tag filtered lists when a tag is renamed or deleted
+@receiver(post_save, sender=Tag)
+@receiver(pre_delete, sender=Tag)
+def invalidate_tag(sender: Any, instance: Tag, **kwargs: Any) -> None:
+    """
+    Invalidates the blogs of a saved or deleted tag and all tag lists.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Tag): The tag that was saved or is being deleted.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    invalidate_blogs(
+        Blog.objects.filter(tags=instance),
+        [TAG_LISTS_NAMESPACE, tag_namespace(instance.tag)],
+    )
+
+
+# Signals to invalidate a blog when its reactions, ratings, comments or
+# favorites change
+@receiver(post_save, sender="reactions.Reaction")
+@receiver(post_delete, sender="reactions.Reaction")
+@receiver(post_save, sender="ratings.Rating")
+@receiver(post_delete, sender="ratings.Rating")
+@receiver(post_save, sender="comments.Comment")
+@receiver(post_delete, sender="comments.Comment")
+@receiver(post_save, sender="favorites.Favorite")
+@receiver(post_delete, sender="favorites.Favorite")
+def invalidate_blog_activity(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """
+    Invalidates the cached entries of the blog an object belongs to.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Any): The reaction, rating, comment or favorite.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    invalidate_blogs(Blog.objects.filter(pkid=instance.blog_id))
+
+
+# Signals to invalidate an author's blogs when their user or profile changes
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_save, sender="profiles.Profile")
+def invalidate_author(
+    sender: Any, instance: Any, created: bool, update_fields: Any, **kwargs: Any
+) -> None:
+    """
+    Invalidates the cached entries of an author's blogs.
+
+    Saves that only touch last_login, as on every login, are ignored.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Any): The user or profile that was saved.
+    - created (bool): Indicates if the instance is newly created.
+    - update_fields (Any): The fields passed to save(), if any.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    if created or (update_fields and set(update_fields) <= {"last_login"}):
+        return
+    author_pkid = getattr(instance, "user_id", instance.pkid)
+    invalidate_blogs(Blog.objects.filter(author_id=author_pkid))
@@ -0,0 +1,41 @@
+import logging
+
+from celery import shared_task
+from redis.exceptions import RedisError
+
+from .feed import fan_out
+from .view_buffer import flush_views
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def flush_blog_views() -> int:
+    """
+    Flush view events buffered by BlogDetailView into the database.
+
+    Scheduled periodically by celery beat (see CELERY_BEAT_SCHEDULE).
+
+    Returns:
+    - int: Number of new views recorded.
+    """
+    recorded = flush_views()
+    if recorded:
+        logger.info(f"recorded {recorded} buffered blog view(s)")
+    return recorded
+
+
+@shared_task(ignore_result=True, autoretry_for=(RedisError,), retry_backoff=True)
+def fan_out_blog(blog_pkid: int) -> int:
+    """
+    Add a new blog to the feed timelines of its author's followers.
+
+    Queued by the post_save signal of Blog once the blog is committed.
+
+    Args:
+    - blog_pkid (int): The pkid of the created blog.
+
+    Returns:
+    - int: Number of timelines the blog was added to.
+    """
+    return fan_out(blog_pkid)
@@ -0,0 +1,31 @@
+import factory
+from faker import Factory as FakerFactory
+
+from core_apps.blogs.models import Blog
+from core_apps.users.tests.factories import UserFactory
+
+faker = FakerFactory.create()
+
+
+class BlogFactory(factory.django.DjangoModelFactory):
+    """Factory for Blog model"""
+
+    author = factory.SubFactory(UserFactory)
+    title = factory.LazyAttribute(lambda x: faker.sentence(nb_words=4))
+    description = factory.LazyAttribute(lambda x: faker.sentence(nb_words=8))
+    body = factory.LazyAttribute(lambda x: faker.paragraph(nb_sentences=10))
+
+    class Meta:
+        """Meta class"""
+
+        model = Blog
+
+    @factory.post_generation
+    def tags(self, create, extracted, **kwargs):
+        """Post generation method"""
+        if not create:
+            return
+
+        if extracted:
+            for tag in extracted:
+                self.tags.add(tag)
@@ -0,0 +1,120 @@
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from core_apps.blogs.cache import FRAGMENT_KEY_FIELDS, serialize_blogs
+from core_apps.blogs.models import Blog, Tag
+from core_apps.blogs.serializers import BlogSerializer
+from core_apps.reactions.models import Reaction
+
+
+def get_blog(client, blog):
+    """Request the detail of a blog and return its payload"""
+    response = client.get(reverse("blog-detail", kwargs={"slug": blog.slug}))
+    assert response.status_code == 200
+    return response.json()["blog"]
+
+
+def list_titles(client, **params):
+    """Request the blog list and return the listed titles"""
+    response = client.get(reverse("all-blogs"), params)
+    assert response.status_code == 200
+    return [blog["title"] for blog in response.json()["blogs"]["results"]]
+
+
+@pytest.mark.django_db
+def test_new_blog_shows_in_cached_list(
+    client, profile_factory, blog_factory, django_capture_on_commit_callbacks
+):
+    """Test creating a blog invalidates the cached list"""
+    author = profile_factory().user
+    blog_factory(author=author, title="First post")
+    assert list_titles(client) == ["First post"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        blog_factory(author=author, title="Second post")
+
+    assert list_titles(client) == ["Second post", "First post"]
+
+
+@pytest.mark.django_db
+def test_reaction_invalidates_cached_detail(
+    client, profile_factory, blog_factory, django_capture_on_commit_callbacks
+):
+    """Test a new reaction shows up in the cached blog detail"""
+    blog = blog_factory(author=profile_factory().user)
+    assert get_blog(client, blog)["likes"] == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Reaction.objects.create(blog=blog, user=profile_factory().user, reaction=1)
+        blog.stats.likes_count = 1
+        blog.stats.save()
+
+    assert get_blog(client, blog)["likes"] == 1
+
+
+@pytest.mark.django_db
+def test_tag_list_survives_unrelated_changes(
+    client,
+    profile_factory,
+    blog_factory,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    """Test a tag filtered list is only invalidated by blogs with that tag"""
+    author = profile_factory().user
+    django_tag = Tag.objects.create(tag="django", slug="django")
+    blog_factory(author=author, title="Tagged", tags=[django_tag])
+    other = blog_factory(author=author, title="Untagged")
+    assert list_titles(client, tags="django") == ["Tagged"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        other.title = "Renamed"
+        other.save()
+
+    # Only the savepoint and release of ATOMIC_REQUESTS
+    with django_assert_num_queries(2):
+        assert list_titles(client, tags="django") == ["Tagged"]
+
+
+@pytest.mark.django_db
+def test_login_keeps_cached_list(
+    client,
+    profile_factory,
+    blog_factory,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    """Test logging in doesn't invalidate the author's cached blogs"""
+    author = profile_factory().user
+    blog_factory(author=author, title="First post")
+    assert list_titles(client) == ["First post"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Client().force_login(author)
+
+    with django_assert_num_queries(2):
+        assert list_titles(client) == ["First post"]
+
+
+@pytest.mark.django_db
+def test_serialize_blogs_only_loads_misses(
+    profile_factory, blog_factory, django_assert_num_queries
+):
+    """Test cached fragments are reused and only changed blogs reloaded"""
+    author = profile_factory().user
+    first = blog_factory(author=author, title="First")
+    blog_factory(author=author, title="Second")
+    blogs = list(Blog.objects.only(*FRAGMENT_KEY_FIELDS).order_by("pkid"))
+    serialize_blogs(blogs, BlogSerializer())
+
+    with django_assert_num_queries(0):
+        cached = serialize_blogs(blogs, BlogSerializer())
+    assert [blog["title"] for blog in cached] == ["First", "Second"]
+
+    first.title = "First, edited"
+    first.save()
+    blogs = list(Blog.objects.only(*FRAGMENT_KEY_FIELDS).order_by("pkid"))
+    with django_assert_num_queries(3):  # the blog, tags and ratings
+        refreshed = serialize_blogs(blogs, BlogSerializer())
+    assert [blog["title"] for blog in refreshed] == ["First, edited", "Second"]
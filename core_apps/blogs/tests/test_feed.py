@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from core_apps.blogs import feed
+from core_apps.blogs.models import Blog
+
+
+def create_blogs(author, blog_factory, *ages):
+    """Create blogs by an author, created the given minutes ago"""
+    blogs = []
+    for minutes in ages:
+        blog = blog_factory(author=author.user)
+        Blog.objects.filter(pkid=blog.pkid).update(
+            created_at=timezone.now() - timedelta(minutes=minutes)
+        )
+        blogs.append(blog)
+    return blogs
+
+
+def read_all(profile, page_size):
+    """Page through a profile's feed and return the blog pkids read"""
+    pkids, cursor = [], None
+    while True:
+        blogs, cursor = feed.read_feed(profile.pkid, cursor, page_size)
+        pkids += [blog.pkid for blog in blogs]
+        if cursor is None:
+            return pkids
+
+
+@pytest.mark.django_db
+def test_fan_out_adds_to_built_timelines(
+    fake_redis, settings, profile_factory, blog_factory
+):
+    """Test new blogs reach built timelines, which keep the newest blogs"""
+    settings.FEED_MAX_LENGTH = 2
+    reader, idle, author = profile_factory(), profile_factory(), profile_factory()
+    reader.follow(author)
+    idle.follow(author)
+    old, older = create_blogs(author, blog_factory, 10, 20)
+    timeline = feed.TIMELINE_KEY.format(pkid=reader.pkid)
+
+    assert read_all(reader, 10) == [old.pkid, older.pkid]
+    assert fake_redis.zscore(timeline, feed.LOADED_MARKER) == 0
+
+    new = blog_factory(author=author.user)
+    assert feed.fan_out(new.pkid) == 1
+    assert not fake_redis.exists(feed.TIMELINE_KEY.format(pkid=idle.pkid))
+    assert fake_redis.zrange(timeline, 0, -1) == [
+        b"",
+        str(old.pkid).encode(),
+        str(new.pkid).encode(),
+    ]
+    assert read_all(reader, 10) == [new.pkid, old.pkid]
+
+
+@pytest.mark.django_db
+def test_feed_pages_blogs_created_at_once(
+    fake_redis, settings, profile_factory, blog_factory
+):
+    """Test blogs sharing a timestamp are read once each across pages"""
+    settings.FEED_FAN_OUT_LIMIT = 1
+    reader, author, popular = profile_factory(), profile_factory(), profile_factory()
+    reader.follow(author)
+    reader.follow(popular)
+    profile_factory().follow(popular)
+    blogs = create_blogs(author, blog_factory, 5, 5, 5)
+    blogs += create_blogs(popular, blog_factory, 5, 5)
+    Blog.objects.update(created_at=Blog.objects.earliest("created_at").created_at)
+
+    expected = sorted((blog.pkid for blog in blogs), reverse=True)
+    for page_size in (1, 2, 4):
+        assert read_all(reader, page_size) == expected
+
+
+@pytest.mark.django_db
+def test_deleted_blogs_leave_the_timeline(fake_redis, profile_factory, blog_factory):
+    """Test a deleted blog is skipped and dropped from the timeline"""
+    reader, author = profile_factory(), profile_factory()
+    reader.follow(author)
+    kept, deleted = create_blogs(author, blog_factory, 1, 2)
+    deleted_pkid = deleted.pkid
+    read_all(reader, 10)
+    deleted.delete()
+
+    assert read_all(reader, 10) == [kept.pkid]
+    timeline = feed.TIMELINE_KEY.format(pkid=reader.pkid)
+    assert fake_redis.zscore(timeline, deleted_pkid) is None
@@ -0,0 +1,109 @@
+import pytest
+from django.core.management import call_command
+
+from core_apps.blogs import read_time_engine
+from core_apps.blogs.models import Blog, Tag
+from core_apps.blogs.read_time_engine import (
+    WORD_COUNT_CHUNK_SIZE,
+    count_words,
+    iter_markup_free,
+    strip_markup,
+)
+
+
+def test_count_words_matches_split_across_chunks():
+    """Test words cut by a chunk boundary are counted once"""
+    text = ("a" * (WORD_COUNT_CHUNK_SIZE - 2) + " word  ") * 3 + "end"
+
+    assert count_words(text) == len(text.split()) == 7
+
+
+def test_strip_markup_removes_markdown_and_html():
+    """Test markup doesn't count as words but link text does"""
+    body = (
+        "# Title\n"
+        "Some **bold** and `code` with [link text](https://example.com/a).\n"
+        "- item\n"
+        "<p>Plain&nbsp;text</p>\n"
+    )
+
+    assert strip_markup(body).split() == [
+        "Title",
+        "Some",
+        "bold",
+        "and",
+        "code",
+        "with",
+        "link",
+        "text.",
+        "item",
+        "Plain",
+        "text",
+    ]
+
+
+def test_markup_is_stripped_a_block_at_a_time(monkeypatch):
+    """Test block by block stripping matches stripping the whole text"""
+    monkeypatch.setattr(read_time_engine, "WORD_COUNT_CHUNK_SIZE", 16)
+    body = (
+        "Intro paragraph with words\n"
+        "<!-- a comment\nspanning\nlines -->after\n"
+        "## Heading\n"
+        "1. first *item*\n"
+        + "plain line without markup\n" * 3
+        + "[link](https://example.com)"
+    )
+
+    blocks = list(iter_markup_free(body))
+
+    assert len(blocks) > 3
+    assert "".join(blocks).split() == strip_markup(body).split()
+    assert sum(count_words(block) for block in blocks) == 21
+    assert strip_markup("plain text") == "\nplain text"
+
+
+@pytest.mark.django_db
+def test_read_time_is_stored_on_save(blog_factory):
+    """Test saving a blog stores its word count and read time"""
+    blog = blog_factory(title="One two", description="three", body="four five six")
+
+    stored = Blog.objects.get(pkid=blog.pkid)
+    assert stored.word_count == 6
+    assert stored.read_time == "11 second(s)"
+
+    stored.body = "four " * 500
+    stored.save()
+    assert Blog.objects.get(pkid=blog.pkid).word_count == 503
+
+
+@pytest.mark.django_db
+def test_read_time_follows_tag_changes(blog_factory):
+    """Test adding, removing, clearing and renaming tags refreshes the word count"""
+    blog = blog_factory(title="One", description="two", body="three")
+    tag = Tag.objects.create(tag="django rest", slug="django-rest")
+
+    blog.tags.add(tag)
+    assert Blog.objects.get(pkid=blog.pkid).word_count == 5
+
+    tag.tag = "drf"
+    tag.save()
+    assert Blog.objects.get(pkid=blog.pkid).word_count == 4
+
+    blog.tags.remove(tag)
+    assert Blog.objects.get(pkid=blog.pkid).word_count == 3
+
+    tag.blogs.add(blog)
+    assert Blog.objects.get(pkid=blog.pkid).word_count == 4
+    tag.blogs.clear()
+    assert Blog.objects.get(pkid=blog.pkid).word_count == 3
+
+
+@pytest.mark.django_db
+def test_backfill_read_times_command(blog_factory):
+    """Test the backfill command recomputes stale stored read times"""
+    blog = blog_factory(title="One", description="two", body="three")
+    Blog.objects.filter(pkid=blog.pkid).update(word_count=0, read_time="")
+
+    call_command("backfill_read_times")
+
+    assert Blog.objects.get(pkid=blog.pkid).word_count == 3
@@ -0,0 +1,82 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core_apps.blogs.models import BlogStats
+from core_apps.comments.models import Comment
+
+
+@pytest.fixture
+def reader_client(profile_factory):
+    """API client authenticated as a user who isn't the blog author"""
+    client = APIClient()
+    client.force_authenticate(user=profile_factory().user)
+    return client
+
+
+@pytest.mark.django_db
+def test_blog_stats_created_with_blog(profile_factory, blog_factory):
+    """Test a stats row is created alongside a new blog"""
+    blog = blog_factory(author=profile_factory().user)
+
+    assert blog.stats.likes_count == 0
+    assert blog.stats.average_rating == 0
+
+
+@pytest.mark.django_db
+def test_reaction_updates_blog_stats(reader_client, profile_factory, blog_factory):
+    """Test liking, switching to dislike and undoing update the counters"""
+    blog = blog_factory(author=profile_factory().user)
+    url = reverse("user-reaction", kwargs={"slug": blog.slug})
+
+    reader_client.post(url, {"reaction": 1}, format="json")
+    blog.stats.refresh_from_db()
+    assert (blog.stats.likes_count, blog.stats.dislikes_count) == (1, 0)
+
+    reader_client.post(url, {"reaction": -1}, format="json")
+    blog.stats.refresh_from_db()
+    assert (blog.stats.likes_count, blog.stats.dislikes_count) == (0, 1)
+
+    reader_client.post(url, {"reaction": -1}, format="json")
+    blog.stats.refresh_from_db()
+    assert (blog.stats.likes_count, blog.stats.dislikes_count) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_rating_comment_and_favorite_update_blog_stats(
+    reader_client, profile_factory, blog_factory
+):
+    """Test rating, commenting and favoriting update the counters"""
+    blog = blog_factory(author=profile_factory().user)
+
+    reader_client.post(
+        reverse("rate-blog", kwargs={"blog_id": blog.id}),
+        {"value": 4, "review": "Good"},
+        format="json",
+    )
+    reader_client.post(
+        reverse("comments", kwargs={"slug": blog.slug}),
+        {"body": "Nice read"},
+        format="json",
+    )
+    reader_client.post(reverse("favorite-blogs", kwargs={"slug": blog.slug}))
+
+    blog.stats.refresh_from_db()
+    assert blog.stats.ratings_count == 1
+    assert blog.stats.average_rating == 4.0
+    assert blog.stats.comments_count == 1
+    assert blog.stats.favorites_count == 1
+
+
+@pytest.mark.django_db
+def test_rebuild_blog_stats_command(profile_factory, blog_factory):
+    """Test the rebuild command recomputes counters and recreates rows"""
+    author = profile_factory()
+    blog = blog_factory(author=author.user)
+    Comment.objects.create(blog=blog, author=author, body="First!")
+    BlogStats.objects.filter(blog=blog).delete()
+
+    call_command("rebuild_blog_stats")
+
+    assert BlogStats.objects.get(blog=blog).comments_count == 1
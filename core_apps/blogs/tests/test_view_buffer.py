@@ -0,0 +1,51 @@
+import pytest
+from django.urls import reverse
+
+from core_apps.blogs.models import Blog, BlogViews
+from core_apps.blogs.view_buffer import apply_views
+
+
+@pytest.mark.django_db
+def test_apply_views_skips_known_ips(blog):
+    """Test buffered views only count IPs not already recorded"""
+    BlogViews.objects.create(blog=blog, ip="10.0.0.1")
+
+    recorded = apply_views(blog.pkid, ["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+
+    blog.refresh_from_db()
+    assert recorded == 2
+    assert blog.views == 2
+    assert BlogViews.objects.filter(blog=blog).count() == 3
+
+
+@pytest.mark.django_db
+def test_apply_views_ignores_deleted_blog(blog):
+    """Test views buffered for a since deleted blog are dropped"""
+    blog_pkid = blog.pkid
+    blog.delete()
+
+    assert apply_views(blog_pkid, ["10.0.0.1"]) == 0
+    assert not BlogViews.objects.exists()
+
+
+@pytest.mark.django_db
+def test_blog_detail_does_not_write_views(client, profile_factory, blog_factory):
+    """Test the detail view leaves view persistence to the flush task"""
+    blog = blog_factory(author=profile_factory().user)
+
+    response = client.get(reverse("blog-detail", kwargs={"slug": blog.slug}))
+
+    assert response.status_code == 200
+    assert Blog.objects.get(pkid=blog.pkid).views == 0
+    assert not BlogViews.objects.exists()
+
+
+@pytest.mark.django_db
+def test_record_reports_whether_view_is_new(blog):
+    """Test recording a view twice only inserts it once"""
+    assert BlogViews.objects.record(blog.pkid, "10.0.0.1") is True
+    assert BlogViews.objects.record(blog.pkid, "10.0.0.1") is False
+    assert BlogViews.objects.record_many(blog.pkid, ["10.0.0.1", "10.0.0.2"]) == [
+        "10.0.0.2"
+    ]
+    assert BlogViews.objects.filter(blog=blog).count() == 2
@@ -0,0 +1,239 @@
+import base64
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core_apps.blogs.models import Blog, BlogStats, Tag
+from core_apps.comments.models import Comment
+from core_apps.ratings.models import Rating
+from core_apps.reactions.models import Reaction
+
+
+def create_blogs_with_activity(count, profile_factory, blog_factory):
+    """Create blogs that each have tags, a rating, a reaction and comments"""
+    reader = profile_factory()
+    tag, _ = Tag.objects.get_or_create(tag="django", slug="django")
+    for _ in range(count):
+        author = profile_factory().user
+        blog = blog_factory(author=author, tags=[tag])
+        Rating.objects.create(blog=blog, rated_by=reader.user, value=4)
+        Reaction.objects.create(blog=blog, user=reader.user, reaction=1)
+        Comment.objects.create(blog=blog, author=reader, body="Nice read")
+        Comment.objects.create(blog=blog, author=author.profile, body="Thanks")
+    BlogStats.objects.rebuild()
+
+
+def count_list_queries(client):
+    """Request the blog list and return the number of queries it ran"""
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("all-blogs"))
+    assert response.status_code == 200
+    return len(queries)
+
+
+@pytest.mark.django_db
+def test_blog_list_query_count_is_constant(client, profile_factory, blog_factory):
+    """Test blog list runs the same number of queries for 1 and 5 blogs"""
+    create_blogs_with_activity(1, profile_factory, blog_factory)
+    single_blog_queries = count_list_queries(client)
+
+    create_blogs_with_activity(4, profile_factory, blog_factory)
+    cache.clear()
+    five_blog_queries = count_list_queries(client)
+
+    assert five_blog_queries == single_blog_queries
+
+
+@pytest.mark.django_db
+def test_blog_list_serializes_aggregates(client, profile_factory, blog_factory):
+    """Test blog list returns annotated counts and prefetched relations"""
+    create_blogs_with_activity(2, profile_factory, blog_factory)
+
+    response = client.get(reverse("all-blogs"))
+    blog = response.json()["blogs"]["results"][0]
+
+    assert blog["likes"] == 1
+    assert blog["dislikes"] == 0
+    assert blog["num_ratings"] == 1
+    assert blog["average_rating"] == 4.0
+    assert blog["rating_histogram"] == {"1": 0, "2": 0, "3": 0, "4": 1, "5": 0}
+    assert blog["num_comments"] == 2
+    assert "comments" not in blog
+    assert blog["tagList"] == ["django"]
+
+
+@pytest.mark.django_db
+def test_blog_list_embeds_comments_on_request(client, profile_factory, blog_factory):
+    """Test ?expand=comments embeds the first comments_limit comments"""
+    create_blogs_with_activity(2, profile_factory, blog_factory)
+
+    response = client.get(
+        reverse("all-blogs"), {"expand": "comments", "comments_limit": 1}
+    )
+    blogs = response.json()["blogs"]["results"]
+
+    assert [len(blog["comments"]) for blog in blogs] == [1, 1]
+    assert blogs[0]["comments"][0]["body"] == "Nice read"
+    assert blogs[0]["num_comments"] == 2
+
+
+@pytest.mark.django_db
+def test_blog_list_pages_with_cursors(client, profile_factory, blog_factory):
+    """Test blog pages don't shift when a blog is published meanwhile"""
+    author = profile_factory().user
+    titles = [blog_factory(author=author).title for _ in range(7)]
+
+    first_page = client.get(reverse("all-blogs"), {"count": "true"}).json()["blogs"]
+    blog_factory(author=author)
+    second_page = client.get(first_page["next"]).json()["blogs"]
+
+    newest_first = titles[::-1]
+    assert first_page["approximate_count"] == 7
+    assert [blog["title"] for blog in first_page["results"]] == newest_first[:5]
+    assert [blog["title"] for blog in second_page["results"]] == newest_first[5:]
+    assert second_page["next"] is None
+    previous_page = client.get(second_page["previous"]).json()["blogs"]
+    assert [blog["title"] for blog in previous_page["results"]] == newest_first[:5]
+
+
+@pytest.mark.django_db
+def test_blog_list_rejects_cursors_with_bad_values(client):
+    """Test well formed cursors carrying values of the wrong type are a 404"""
+    url = reverse("all-blogs")
+    for key in (["garbage", "x"], [None, 1], ["2024-01-01T00:00:00", [1]]):
+        payload = json.dumps({"k": key, "r": 0}).encode()
+        cursor = base64.urlsafe_b64encode(payload).decode()
+
+        response = client.get(url, {"cursor": cursor})
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_blog_list_sparse_fieldset_prunes_queries(
+    client, profile_factory, blog_factory
+):
+    """Test ?fields= trims the payload and skips unused prefetches"""
+    create_blogs_with_activity(2, profile_factory, blog_factory)
+    full_queries = count_list_queries(client)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("all-blogs"), {"fields": "title,slug"})
+    blogs = response.json()["blogs"]["results"]
+
+    assert [set(blog) for blog in blogs] == [{"id", "title", "slug"}] * 2
+    assert len(queries) == full_queries - 2  # no tags or ratings prefetch
+    loaded = next(q["sql"] for q in queries if "IN (" in q["sql"])
+    assert '"body"' not in loaded
+
+
+@pytest.mark.django_db
+def test_blog_list_errors_are_not_enveloped(client):
+    """Test error responses of the blog list keep the handler's shape"""
+    response = client.get(
+        reverse("all-blogs"), {"expand": "comments", "comments_limit": "many"}
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "status_code": 400,
+        "errors": {"comments_limit": "A whole number is required."},
+    }
+
+
+@pytest.mark.django_db
+def test_blog_list_filters_by_author_username_and_prefix(
+    client, profile_factory, blog_factory
+):
+    """Test the username filter and the prefix match mode"""
+    ada = profile_factory(user__username="ada_l").user
+    blog_factory(author=ada, title="Notes on engines")
+    blog_factory(author=profile_factory().user, title="Engines and notes")
+
+    def titles(**params):
+        response = client.get(reverse("all-blogs"), params)
+        assert response.status_code == 200
+        return sorted(blog["title"] for blog in response.json()["blogs"]["results"])
+
+    assert titles(author_username="DA_") == ["Notes on engines"]
+    assert titles(title="notes") == ["Engines and notes", "Notes on engines"]
+    assert titles(title="notes", match="prefix") == ["Notes on engines"]
+    assert titles(author_username="da_", match="prefix") == []
+
+
+@pytest.mark.django_db
+def test_blog_export_streams_updated_blogs(profile_factory, blog_factory):
+    """Test staff can stream blogs updated since a time as NDJSON and CSV"""
+    author = profile_factory().user
+    old = blog_factory(author=author)
+    Blog.objects.filter(pkid=old.pkid).update(
+        updated_at=timezone.now() - timedelta(days=2)
+    )
+    recent = blog_factory(author=author, tags=[Tag.objects.create(tag="django")])
+    client = APIClient()
+    client.force_authenticate(profile_factory(user__is_staff=True).user)
+    since = (timezone.now() - timedelta(days=1)).isoformat()
+
+    response = client.get(reverse("export-blogs"), {"updated_since": since})
+    rows = [
+        json.loads(line) for line in b"".join(response.streaming_content).splitlines()
+    ]
+    assert response["Content-Type"] == "application/x-ndjson; charset=utf-8"
+    assert [row["slug"] for row in rows] == [recent.slug]
+    assert rows[0]["tags"] == ["django"]
+
+    response = client.get(reverse("export-blogs"), {"format": "csv"})
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    assert lines[0].startswith("id,title,slug,author,tags")
+    assert len(lines) == 3
+
+
+@pytest.mark.django_db
+def test_blog_export_is_staff_only(profile_factory):
+    """Test non-staff users can't export blogs"""
+    client = APIClient()
+    client.force_authenticate(profile_factory().user)
+
+    assert client.get(reverse("export-blogs")).status_code == 403
+
+
+@pytest.mark.django_db
+def test_blog_export_rejects_invalid_dates(profile_factory):
+    """Test malformed and out of range updated_since values are a 400"""
+    client = APIClient()
+    client.force_authenticate(profile_factory(user__is_staff=True).user)
+
+    for since in ("yesterday", "2024-02-30T00:00:00"):
+        response = client.get(reverse("export-blogs"), {"updated_since": since})
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_feed_pages_followed_authors_blogs(profile_factory, blog_factory, settings):
+    """Test the feed pages through followed authors' blogs, newest first"""
+    settings.FEED_FAN_OUT_LIMIT = 1
+    reader, author, popular, stranger = (profile_factory() for _ in range(4))
+    reader.follow(author)
+    reader.follow(popular)
+    profile_factory().follow(popular)
+    blogs = [
+        blog_factory(author=profile.user)
+        for profile in (author, popular, stranger, author)
+    ]
+    client = APIClient()
+    client.force_authenticate(reader.user)
+
+    first = client.get(reverse("blog-feed"), {"page_size": 2}).json()["blogs"]
+    second = client.get(first["next"]).json()["blogs"]
+
+    expected = [str(blog.id) for blog in (blogs[3], blogs[1], blogs[0])]
+    assert [blog["id"] for blog in first["results"]] == expected[:2]
+    assert [blog["id"] for blog in second["results"]] == expected[2:]
+    assert second["next"] is None
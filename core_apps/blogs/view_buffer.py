@@ -0,0 +1,124 @@
+import logging
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import F
+from django.http import HttpRequest
+from redis.exceptions import RedisError
+
+from core_apps.blogs.models import Blog, BlogViews
+from core_apps.common.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Set of blog pkids that have buffered views waiting to be flushed
+DIRTY_BLOGS_KEY = "blogs:views:dirty"
+# Set of viewer IPs buffered for a blog, formatted with the blog pkid
+PENDING_VIEWS_KEY = "blogs:views:pending:{pkid}"
+
+
+def get_client_ip(request: HttpRequest) -> Optional[str]:
+    """
+    Get the IP address a request was made from.
+
+    Args:
+    - request (HttpRequest): The HTTP request.
+
+    Returns:
+    - Optional[str]: The first X-Forwarded-For address if present,
+        otherwise REMOTE_ADDR.
+    """
+    x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if x_forwarded_for:
+        return x_forwarded_for.split(",")[0].strip()
+    return request.META.get("REMOTE_ADDR")
+
+
+def record_view(blog_pkid: int, ip: Optional[str]) -> None:
+    """
+    Buffer a view of a blog in Redis.
+
+    The IP is added to a per-blog set so repeat views within a flush
+        window collapse into one entry, and the blog is marked dirty
+        for flush_views. Nothing is written to the database. Redis
+        errors are logged and the view is dropped, so a Redis outage
+        never fails the request.
+
+    Args:
+    - blog_pkid (int): The pkid of the blog that was viewed.
+    - ip (Optional[str]): The IP address of the viewer.
+    """
+    if not ip:
+        return
+    try:
+        client = get_redis()
+        pipeline = client.pipeline(transaction=False)
+        pipeline.sadd(PENDING_VIEWS_KEY.format(pkid=blog_pkid), ip)
+        pipeline.sadd(DIRTY_BLOGS_KEY, blog_pkid)
+        pipeline.execute()
+    except RedisError as exc:
+        logger.warning(f"could not buffer view of blog {blog_pkid}: {exc}")
+
+
+def apply_views(blog_pkid: int, ips: Iterable[str]) -> int:
+    """
+    Persist a batch of viewer IPs for a blog.
+
+    IPs that already have a BlogViews row are skipped by the
+        ON CONFLICT insert of BlogViewsManager.record_many; the number
+        of new rows is added to Blog.views with a single F() update,
+        which neither holds the row lock for a request nor re-runs the
+        slug generation of Blog.save.
+
+    Args:
+    - blog_pkid (int): The pkid of the viewed blog.
+    - ips (Iterable[str]): The viewer IP addresses.
+
+    Returns:
+    - int: Number of new views recorded.
+    """
+    with transaction.atomic():
+        if not Blog.objects.filter(pkid=blog_pkid).exists():
+            # The blog was deleted since the views were buffered
+            return 0
+        new_ips = BlogViews.objects.record_many(blog_pkid, ips)
+        if new_ips:
+            Blog.objects.filter(pkid=blog_pkid).update(views=F("views") + len(new_ips))
+    return len(new_ips)
+
+
+def flush_views() -> int:
+    """
+    Move buffered views from Redis into the database.
+
+    Each dirty blog's pending set is read and deleted in one MULTI/EXEC
+        so views buffered during the flush land in the next one.
+
+    Returns:
+    - int: Number of new views recorded across all blogs.
+    """
+    client = get_redis()
+    recorded = 0
+    while True:
+        blog_pkid = client.spop(DIRTY_BLOGS_KEY)
+        if blog_pkid is None:
+            return recorded
+        blog_pkid = int(blog_pkid)
+        key = PENDING_VIEWS_KEY.format(pkid=blog_pkid)
+
+        pipeline = client.pipeline(transaction=True)
+        pipeline.smembers(key)
+        pipeline.delete(key)
+        ips, _ = pipeline.execute()
+        if not ips:
+            continue
+
+        try:
+            recorded += apply_views(blog_pkid, (ip.decode() for ip in ips))
+        except Exception:
+            # Put the batch back so the next flush retries it
+            pipeline = client.pipeline(transaction=False)
+            pipeline.sadd(key, *ips)
+            pipeline.sadd(DIRTY_BLOGS_KEY, blog_pkid)
+            pipeline.execute()
+            raise
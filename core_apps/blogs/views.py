@@ -1,30 +1,43 @@
 import logging
 from typing import Dict, List
 
-import redis
 from django.conf import settings
 from django.contrib.auth import get_user_model
-
-# Redis cache imports
 from django.core.cache import cache
-from django.http import HttpRequest
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.http import HttpRequest, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, generics, permissions, status
+from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
 
-from core_apps.blogs.models import Blog, BlogViews
+from core_apps.blogs.models import Blog
+from core_apps.common.serializers import get_sparse_fieldset
 
+from .cache import FRAGMENT_KEY_FIELDS, detail_cache_key, list_cache_key
 from .exceptions import UpdateBlog
+from .export import export_blogs, stream_csv, stream_ndjson
+from .feed import decode_cursor, encode_cursor, read_feed
 from .filters import BlogFilter
 from .pagination import BlogPagination
 from .permissions import IsOwnerOrReadOnly
-from .renderers import BlogJSONRenderer, BlogsJSONRenderer
-from .serializers import BlogCreateSerializer, BlogSerializer, BlogUpdateSerializer
+from .renderers import (
+    BlogCSVRenderer,
+    BlogJSONRenderer,
+    BlogNDJSONRenderer,
+    BlogsJSONRenderer,
+)
+from .serializers import (
+    BlogCreateSerializer,
+    BlogSerializer,
+    BlogUpdateSerializer,
+    get_comments_limit,
+)
+from .view_buffer import get_client_ip, record_view
 
 User = get_user_model()
 
@@ -38,33 +51,103 @@ class BlogListAPIView(generics.ListAPIView):
     Attributes:
     - serializer_class: The serializer class for blogs.
     - permission_classes: The permission classes for accessing this view.
-    - queryset: The queryset containing all blogs.
+    - queryset: The queryset containing all blogs. Only the columns
+        the fragment cache and the pagination cursor are keyed on are
+        loaded; blogs missing from the cache are loaded in full by the
+        serializer.
     - renderer_classes: The renderer classes for rendering the response.
-    - pagination_class: The pagination class for paginating the results.
+    - pagination_class: The pagination class for paginating the results,
+        which also reads ?ordering=created_at|-created_at.
     - filter_backends: The filter backends used for filtering the queryset.
     - filterset_class: The filter set class used for filtering.
-    - ordering_fields: The fields available for ordering the queryset.
+
+    Methods:
+    - list: List blogs, serving the response from the cache when the
+        blogs it depends on haven't changed.
     """
 
     serializer_class = BlogSerializer
     permission_classes = [
         permissions.AllowAny,
     ]
-    queryset = Blog.objects.all()
+    queryset = Blog.objects.only(*FRAGMENT_KEY_FIELDS, "created_at")
     renderer_classes = (BlogsJSONRenderer,)
     pagination_class = BlogPagination
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend]
     filterset_class = BlogFilter
-    ordering_fields = ["created_at", "username"]
 
-    # Redis cache configuration
-    redis_instance = redis.StrictRedis(
-        host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0
-    )
+    def list(self, request: HttpRequest, *args: List, **kwargs: Dict) -> Response:
+        """
+        List blogs.
+
+        Responses are cached under a key versioned by the blogs they
+            depend on (see core_apps.blogs.cache), so changes to blogs
+            and their activity show up immediately.
+
+        Args:
+        - request (HttpRequest): The HTTP request.
+        - args (List): Additional positional arguments.
+        - kwargs (Dict): Additional keyword arguments.
+
+        Returns:
+        - Response: The HTTP response.
+        """
+        key = list_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        cache.set(key, response.data, settings.BLOG_CACHE_TIMEOUT)
+        return response
+
+
+class BlogFeedAPIView(APIView):
+    """
+    List the blogs of the authors the requesting user follows.
+
+    Attributes:
+    - permission_classes: The permission classes for accessing this view.
+    - renderer_classes: The renderer classes for rendering the response.
+    - cursor_query_param: Query parameter carrying the cursor.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = (BlogsJSONRenderer,)
+    cursor_query_param = "cursor"
+
+    def get(self, request: HttpRequest) -> Response:
+        """
+        Get a page of the feed, newest first.
+
+        The page is read from the user's timeline (see
+            core_apps.blogs.feed) and serialized through the fragment
+            cache shared with the blog list. Pages are cursor based;
+            follow the next link to read on. ?page_size= works as on
+            the blog list.
+
+        Args:
+        - request (HttpRequest): The HTTP request.
 
-    @method_decorator(cache_page(60 * 60 * 2))  # Cache for 2 hours
-    def dispatch(self, *args, **kwargs):
-        return super(BlogListAPIView, self).dispatch(*args, **kwargs)
+        Returns:
+        - Response: The HTTP response.
+        """
+        cursor = request.query_params.get(self.cursor_query_param)
+        page_size = BlogPagination().get_page_size(request)
+        blogs, next_cursor = read_feed(
+            request.user.profile.pkid,
+            decode_cursor(cursor) if cursor else None,
+            page_size,
+        )
+        next_link = None
+        if next_cursor is not None:
+            next_link = replace_query_param(
+                request.build_absolute_uri(),
+                self.cursor_query_param,
+                encode_cursor(next_cursor),
+            )
+        serializer = BlogSerializer(blogs, many=True, context={"request": request})
+        return Response({"next": next_link, "results": serializer.data})
 
 
 class BlogCreateAPIView(generics.CreateAPIView):
@@ -108,9 +191,6 @@ class BlogCreateAPIView(generics.CreateAPIView):
             created by {user.username}"
         )
 
-        # Clear the cache
-        cache.delete("BlogListAPIView")
-
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
@@ -130,6 +210,13 @@ class BlogDetailView(APIView):
         """
         Get a blog by slug.
 
+        The response is cached under a key versioned by the blog, so
+            it is served without touching the database until the blog
+            or its activity changes. On a miss the blog is serialized
+            through the fragment cache shared with the blog list.
+            Comments are only embedded with ?expand=comments, and
+            ?fields=/?omit= select the fields returned.
+
         Args:
         - request (HttpRequest): The HTTP request.
         - slug (str): The slug of the blog.
@@ -137,24 +224,30 @@ class BlogDetailView(APIView):
         Returns:
         - Response: The HTTP response.
         """
-        blog = Blog.objects.get(slug=slug)
-
-        # Getting IP address of user to increase blogs view count
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(",")[0]
-        else:
-            ip = request.META.get("REMOTE_ADDR")
-
-        if not BlogViews.objects.filter(blog=blog, ip=ip).exists():
-            BlogViews.objects.create(blog=blog, ip=ip)
-
-            blog.views += 1
-            blog.save()
+        selected, omitted = get_sparse_fieldset(request)
+        key = detail_cache_key(
+            slug,
+            get_comments_limit(request),
+            sorted(selected) if selected is not None else None,
+            sorted(omitted),
+        )
+        cached = cache.get(key)
+        if cached is None:
+            try:
+                blog = Blog.objects.only(*FRAGMENT_KEY_FIELDS).get(slug=slug)
+            except Blog.DoesNotExist:
+                raise NotFound("That blog does not exist in our catalog")
+            serializer = BlogSerializer([blog], many=True, context={"request": request})
+            data = serializer.data
+            if not data:
+                raise NotFound("That blog does not exist in our catalog")
+            cached = {"pkid": blog.pkid, "data": data[0]}
+            cache.set(key, cached, settings.BLOG_CACHE_TIMEOUT)
 
-        serializer = BlogSerializer(blog, context={"request": request})
+        # Views are buffered in Redis and persisted by the flush_blog_views task
+        record_view(cached["pkid"], get_client_ip(request))
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(cached["data"], status=status.HTTP_200_OK)
 
 
 @api_view(["PATCH"])
@@ -227,3 +320,62 @@ class BlogDeleteAPIView(generics.DestroyAPIView):
             data["failure"] = "Deletion failed"
 
         return Response(data=data)
+
+
+class BlogExportView(APIView):
+    """
+    Stream every blog as NDJSON (default) or CSV (?format=csv).
+
+    Blogs are read through a server-side cursor in batches and written
+        out as they are read, so worker memory stays flat however many
+        blogs there are. ?updated_since=<ISO datetime> exports only the
+        blogs updated since a previous export.
+
+    Attributes:
+    - permission_classes: Only staff users can export.
+    - renderer_classes: The export formats, picked by ?format= or the
+        Accept header.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    renderer_classes = [BlogNDJSONRenderer, BlogCSVRenderer]
+
+    def get(self, request: HttpRequest) -> StreamingHttpResponse:
+        """
+        Stream the export.
+
+        Args:
+        - request (HttpRequest): The HTTP request.
+
+        Returns:
+        - StreamingHttpResponse: The streamed blogs.
+
+        Raises:
+        - ValidationError: If updated_since is not an ISO datetime.
+        """
+        updated_since = request.query_params.get("updated_since")
+        if updated_since:
+            try:
+                parsed = parse_datetime(updated_since)
+            except ValueError:
+                # Well formed but out of range, e.g. February 30th
+                parsed = None
+            if parsed is None:
+                raise ValidationError(
+                    {"updated_since": "An ISO 8601 datetime is required."}
+                )
+            if timezone.is_naive(parsed):
+                parsed = timezone.make_aware(parsed)
+            updated_since = parsed
+
+        batches = export_blogs(updated_since=updated_since or None)
+        renderer = request.accepted_renderer
+        stream = stream_csv if renderer.format == "csv" else stream_ndjson
+        response = StreamingHttpResponse(
+            stream(batches),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="blogs.{renderer.format}"'
+        return response
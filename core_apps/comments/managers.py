@@ -0,0 +1,67 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+from django.db import models
+from django.db.models import OuterRef, Subquery
+
+
+class CommentQuerySet(models.QuerySet):
+    """
+    Custom queryset for the Comment model.
+
+    Methods:
+    - for_blog: Comments of a blog in thread order.
+    - first_per_blog: The first comments of several blogs.
+    """
+
+    def for_blog(self, blog_pkid: int, with_authors: bool = True) -> "CommentQuerySet":
+        """
+        Comments of a blog, oldest first.
+
+        The filter and ordering are served by the (blog, created_at)
+            index, so a page is read without sorting every comment.
+
+        Args:
+        - blog_pkid (int): The pkid of the blog.
+        - with_authors (bool): Whether to join the comment authors.
+
+        Returns:
+        - CommentQuerySet: The comments of the blog.
+        """
+        comments = self.filter(blog_id=blog_pkid).order_by("created_at", "pkid")
+        if with_authors:
+            comments = comments.select_related("author__user")
+        return comments
+
+    def first_per_blog(
+        self, blog_pkids: Iterable[int], limit: int
+    ) -> Dict[int, List[models.Model]]:
+        """
+        Load the first comments of several blogs with one query.
+
+        Each blog's comments are capped by a correlated LIMIT subquery,
+            so a blog with thousands of comments loads no more rows
+            than one with a handful.
+
+        Args:
+        - blog_pkids (Iterable[int]): The pkids of the blogs.
+        - limit (int): Maximum number of comments per blog.
+
+        Returns:
+        - Dict[int, List[Comment]]: The comments of each blog, oldest
+            first, keyed by blog pkid.
+        """
+        first_comments = (
+            self.model._default_manager.filter(blog_id=OuterRef("blog_id"))
+            .order_by("created_at", "pkid")
+            .values("pkid")[:limit]
+        )
+        comments = (
+            self.filter(blog_id__in=list(blog_pkids), pkid__in=Subquery(first_comments))
+            .select_related("author__user")
+            .order_by("created_at", "pkid")
+        )
+        by_blog: Dict[int, List[models.Model]] = defaultdict(list)
+        for comment in comments:
+            by_blog[comment.blog_id].append(comment)
+        return by_blog
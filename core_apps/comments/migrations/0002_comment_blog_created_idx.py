@@ -0,0 +1,19 @@
+# Generated by Django 3.2.11 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comments", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["blog", "created_at"], name="comment_blog_created_idx"
+            ),
+        ),
+    ]
@@ -1,8 +1,12 @@
+from typing import List
+
 from django.contrib.auth import get_user_model
 from django.db import models
 
 from core_apps.common.models import TimeStampedUUIDModel
 
+from .managers import CommentQuerySet
+
 # Get User Model
 User = get_user_model()
 
@@ -25,6 +29,23 @@ class Comment(TimeStampedUUIDModel):
     author = models.ForeignKey("profiles.Profile", on_delete=models.CASCADE)
     body = models.TextField()
 
+    objects = CommentQuerySet.as_manager()
+
+    class Meta(TimeStampedUUIDModel.Meta):
+        """
+        Metadata options for the Comment model.
+
+        Attributes:
+        - indexes (list): Composite index serving a blog's comments in
+            creation order for cursor pagination.
+        """
+
+        indexes: List[models.Index] = [
+            models.Index(
+                fields=["blog", "created_at"], name="comment_blog_created_idx"
+            ),
+        ]
+
     def __str__(self) -> str:
         """
         Return a string representation of the comment.
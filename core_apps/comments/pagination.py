@@ -0,0 +1,17 @@
+from rest_framework.pagination import CursorPagination
+
+
+class CommentCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the comments of a blog.
+
+    Pages are read from the (blog, created_at) index with a
+        created_at > cursor filter, so deep pages cost the same as the
+        first one and no count query is run.
+    """
+
+    # Oldest comments first, in thread order
+    ordering = "created_at"
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from core_apps.common.serializers import DATETIME_FORMAT, SparseFieldsetMixin
+
 from .models import Comment
 
 User = get_user_model()
@@ -13,42 +15,14 @@ class CommentSerializer(serializers.ModelSerializer):
     This serializer serializes individual comment objects.
 
     Attributes:
-    - created_at (SerializerMethodField): Method field
-        to serialize creation date.
-    - updated_at (SerializerMethodField): Method field
-        to serialize last update date.
+    - created_at (DateTimeField): Creation date,
+        formatted with DATETIME_FORMAT.
+    - updated_at (DateTimeField): Last update date,
+        formatted with DATETIME_FORMAT.
     """
 
-    created_at = serializers.SerializerMethodField()
-    updated_at = serializers.SerializerMethodField()
-
-    def get_created_at(self, obj) -> str:
-        """
-        Get the creation date of the comment.
-
-        Args:
-        - obj: The comment object.
-
-        Returns:
-        - str: The formatted creation date string.
-        """
-        now = obj.created_at
-        formatted_date = now.strftime("%m/%d/%Y, %H:%M:%S")
-        return formatted_date
-
-    def get_updated_at(self, obj: Comment) -> str:
-        """
-        Get the last update date of the comment.
-
-        Args:
-        - obj (Comment): The comment object.
-
-        Returns:
-        - str: The formatted last update date string.
-        """
-        then = obj.updated_at
-        formatted_date = then.strftime("%m/%d/%Y, %H:%M:%S")
-        return formatted_date
+    created_at = serializers.DateTimeField(format=DATETIME_FORMAT, read_only=True)
+    updated_at = serializers.DateTimeField(format=DATETIME_FORMAT, read_only=True)
 
     class Meta:
         """
@@ -63,64 +37,56 @@ class CommentSerializer(serializers.ModelSerializer):
         fields = ["id", "author", "blog", "body", "created_at", "updated_at"]
 
 
-class CommentListSerializer(serializers.ModelSerializer):
+class CommentListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for lists of comments.
 
-    This serializer serializes lists of comment objects.
+    This serializer serializes lists of comment objects. ?fields= and
+        ?omit= select the fields returned.
 
     Attributes:
     - author (ReadOnlyField): Read-only field to serialize
         comment author's username.
     - blog (ReadOnlyField): Read-only field to serialize
         blog title.
-    - created_at (SerializerMethodField): Method field to
-        serialize creation date.
-    - updated_at (SerializerMethodField): Method field to
-        serialize last update date.
+    - created_at (DateTimeField): Creation date,
+        formatted with DATETIME_FORMAT.
+    - updated_at (DateTimeField): Last update date,
+        formatted with DATETIME_FORMAT.
     """
 
     author = serializers.ReadOnlyField(source="author.user.username")
     blog = serializers.ReadOnlyField(source="blog.title")
-    created_at = serializers.SerializerMethodField()
-    updated_at = serializers.SerializerMethodField()
+    created_at = serializers.DateTimeField(format=DATETIME_FORMAT, read_only=True)
+    updated_at = serializers.DateTimeField(format=DATETIME_FORMAT, read_only=True)
 
-    def get_created_at(self, obj: Comment) -> str:
+    class Meta:
         """
-        Get the creation date of the comment.
-
-        Args:
-        - obj (Comment): The comment object.
+        Meta class for CommentListSerializer.
 
-        Returns:
-        - str: The formatted creation date string.
+        Attributes:
+        - model (Comment): The Comment model to serialize.
+        - fields (list): The fields to include in the serialization.
         """
-        now = obj.created_at
-        formatted_date = now.strftime("%m/%d/%Y, %H:%M:%S")
-        return formatted_date
 
-    def get_updated_at(self, obj: Comment) -> str:
-        """
-        Get the last update date of the comment.
+        model = Comment
+        fields = ["id", "author", "blog", "body", "created_at", "updated_at"]
 
-        Args:
-        - obj (Comment): The comment object.
 
-        Returns:
-        - str: The formatted last update date string.
-        """
-        then = obj.updated_at
-        formatted_date = then.strftime("%m/%d/%Y, %H:%M:%S")
-        return formatted_date
+class CommentPreviewSerializer(CommentListSerializer):
+    """
+    Serializer for comments embedded in a serialized blog.
 
-    class Meta:
+    Same as CommentListSerializer without the blog title, which the
+        enclosing blog already carries.
+    """
+
+    class Meta(CommentListSerializer.Meta):
         """
-        Meta class for CommentListSerializer.
+        Meta class for CommentPreviewSerializer.
 
         Attributes:
-        - model (Comment): The Comment model to serialize.
         - fields (list): The fields to include in the serialization.
         """
 
-        model = Comment
-        fields = ["id", "author", "blog", "body", "created_at", "updated_at"]
+        fields = ["id", "author", "body", "created_at", "updated_at"]
@@ -0,0 +1,32 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core_apps.blogs.models import BlogStats
+from core_apps.comments.models import Comment
+
+
+@pytest.mark.django_db
+def test_comments_are_cursor_paginated(profile_factory, blog_factory):
+    """Test the comments endpoint pages through comments oldest first"""
+    reader = profile_factory()
+    blog = blog_factory(author=profile_factory().user)
+    for number in range(5):
+        Comment.objects.create(blog=blog, author=reader, body=f"comment {number}")
+    BlogStats.objects.rebuild()
+    client = APIClient()
+    client.force_authenticate(reader.user)
+
+    url = reverse("comments", kwargs={"slug": blog.slug})
+    first_page = client.get(url, {"page_size": 3}).json()
+    second_page = client.get(first_page["next"]).json()
+
+    assert first_page["num_comments"] == 5
+    assert [c["body"] for c in first_page["comments"]] == [
+        "comment 0",
+        "comment 1",
+        "comment 2",
+    ]
+    assert [c["body"] for c in second_page["comments"]] == ["comment 3", "comment 4"]
+    assert second_page["next"] is None
+    assert second_page["comments"][0]["blog"] == blog.title
@@ -1,13 +1,16 @@
 from typing import Dict
 
+from django.db import transaction
+from django.db.models import F
 from rest_framework import generics, permissions, status
 from rest_framework.exceptions import NotFound
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from core_apps.blogs.models import Blog
+from core_apps.blogs.models import Blog, BlogStats
 
 from .models import Comment
+from .pagination import CommentCursorPagination
 from .serializers import CommentListSerializer, CommentSerializer
 
 
@@ -16,8 +19,7 @@ class CommentAPIView(generics.GenericAPIView):
     API view for handling comment creation and retrieval.
 
     This view allows authenticated users to create new comments
-    on blogs and retrieve all comments associated with
-        a specific blog.
+    on blogs and page through the comments of a specific blog.
 
     Permissions:
     - IsAuthenticated: Only authenticated users are allowed
@@ -25,11 +27,12 @@ class CommentAPIView(generics.GenericAPIView):
 
     Methods:
     - post: Create a new comment.
-    - get: Retrieve all comments for a blog.
+    - get: Retrieve a page of comments for a blog.
     """
 
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = CommentSerializer
+    pagination_class = CommentCursorPagination
 
     def post(self, request: Request, **kwargs: Dict) -> Response:
         """
@@ -54,12 +57,19 @@ class CommentAPIView(generics.GenericAPIView):
         comment["blog"] = blog.pkid
         serializer = self.serializer_class(data=comment)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        with transaction.atomic():
+            serializer.save()
+            BlogStats.objects.increment(blog, comments_count=1)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def get(self, request: Request, **kwargs: Dict) -> Response:
         """
-        Retrieve all comments for a blog.
+        Retrieve a page of comments for a blog, oldest first.
+
+        Pages are cursor based; follow the next link to read on.
+            num_comments is the blog's stored comment count, so no
+            count query is run. ?fields= and ?omit= select the comment
+            fields returned.
 
         Args:
         - request (HttpRequest): The HTTP request object.
@@ -70,20 +80,34 @@ class CommentAPIView(generics.GenericAPIView):
         """
         try:
             slug = self.kwargs.get("slug")
-            blog = Blog.objects.get(slug=slug)
+            blog = (
+                Blog.objects.annotate(num_comments=F("stats__comments_count"))
+                .only("pkid", "title")
+                .get(slug=slug)
+            )
         except Blog.DoesNotExist:
             raise NotFound("That blog does not exist in our catalog")
 
-        try:
-            comments = Comment.objects.filter(blog_id=blog.pkid)
-        except Comment.DoesNotExist:
-            raise NotFound("No comments found")
+        # Only join authors and read bodies when they are serialized
+        fields = set(CommentListSerializer(context={"request": request}).fields)
+        comments = Comment.objects.for_blog(blog.pkid, with_authors="author" in fields)
+        if "body" not in fields:
+            comments = comments.defer("body")
+        page = self.paginate_queryset(comments)
+        for comment in page:
+            # Every comment belongs to the blog already loaded
+            comment.blog = blog
 
         serializer = CommentListSerializer(
-            comments, many=True, context={"request": request}
+            page, many=True, context={"request": request}
         )
         return Response(
-            {"num_comments": len(serializer.data), "comments": serializer.data},
+            {
+                "num_comments": blog.num_comments or 0,
+                "next": self.paginator.get_next_link(),
+                "previous": self.paginator.get_previous_link(),
+                "comments": serializer.data,
+            },
             status=status.HTTP_200_OK,
         )
 
@@ -151,6 +175,8 @@ class CommentUpdateDeleteAPIView(generics.GenericAPIView):
         except Comment.DoesNotExist:
             raise NotFound("Comment does not exist")
 
-        comment_to_delete.delete()
+        with transaction.atomic():
+            comment_to_delete.delete()
+            BlogStats.objects.increment(comment_to_delete.blog, comments_count=-1)
         response = {"message": "Comment deleted successfully!"}
         return Response(response, status=status.HTTP_200_OK)
@@ -0,0 +1,104 @@
+import hashlib
+import time
+from typing import Any, Dict, Iterable, List
+
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY_PREFIX = "cache-version"
+
+
+def _version_key(namespace: str) -> str:
+    """Cache key holding the current version of a namespace."""
+    return f"{VERSION_KEY_PREFIX}:{namespace}"
+
+
+def _initial_version() -> int:
+    """
+    Version used when a namespace has no version yet.
+
+    Time based, so a version evicted from the cache never restarts at a
+        value whose entries may still be cached.
+    """
+    return time.time_ns() // 1000
+
+
+def get_versions(namespaces: Iterable[str]) -> Dict[str, int]:
+    """
+    Get the current versions of several namespaces in one round-trip.
+
+    Args:
+    - namespaces (Iterable[str]): The namespaces to look up.
+
+    Returns:
+    - Dict[str, int]: The version of each namespace.
+    """
+    namespaces = list(dict.fromkeys(namespaces))
+    keys = {_version_key(namespace): namespace for namespace in namespaces}
+    found = cache.get_many(keys)
+    versions = {keys[key]: version for key, version in found.items()}
+
+    missing = [namespace for namespace in namespaces if namespace not in versions]
+    if missing:
+        initial = _initial_version()
+        for namespace in missing:
+            # add() keeps a version set concurrently by another process
+            cache.add(_version_key(namespace), initial, timeout=None)
+        found = cache.get_many([_version_key(namespace) for namespace in missing])
+        for namespace in missing:
+            versions[namespace] = found.get(_version_key(namespace), initial)
+    return versions
+
+
+def bump_versions(namespaces: Iterable[str]) -> None:
+    """
+    Invalidate every entry cached under the given namespaces.
+
+    Entries are never deleted: the namespace version is incremented, so
+        keys built with the old version are no longer read and expire
+        on their own TTL.
+
+    Args:
+    - namespaces (Iterable[str]): The namespaces to invalidate.
+    """
+    for namespace in dict.fromkeys(namespaces):
+        key = _version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # No version yet, so nothing can be cached under this namespace
+            cache.add(key, _initial_version(), timeout=None)
+
+
+def bump_versions_on_commit(namespaces: Iterable[str]) -> None:
+    """
+    Bump namespace versions once the current transaction commits.
+
+    Bumping before the commit would let a concurrent request cache
+        the old rows again under the new version.
+
+    Args:
+    - namespaces (Iterable[str]): The namespaces to invalidate.
+    """
+    namespaces = list(namespaces)
+    transaction.on_commit(lambda: bump_versions(namespaces))
+
+
+def versioned_key(prefix: str, namespaces: Iterable[str], *parts: Any) -> str:
+    """
+    Build a cache key that changes whenever a namespace is bumped.
+
+    Args:
+    - prefix (str): Readable prefix of the key.
+    - namespaces (Iterable[str]): The namespaces the entry depends on.
+    - parts (Any): Further values identifying the entry, e.g. query
+        parameters.
+
+    Returns:
+    - str: The cache key.
+    """
+    versions = get_versions(namespaces)
+    fingerprint: List[str] = [f"{ns}={version}" for ns, version in versions.items()]
+    fingerprint.extend(str(part) for part in parts)
+    digest = hashlib.md5("|".join(fingerprint).encode()).hexdigest()
+    return f"{prefix}:{digest}"
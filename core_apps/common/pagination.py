@@ -0,0 +1,271 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+# Below this many estimated rows an exact COUNT(*) is cheap enough to run
+EXACT_COUNT_THRESHOLD = 1000
+
+
+def approximate_count(queryset: QuerySet) -> int:
+    """
+    Estimate the number of rows of a queryset without counting them.
+
+    On PostgreSQL the planner's row estimate for the query is read with
+        EXPLAIN, which doesn't scan the table; small estimates are
+        replaced by an exact count. Other databases count exactly.
+
+    Args:
+    - queryset (QuerySet): The queryset to count.
+
+    Returns:
+    - int: The estimated number of rows.
+    """
+    queryset = queryset.order_by()
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate < EXACT_COUNT_THRESHOLD:
+        return queryset.count()
+    return estimate
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination seeking on a unique key instead of an offset.
+
+    Rows are ordered by the fields of ordering, whose last field must be
+        unique. A page is read with a (a, b) < (x, y) condition on the
+        key of the last row seen, so every page costs an index range
+        scan no matter how deep it is, no COUNT(*) runs, and rows
+        inserted meanwhile never shift or repeat entries. Cursors are
+        opaque base64 tokens.
+
+    Attributes:
+    - ordering (Sequence[str]): Key fields, all in the same direction.
+    - page_size (int): Default number of rows per page.
+    - page_size_query_param (str): Query parameter overriding page_size.
+    - max_page_size (int): Largest page size a client may ask for.
+    - cursor_query_param (str): Query parameter carrying the cursor.
+    - count_query_param (str): Query parameter asking for an
+        approximate total count, e.g. ?count=true.
+    - ordering_query_param (str): Query parameter that can flip the
+        direction, e.g. ?ordering=created_at for oldest first.
+    """
+
+    ordering: Sequence[str] = ("-created_at", "-pkid")
+    page_size: int = 10
+    page_size_query_param: str = "page_size"
+    max_page_size: int = 100
+    cursor_query_param: str = "cursor"
+    count_query_param: str = "count"
+    ordering_query_param: str = "ordering"
+    invalid_cursor_message: str = "Invalid cursor"
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> List[Model]:
+        """
+        Read the page of rows the request's cursor points at.
+
+        Args:
+        - queryset (QuerySet): The filtered rows to paginate.
+        - request (Request): The request.
+        - view (Any): The view, if any.
+
+        Returns:
+        - List[Model]: The rows of the page, in order.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.key_ordering = self.get_ordering(request)
+        self.count = (
+            approximate_count(queryset) if self.count_requested(request) else None
+        )
+
+        cursor = self.decode_cursor(request, queryset.model)
+        reverse = cursor is not None and cursor[1]
+        ordering = self.key_ordering
+        if reverse:
+            ordering = tuple(self._flip(name) for name in ordering)
+        if cursor is not None:
+            queryset = queryset.filter(self._after(ordering, cursor[0]))
+
+        rows = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """
+        Wrap a serialized page with its links and optional count.
+
+        Args:
+        - data (Any): The serialized rows of the page.
+
+        Returns:
+        - Response: The paginated response.
+        """
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(
+        self, data: Any, results_key: str = "results"
+    ) -> OrderedDict:
+        """
+        Build the body of a paginated response.
+
+        Args:
+        - data (Any): The serialized rows of the page.
+        - results_key (str): The key the rows are returned under.
+
+        Returns:
+        - OrderedDict: The next and previous links, the approximate
+            count when requested, and the rows.
+        """
+        body = OrderedDict(
+            [("next", self.get_next_link()), ("previous", self.get_previous_link())]
+        )
+        if self.count is not None:
+            body["approximate_count"] = self.count
+        body[results_key] = data
+        return body
+
+    def get_page_size(self, request: Request) -> int:
+        """Page size asked for by the request, capped at max_page_size."""
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, request: Request) -> Tuple[str, ...]:
+        """
+        Key ordering of the request.
+
+        ?ordering=<first key field> or ?ordering=-<first key field>
+            sets the direction of the whole key; anything else keeps
+            the default ordering.
+        """
+        first = self.ordering[0].lstrip("-")
+        requested = request.query_params.get(self.ordering_query_param)
+        if requested not in (first, f"-{first}"):
+            return tuple(self.ordering)
+        prefix = "-" if requested.startswith("-") else ""
+        return tuple(prefix + name.lstrip("-") for name in self.ordering)
+
+    def count_requested(self, request: Request) -> bool:
+        """Whether the request asked for an approximate count."""
+        value = request.query_params.get(self.count_query_param, "")
+        return value.lower() in ("1", "true", "yes")
+
+    def get_next_link(self) -> Optional[str]:
+        """Link to the page after this one, if any."""
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        """Link to the page before this one, if any."""
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    def decode_cursor(
+        self, request: Request, model: Any
+    ) -> Optional[Tuple[List[Any], bool]]:
+        """
+        Decode the cursor of a request.
+
+        Each key value is converted with its model field's to_python, so
+            a cursor carrying values of the wrong type is rejected here
+            rather than when the page is queried.
+
+        Args:
+        - request (Request): The request.
+        - model (Any): The model class of the paginated rows.
+
+        Returns:
+        - Optional[Tuple[List[Any], bool]]: The key values to seek from
+            and whether to read backwards, or None on the first page.
+
+        Raises:
+        - NotFound: If the cursor is malformed.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            cursor = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            values, reverse = cursor["k"], bool(cursor["r"])
+            if len(values) != len(self.key_ordering):
+                raise ValueError("cursor does not match the ordering")
+            values = [
+                model._meta.get_field(name.lstrip("-")).to_python(value)
+                for name, value in zip(self.key_ordering, values)
+            ]
+            if None in values:
+                raise ValueError("cursor has a null key value")
+        except (binascii.Error, ValueError, KeyError, TypeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def _link(self, row: Model, reverse: bool) -> str:
+        """Build the link to the page seeking from a row."""
+        values = []
+        for name in self.key_ordering:
+            value = getattr(row, name.lstrip("-"))
+            values.append(value.isoformat() if hasattr(value, "isoformat") else value)
+        payload = json.dumps({"k": values, "r": int(reverse)}, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    @staticmethod
+    def _flip(name: str) -> str:
+        """Reverse the direction of an ordering field."""
+        return name[1:] if name.startswith("-") else f"-{name}"
+
+    def _after(self, ordering: Sequence[str], values: List[Any]) -> Q:
+        """
+        Build the condition selecting rows after a key in an ordering.
+
+        For (-a, -b) and (x, y) this is a < x OR (a = x AND b < y).
+        """
+        condition = Q()
+        for position, name in enumerate(ordering):
+            lookup = "lt" if name.startswith("-") else "gt"
+            equal = {
+                previous.lstrip("-"): values[index]
+                for index, previous in enumerate(ordering[:position])
+            }
+            condition |= Q(
+                **equal, **{f"{name.lstrip('-')}__{lookup}": values[position]}
+            )
+        return condition
@@ -0,0 +1,155 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import redis
+from django.conf import settings
+from django_redis.pool import ConnectionFactory
+from redis.connection import BlockingConnectionPool, Connection
+
+# Pools created in this process, keyed by Redis URL
+_pools: Dict[str, "InstrumentedConnectionPool"] = {}
+_pools_lock = threading.Lock()
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """
+    Blocking connection pool that records its utilization.
+
+    Once max_connections are checked out, callers wait up to timeout
+        seconds for one to be released instead of opening more, which
+        bounds the connections each worker process holds.
+
+    Attributes:
+    - peak_in_use (int): Highest number of connections checked out at once.
+    - waits (int): Number of checkouts made while every connection was
+        in use.
+    - exhausted (int): Number of checkouts that timed out waiting.
+    - wait_seconds (float): Total time spent waiting for a connection.
+    """
+
+    def reset(self) -> None:
+        """Reset the pool and its counters, e.g. after a fork."""
+        super().reset()
+        self.peak_in_use = 0
+        self.waits = 0
+        self.exhausted = 0
+        self.wait_seconds = 0.0
+
+    def get_connection(
+        self, command_name: str, *keys: Any, **options: Any
+    ) -> Connection:
+        """Check out a connection, recording waits and timeouts."""
+        # The queue holds idle connections and a None placeholder for each
+        # connection not opened yet, so it is only empty when all are in use
+        saturated = self.pool.empty()
+        started = time.monotonic()
+        try:
+            connection = super().get_connection(command_name, *keys, **options)
+        except redis.ConnectionError:
+            if saturated:
+                self.exhausted += 1
+            raise
+        finally:
+            if saturated:
+                self.waits += 1
+                self.wait_seconds += time.monotonic() - started
+        self.peak_in_use = max(self.peak_in_use, self.in_use_count())
+        return connection
+
+    def idle_count(self) -> int:
+        """Number of open connections waiting in the pool."""
+        return sum(1 for connection in self.pool.queue if connection is not None)
+
+    def in_use_count(self) -> int:
+        """Number of connections currently checked out."""
+        return len(self._connections) - self.idle_count()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Utilization metrics of the pool.
+
+        Returns:
+        - Dict[str, Any]: Connection counts and wait statistics.
+        """
+        return {
+            "max_connections": self.max_connections,
+            "created": len(self._connections),
+            "in_use": self.in_use_count(),
+            "idle": self.idle_count(),
+            "peak_in_use": self.peak_in_use,
+            "waits": self.waits,
+            "exhausted": self.exhausted,
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
+
+
+def get_connection_pool(url: Optional[str] = None) -> InstrumentedConnectionPool:
+    """
+    Get the process-wide connection pool for a Redis URL.
+
+    Pools are sized and configured from settings.REDIS_POOL_OPTIONS.
+
+    Args:
+    - url (Optional[str]): The Redis URL. Defaults to settings.REDIS_URL.
+
+    Returns:
+    - InstrumentedConnectionPool: The shared pool.
+    """
+    url = url or settings.REDIS_URL
+    pool = _pools.get(url)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(url)
+            if pool is None:
+                pool = InstrumentedConnectionPool.from_url(
+                    url, **settings.REDIS_POOL_OPTIONS
+                )
+                _pools[url] = pool
+    return pool
+
+
+def get_redis(url: Optional[str] = None) -> redis.Redis:
+    """
+    Get a Redis client backed by the shared connection pool.
+
+    Clients are cheap; connections are only taken from the pool while
+        a command runs.
+
+    Args:
+    - url (Optional[str]): The Redis URL. Defaults to settings.REDIS_URL.
+
+    Returns:
+    - redis.Redis: The client.
+    """
+    return redis.Redis(connection_pool=get_connection_pool(url))
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Utilization metrics of every pool in this process.
+
+    Returns:
+    - Dict[str, Dict[str, Any]]: The stats of each pool, keyed by
+        host:port/db.
+    """
+    stats = {}
+    for pool in _pools.values():
+        kwargs = pool.connection_kwargs
+        name = f"{kwargs.get('host', kwargs.get('path'))}:{kwargs.get('port', '')}/{kwargs.get('db', 0)}"
+        stats[name] = pool.stats()
+    return stats
+
+
+class SharedConnectionFactory(ConnectionFactory):
+    """
+    django-redis connection factory using the shared connection pool.
+
+    Selected with DJANGO_REDIS_CONNECTION_FACTORY so the cache, and the
+        throttling built on it, draw from the same bounded pool as
+        every other Redis consumer.
+    """
+
+    def get_or_create_connection_pool(self, params: Dict[str, Any]) -> Any:
+        """Return the shared pool for the cache's URL."""
+        return get_connection_pool(params["url"])
@@ -0,0 +1,66 @@
+from typing import Any, Dict, Optional
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+class EnvelopeJSONRenderer(JSONRenderer):
+    """
+    JSON renderer wrapping responses in a status code envelope.
+
+    Renders {"status_code": <status>, <envelope_key>: <data>}; error
+        responses, which the exception handler already wraps, are
+        rendered as they are. When orjson is installed it encodes the
+        body, handling UUIDs, datetimes and dict subclasses natively
+        and falling back to DRF's encoder for other types; otherwise,
+        and for indented output, DRF's JSONRenderer encodes it.
+
+    Attributes:
+    - envelope_key (str): Key the response data is rendered under.
+    - charset (str): Character encoding for the rendered JSON.
+    """
+
+    envelope_key: str = "data"
+    charset: str = "utf-8"
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """
+        Render the data inside its envelope.
+
+        Args:
+        - data (Any): Data to be rendered.
+        - accepted_media_type (Optional[str]): Media type accepted
+            by the renderer.
+        - renderer_context (Optional[Dict[str, Any]]): Context for
+            rendering.
+
+        Returns:
+        - bytes: Encoded JSON data.
+        """
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        if isinstance(data, dict) and data.get("errors") is not None:
+            body = data
+        else:
+            response = renderer_context.get("response")
+            status_code = response.status_code if response is not None else 200
+            body = {"status_code": status_code, self.envelope_key: data}
+
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if orjson is None or indent:
+            return super().render(body, accepted_media_type, renderer_context)
+        return orjson.dumps(
+            body,
+            default=self.encoder_class().default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
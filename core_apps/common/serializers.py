@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from typing import Any, Optional, Set, Tuple
+
+from rest_framework import serializers
+
+# Format of the created_at/updated_at timestamps in API responses
+DATETIME_FORMAT = "%m/%d/%Y, %H:%M:%S"
+
+# Query parameters selecting and excluding serializer fields
+FIELDS_QUERY_PARAM = "fields"
+OMIT_QUERY_PARAM = "omit"
+
+
+def _split(value: str) -> Set[str]:
+    """Split a comma separated query parameter into field names."""
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def get_sparse_fieldset(request: Any) -> Tuple[Optional[Set[str]], Set[str]]:
+    """
+    Read the sparse fieldset a request asks for.
+
+    Args:
+    - request (Any): The request, if any.
+
+    Returns:
+    - Tuple[Optional[Set[str]], Set[str]]: The fields selected with
+        ?fields=, or None when every field is wanted, and the fields
+        excluded with ?omit=.
+    """
+    if request is None:
+        return None, set()
+    params = getattr(request, "query_params", request.GET)
+    selected = params.get(FIELDS_QUERY_PARAM)
+    return (
+        _split(selected) if selected else None,
+        _split(params.get(OMIT_QUERY_PARAM, "")),
+    )
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin dropping fields not asked for by the request.
+
+    ?fields=a,b keeps only those fields and ?omit=c drops fields; id is
+        always kept so clients can address the rows. Only the
+        serializer the view returns is pruned, not serializers nested
+        in it. Views read the same fieldset to prune their queryset.
+
+    Methods:
+    - get_fields: The declared fields, pruned to the sparse fieldset.
+    """
+
+    def get_fields(self) -> "OrderedDict[str, serializers.Field]":
+        """
+        Get the fields to serialize.
+
+        Returns:
+        - OrderedDict[str, Field]: The declared fields the request
+            selected and didn't omit.
+        """
+        fields = super().get_fields()
+        if not self._is_top_level():
+            return fields
+        selected, omitted = get_sparse_fieldset(self.context.get("request"))
+        return OrderedDict(
+            (name, field)
+            for name, field in fields.items()
+            if name == "id"
+            or ((selected is None or name in selected) and name not in omitted)
+        )
+
+    def _is_top_level(self) -> bool:
+        """Whether this is the serializer, or list item, the view returns."""
+        parent = getattr(self, "parent", None)
+        if parent is None:
+            return True
+        return isinstance(parent, serializers.ListSerializer) and parent.parent is None
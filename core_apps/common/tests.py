@@ -1,3 +1,45 @@
-from django.test import TestCase
+import pytest
+import redis
+from django_redis.pool import ConnectionFactory
 
-# Create your tests here.
+from core_apps.common.redis_client import (
+    SharedConnectionFactory,
+    get_connection_pool,
+    get_redis,
+    pool_stats,
+)
+
+POOL_URL = "redis://localhost:6399/5"
+
+
+@pytest.fixture
+def pool(settings):
+    """Shared pool of a single connection that gives up waiting quickly."""
+    settings.REDIS_POOL_OPTIONS = {"max_connections": 1, "timeout": 0.01}
+    pool = get_connection_pool(POOL_URL)
+    yield pool
+    pool.reset()
+
+
+def test_clients_and_cache_share_one_pool(pool):
+    """Test that Redis clients and the django-redis cache use the same pool"""
+    factory = SharedConnectionFactory({})
+    params = factory.make_connection_params(POOL_URL)
+
+    assert get_redis(POOL_URL).connection_pool is pool
+    assert factory.get_or_create_connection_pool(params) is pool
+    assert isinstance(factory, ConnectionFactory)
+
+
+def test_pool_stats_count_exhausted_checkouts(pool):
+    """Test that a checkout timing out on a saturated pool is reported"""
+    # Take the only slot as if a connection were checked out
+    pool.pool.get_nowait()
+
+    with pytest.raises(redis.ConnectionError):
+        pool.get_connection("GET")
+
+    stats = pool_stats()["localhost:6399/5"]
+    assert stats["max_connections"] == 1
+    assert stats["waits"] == 1
+    assert stats["exhausted"] == 1
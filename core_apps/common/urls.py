@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import RedisPoolStatsAPIView
+
+urlpatterns = [
+    path("redis-pools/", RedisPoolStatsAPIView.as_view(), name="redis-pool-stats"),
+]
@@ -1,3 +1,29 @@
-from django.shortcuts import render
+from django.http import HttpRequest
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from .redis_client import pool_stats
+
+
+class RedisPoolStatsAPIView(APIView):
+    """
+    API view exposing the utilization of this process's Redis pools.
+
+    Attributes:
+    - permission_classes (list): Only staff users can read the metrics.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request: HttpRequest) -> Response:
+        """
+        Get the connection counts and wait statistics of each pool.
+
+        Args:
+        - request (HttpRequest): The HTTP request.
+
+        Returns:
+        - Response: The stats of each pool, keyed by host:port/db.
+        """
+        return Response(pool_stats())
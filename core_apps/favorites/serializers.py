@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from core_apps.blogs.serializers import BlogCreateSerializer
+
 from .models import Favorite
 
 
@@ -24,3 +26,18 @@ class FavoriteSerializer(serializers.ModelSerializer):
 
         model = Favorite
         fields = ["id", "user", "blog"]
+
+
+class FavoriteBlogSerializer(BlogCreateSerializer):
+    """
+    Serializer for a blog in a user's favorites list.
+
+    Expects blogs annotated by BlogQuerySet.with_rating_stats.
+
+    Attributes:
+    - average_rating: Readonly field for the average rating.
+    - num_ratings: Readonly field for the number of ratings.
+    """
+
+    average_rating = serializers.ReadOnlyField(source="get_average_rating")
+    num_ratings = serializers.ReadOnlyField(source="rating_count")
@@ -1,14 +1,14 @@
-from rest_framework.request import Request
+from django.db import transaction
 from rest_framework import generics, permissions, status
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from core_apps.blogs.models import Blog
-from core_apps.blogs.serializers import BlogCreateSerializer
+from core_apps.blogs.models import Blog, BlogStats
 
 from .exceptions import AlreadyFavorited
 from .models import Favorite
-from .serializers import FavoriteSerializer
+from .serializers import FavoriteBlogSerializer, FavoriteSerializer
 
 
 class FavoriteAPIView(generics.CreateAPIView):
@@ -52,7 +52,9 @@ class FavoriteAPIView(generics.CreateAPIView):
             data["user"] = user.pkid
             serializer = self.get_serializer(data=data)
             serializer.is_valid(raise_exception=True)
-            self.perform_create(serializer)
+            with transaction.atomic():
+                self.perform_create(serializer)
+                BlogStats.objects.increment(blog, favorites_count=1)
             data = serializer.data
             data["message"] = "Blog added to favorites."
             return Response(data, status=status.HTTP_201_CREATED)
@@ -83,14 +85,14 @@ class ListUserFavoriteBlogsAPIView(APIView):
         Returns:
         - Response: HTTP response object.
         """
-        Favorites = Favorite.objects.filter(user_id=request.user.pkid)
-
-        favorite_blogs = []
-        for favorite in Favorites:
-            blog = Blog.objects.get(pkid=favorite.blog.pkid)
-            blog = BlogCreateSerializer(
-                blog, context={"blog": blog.slug, "request": request}
-            ).data
-            favorite_blogs.append(blog)
+        blogs = (
+            Blog.objects.filter(blog_favorites__user_id=request.user.pkid)
+            .defer("search_vector")
+            .prefetch_related("tags")
+            .with_rating_stats()
+        )
+        favorite_blogs = FavoriteBlogSerializer(
+            blogs, many=True, context={"request": request}
+        ).data
         favorites = {"my_favorites": favorite_blogs}
         return Response(data=favorites, status=status.HTTP_200_OK)
@@ -0,0 +1,346 @@
+import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import QuerySet
+from django.dispatch import Signal
+from redis import Redis
+from redis.client import Pipeline
+from redis.exceptions import RedisError
+
+from core_apps.common.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Sets of the profile pkids a profile follows and is followed by,
+# formatted with the profile pkid
+FOLLOWING_KEY = "profiles:{pkid}:following"
+FOLLOWERS_KEY = "profiles:{pkid}:followers"
+# Member every loaded set holds, so a profile following no one is told
+# apart from one that isn't cached; pkids are never empty
+LOADED_MARKER = ""
+# Profiles whose sets are rebuilt per pipeline by rebuild_graph
+REBUILD_BATCH_SIZE = 500
+
+# Sent with pkids, the profiles whose follows changed, by record_follows and
+# forget, i.e. once the change is committed
+following_changed = Signal()
+
+# Apply SREM or SADD (ARGV[1]) of ARGV[i + 1] to each KEYS[i] that is
+# loaded, so a write never turns an uncached set into a partial one
+_APPLY_IF_LOADED = """
+for i, key in ipairs(KEYS) do
+    if redis.call("SISMEMBER", key, "") == 1 then
+        redis.call(ARGV[1], key, ARGV[i + 1])
+    end
+end
+"""
+
+
+def _follows() -> QuerySet:
+    """Get the rows of the Profile.follows through table."""
+    return apps.get_model("profiles", "Profile").follows.through.objects.all()
+
+
+def _load(pipeline: Pipeline, key: str, pkids: Iterable[int]) -> None:
+    """
+    Queue replacing a set with the marker and the given pkids.
+
+    The set expires SOCIAL_GRAPH_TIMEOUT seconds after it is loaded,
+        however often it is written through, so a set that missed a
+        follow committed between the database read and the load is
+        reloaded from the database rather than kept wrong.
+    """
+    pipeline.delete(key)
+    pipeline.sadd(key, LOADED_MARKER, *pkids)
+    pipeline.expire(key, settings.SOCIAL_GRAPH_TIMEOUT)
+
+
+def _ensure_loaded(client: Redis, pkid: int, *, followers: bool) -> str:
+    """
+    Load a profile's following or followers set if it isn't cached.
+
+    Args:
+    - client (Redis): The Redis client.
+    - pkid (int): The profile pkid.
+    - followers (bool): Load the followers set rather than following.
+
+    Returns:
+    - str: The key of the set.
+    """
+    key = (FOLLOWERS_KEY if followers else FOLLOWING_KEY).format(pkid=pkid)
+    if not client.sismember(key, LOADED_MARKER):
+        if followers:
+            pkids = (
+                _follows()
+                .filter(to_profile_id=pkid)
+                .values_list("from_profile_id", flat=True)
+            )
+        else:
+            pkids = (
+                _follows()
+                .filter(from_profile_id=pkid)
+                .values_list("to_profile_id", flat=True)
+            )
+        pipeline = client.pipeline(transaction=True)
+        _load(pipeline, key, pkids)
+        pipeline.execute()
+    return key
+
+
+def _members(client: Redis, *keys: str) -> Set[int]:
+    """Get the pkids in the intersection of loaded sets."""
+    members = client.sinter(*keys) if len(keys) > 1 else client.smembers(keys[0])
+    return {int(member) for member in members if member}
+
+
+def is_following(from_pkid: int, to_pkid: int) -> bool:
+    """
+    Check whether one profile follows another.
+
+    A single SISMEMBER once the follower's set is cached. Falls back to
+        the follows table if Redis is unavailable, as do the other
+        lookups here.
+
+    Args:
+    - from_pkid (int): The pkid of the following profile.
+    - to_pkid (int): The pkid of the followed profile.
+
+    Returns:
+    - bool: True if from_pkid follows to_pkid.
+    """
+    try:
+        client = get_redis()
+        key = _ensure_loaded(client, from_pkid, followers=False)
+        return bool(client.sismember(key, to_pkid))
+    except RedisError as exc:
+        logger.warning(f"social graph unavailable: {exc}")
+        return (
+            _follows().filter(from_profile_id=from_pkid, to_profile_id=to_pkid).exists()
+        )
+
+
+def following_pkids(pkid: int) -> Set[int]:
+    """
+    Get the pkids of the profiles a profile follows.
+
+    Args:
+    - pkid (int): The profile pkid.
+
+    Returns:
+    - Set[int]: The followed profile pkids.
+    """
+    try:
+        client = get_redis()
+        return _members(client, _ensure_loaded(client, pkid, followers=False))
+    except RedisError as exc:
+        logger.warning(f"social graph unavailable: {exc}")
+        return set(
+            _follows()
+            .filter(from_profile_id=pkid)
+            .values_list("to_profile_id", flat=True)
+        )
+
+
+def follower_pkids(pkid: int) -> Set[int]:
+    """
+    Get the pkids of the profiles following a profile.
+
+    Args:
+    - pkid (int): The profile pkid.
+
+    Returns:
+    - Set[int]: The follower profile pkids.
+    """
+    try:
+        client = get_redis()
+        return _members(client, _ensure_loaded(client, pkid, followers=True))
+    except RedisError as exc:
+        logger.warning(f"social graph unavailable: {exc}")
+        return set(
+            _follows()
+            .filter(to_profile_id=pkid)
+            .values_list("from_profile_id", flat=True)
+        )
+
+
+def following_count(pkid: int) -> int:
+    """
+    Count the profiles a profile follows, with SCARD.
+
+    Args:
+    - pkid (int): The profile pkid.
+
+    Returns:
+    - int: Number of followed profiles.
+    """
+    try:
+        client = get_redis()
+        return client.scard(_ensure_loaded(client, pkid, followers=False)) - 1
+    except RedisError as exc:
+        logger.warning(f"social graph unavailable: {exc}")
+        return _follows().filter(from_profile_id=pkid).count()
+
+
+def followers_count(pkid: int) -> int:
+    """
+    Count the profiles following a profile, with SCARD.
+
+    Args:
+    - pkid (int): The profile pkid.
+
+    Returns:
+    - int: Number of followers.
+    """
+    try:
+        client = get_redis()
+        return client.scard(_ensure_loaded(client, pkid, followers=True)) - 1
+    except RedisError as exc:
+        logger.warning(f"social graph unavailable: {exc}")
+        return _follows().filter(to_profile_id=pkid).count()
+
+
+def mutual_pkids(pkid: int) -> Set[int]:
+    """
+    Get the pkids of the profiles a profile follows that follow it back.
+
+    Computed by Redis as the SINTER of the following and followers sets.
+
+    Args:
+    - pkid (int): The profile pkid.
+
+    Returns:
+    - Set[int]: The mutually following profile pkids.
+    """
+    try:
+        client = get_redis()
+        return _members(
+            client,
+            _ensure_loaded(client, pkid, followers=False),
+            _ensure_loaded(client, pkid, followers=True),
+        )
+    except RedisError as exc:
+        logger.warning(f"social graph unavailable: {exc}")
+        followers = _follows().filter(to_profile_id=pkid).values("from_profile_id")
+        return set(
+            _follows()
+            .filter(from_profile_id=pkid, to_profile_id__in=followers)
+            .values_list("to_profile_id", flat=True)
+        )
+
+
+def record_follows(follows: Iterable[Tuple[int, int]], *, followed: bool) -> None:
+    """
+    Write follows or unfollows through to the cached sets.
+
+    Only sets that are already cached are changed, atomically in one
+        script; uncached ones are loaded from the database when next
+        read. Redis errors are logged, leaving the sets stale until
+        they expire or rebuild_graph runs; following_changed is sent
+        either way.
+
+    Args:
+    - follows (Iterable[Tuple[int, int]]): (follower, followed)
+        profile pkid pairs.
+    - followed (bool): True for follows, False for unfollows.
+    """
+    follows = list(follows)
+    keys: List[str] = []
+    members: List[int] = []
+    for from_pkid, to_pkid in follows:
+        keys += [
+            FOLLOWING_KEY.format(pkid=from_pkid),
+            FOLLOWERS_KEY.format(pkid=to_pkid),
+        ]
+        members += [to_pkid, from_pkid]
+    if not keys:
+        return
+    try:
+        get_redis().eval(
+            _APPLY_IF_LOADED, len(keys), *keys, "SADD" if followed else "SREM", *members
+        )
+    except RedisError as exc:
+        logger.warning(f"could not update social graph: {exc}")
+    following_changed.send(
+        sender=apps.get_model("profiles", "Profile"),
+        pkids={from_pkid for from_pkid, _ in follows},
+    )
+
+
+def forget(pkids: Iterable[int]) -> None:
+    """
+    Drop the cached sets of profiles, to be reloaded when next read.
+
+    following_changed is sent for the profiles.
+
+    Args:
+    - pkids (Iterable[int]): The profile pkids.
+    """
+    pkids = set(pkids)
+    keys: List[str] = []
+    for pkid in pkids:
+        keys += [FOLLOWING_KEY.format(pkid=pkid), FOLLOWERS_KEY.format(pkid=pkid)]
+    if not keys:
+        return
+    try:
+        get_redis().delete(*keys)
+    except RedisError as exc:
+        logger.warning(f"could not drop social graph sets: {exc}")
+    following_changed.send(sender=apps.get_model("profiles", "Profile"), pkids=pkids)
+
+
+def rebuild_graph(
+    pkids: Optional[Iterable[int]] = None, batch_size: int = REBUILD_BATCH_SIZE
+) -> int:
+    """
+    Rebuild the cached sets from the follows table.
+
+    Each batch of profiles is read with two queries and its sets are
+        replaced in one MULTI/EXEC, so readers never see a set half
+        loaded.
+
+    Args:
+    - pkids (Optional[Iterable[int]]): Profiles to rebuild. Defaults
+        to every profile.
+    - batch_size (int): Profiles rebuilt per pipeline.
+
+    Returns:
+    - int: Number of profiles rebuilt.
+    """
+    profiles = apps.get_model("profiles", "Profile").objects.order_by("pkid")
+    if pkids is not None:
+        profiles = profiles.filter(pkid__in=list(pkids))
+    client = get_redis()
+    rebuilt = 0
+    last_pkid = 0
+    while True:
+        batch = list(
+            profiles.filter(pkid__gt=last_pkid).values_list("pkid", flat=True)[
+                :batch_size
+            ]
+        )
+        if not batch:
+            return rebuilt
+        following: Dict[int, List[int]] = {pkid: [] for pkid in batch}
+        followers: Dict[int, List[int]] = {pkid: [] for pkid in batch}
+        for from_pkid, to_pkid in (
+            _follows()
+            .filter(from_profile_id__in=batch)
+            .values_list("from_profile_id", "to_profile_id")
+        ):
+            following[from_pkid].append(to_pkid)
+        for from_pkid, to_pkid in (
+            _follows()
+            .filter(to_profile_id__in=batch)
+            .values_list("from_profile_id", "to_profile_id")
+        ):
+            followers[to_pkid].append(from_pkid)
+
+        pipeline = client.pipeline(transaction=True)
+        for pkid in batch:
+            _load(pipeline, FOLLOWING_KEY.format(pkid=pkid), following[pkid])
+            _load(pipeline, FOLLOWERS_KEY.format(pkid=pkid), followers[pkid])
+        pipeline.execute()
+        rebuilt += len(batch)
+        last_pkid = batch[-1]
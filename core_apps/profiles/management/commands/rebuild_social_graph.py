@@ -0,0 +1,44 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from redis.exceptions import RedisError
+
+from core_apps.profiles.graph import REBUILD_BATCH_SIZE, rebuild_graph
+
+
+class Command(BaseCommand):
+    """
+    Management command to rebuild the social graph cache.
+
+    Replaces the cached following and followers sets of every profile,
+        or of the --profile pkids given, with the rows of the follows
+        table, repairing any drift from failed write-throughs.
+    """
+
+    help = "Rebuild the Redis following/followers sets from the database"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command line arguments."""
+        parser.add_argument(
+            "--profile",
+            type=int,
+            action="append",
+            dest="pkids",
+            help="Only rebuild the sets of this profile pkid (repeatable)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=REBUILD_BATCH_SIZE,
+            help="Number of profiles rebuilt per Redis transaction",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Rebuild the sets and report how many profiles were rebuilt."""
+        try:
+            rebuilt = rebuild_graph(options["pkids"], batch_size=options["batch_size"])
+        except RedisError as exc:
+            raise CommandError(f"Could not reach Redis: {exc}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt the social graph of {rebuilt} profile(s)")
+        )
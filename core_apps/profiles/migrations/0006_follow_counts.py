@@ -0,0 +1,46 @@
+# Generated by Django 3.2.11 on 2026-10-18 00:56
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_follow_counts(apps, schema_editor):
+    """Count the existing follows of every profile."""
+    Profile = apps.get_model("profiles", "Profile")
+    Follows = Profile.follows.through
+
+    def count_of(field):
+        counts = (
+            Follows.objects.filter(**{field: models.OuterRef("pkid")})
+            .order_by()
+            .values(field)
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        return Coalesce(models.Subquery(counts), 0)
+
+    Profile.objects.update(
+        followers_count=count_of("to_profile"),
+        following_count=count_of("from_profile"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0005_alter_profile_github_account'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='followers_count',
+            field=models.IntegerField(default=0, verbose_name='followers'),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='following_count',
+            field=models.IntegerField(default=0, verbose_name='following'),
+        ),
+        migrations.RunPython(populate_follow_counts, migrations.RunPython.noop),
+    ]
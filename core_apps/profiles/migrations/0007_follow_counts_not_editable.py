@@ -0,0 +1,23 @@
+# Generated by Django 3.2.11 on 2026-10-18 01:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0006_follow_counts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='followers_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='followers'),
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='following_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='following'),
+        ),
+    ]
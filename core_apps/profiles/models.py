@@ -1,10 +1,13 @@
-from typing import List
+from collections import Counter
+from typing import Any, Iterable, List, Set, Tuple
 
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.utils.translation import gettext_lazy as _
 
 from core_apps.common.models import TimeStampedUUIDModel
+from core_apps.profiles import graph
 
 # Get the user model
 User = get_user_model()
@@ -25,6 +28,10 @@ class Profile(TimeStampedUUIDModel):
     - github_account (CharField): Field for the user's GitHub account.
     - follows (ManyToManyField): Many-to-many relationship with
         other profiles for following.
+    - followers_count (IntegerField): Number of profiles following
+        this profile.
+    - following_count (IntegerField): Number of profiles this profile
+        follows.
     """
 
     # Choices for gender field
@@ -66,6 +73,16 @@ class Profile(TimeStampedUUIDModel):
     follows = models.ManyToManyField(
         "self", symmetrical=False, related_name="followed_by", blank=True
     )
+    # Denormalized sizes of follows and followed_by, see update_follow_counts
+    followers_count = models.IntegerField(
+        verbose_name=_("followers"), default=0, editable=False
+    )
+    following_count = models.IntegerField(
+        verbose_name=_("following"), default=0, editable=False
+    )
+
+    # Written only by update_follow_counts, never by a full save
+    FOLLOW_COUNT_FIELDS = frozenset({"followers_count", "following_count"})
 
     def __str__(self) -> str:
         """
@@ -76,7 +93,29 @@ class Profile(TimeStampedUUIDModel):
         """
         return f"{self.user.username}'s profile"
 
-    # Implementing following and unfollowing feature
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Save the profile, leaving the follow counts alone.
+
+        The counts are only written when named in update_fields, so a
+            full save of an instance loaded before a follow doesn't
+            write its stale counts back. New profiles are inserted whole.
+        """
+        if (
+            kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+            and not self._state.adding
+        ):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.FOLLOW_COUNT_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    # Implementing following and unfollowing feature. Lookups read the
+    # Redis sets of core_apps.profiles.graph, which follow, unfollow and
+    # the signals keep in step with the follows table
     def following_list(self) -> List["Profile"]:
         """
         Method to get the list of profiles that this profile is following.
@@ -84,7 +123,7 @@ class Profile(TimeStampedUUIDModel):
         Returns:
         - List[Profile]: List of profiles that this profile is following.
         """
-        return list(self.follows.all())
+        return list(Profile.objects.filter(pkid__in=graph.following_pkids(self.pkid)))
 
     def followers_list(self) -> List["Profile"]:
         """
@@ -93,25 +132,88 @@ class Profile(TimeStampedUUIDModel):
         Returns:
         - List[Profile]: List of profiles that are following this profile.
         """
-        return list(self.followed_by.all())
+        return list(Profile.objects.filter(pkid__in=graph.follower_pkids(self.pkid)))
 
-    def follow(self, profile: "Profile") -> None:
+    def follow(self, profile: "Profile") -> bool:
         """
         Method to follow another profile.
 
+        The follows row and both counts are written in one transaction;
+            the unique follows row decides which of two concurrent
+            follows counts.
+
         Args:
         - profile (Profile): Profile to follow.
+
+        Returns:
+        - bool: True if newly followed, False if already following.
         """
-        self.follows.add(profile)
+        with transaction.atomic():
+            _, created = Profile.follows.through.objects.get_or_create(
+                from_profile=self, to_profile=profile
+            )
+            if created:
+                Profile.update_follow_counts([(self.pkid, profile.pkid)], 1)
+                transaction.on_commit(
+                    lambda: graph.record_follows(
+                        [(self.pkid, profile.pkid)], followed=True
+                    )
+                )
+        return created
 
-    def unfollow(self, profile: "Profile") -> None:
+    def unfollow(self, profile: "Profile") -> bool:
         """
         Method to unfollow a profile.
 
         Args:
         - profile (Profile): Profile to unfollow.
+
+        Returns:
+        - bool: True if unfollowed, False if not following.
         """
-        self.follows.remove(profile)
+        with transaction.atomic():
+            deleted, _ = Profile.follows.through.objects.filter(
+                from_profile=self, to_profile=profile
+            ).delete()
+            if deleted:
+                Profile.update_follow_counts([(self.pkid, profile.pkid)], -1)
+                transaction.on_commit(
+                    lambda: graph.record_follows(
+                        [(self.pkid, profile.pkid)], followed=False
+                    )
+                )
+        return bool(deleted)
+
+    @classmethod
+    def update_follow_counts(
+        cls, follows: Iterable[Tuple[int, int]], delta: int
+    ) -> None:
+        """
+        Method to add follows to, or remove them from, the stored counts.
+
+        Each affected profile is changed with one UPDATE of F()
+            expressions, so concurrent follows never lose a count.
+            Instances already loaded keep their old counts, which save
+            never writes back.
+
+        Args:
+        - follows (Iterable[Tuple[int, int]]): (follower, followed)
+            profile pkid pairs.
+        - delta (int): 1 for follows, -1 for unfollows.
+        """
+        following: Counter = Counter()
+        followers: Counter = Counter()
+        for from_pkid, to_pkid in follows:
+            following[from_pkid] += delta
+            followers[to_pkid] += delta
+        for pkid, change in following.items():
+            cls.objects.filter(pkid=pkid).update(
+                following_count=F("following_count") + change
+            )
+        for pkid, change in followers.items():
+            cls.objects.filter(pkid=pkid).update(
+                followers_count=F("followers_count") + change
+            )
 
     def check_following(self, profile: "Profile") -> bool:
         """
@@ -123,7 +225,7 @@ class Profile(TimeStampedUUIDModel):
         Returns:
         - bool: True if following, False otherwise.
         """
-        return self.follows.filter(pkid=profile.pkid).exists()
+        return graph.is_following(self.pkid, profile.pkid)
 
     def check_is_followed_by(self, profile: "Profile") -> bool:
         """
@@ -135,4 +237,38 @@ class Profile(TimeStampedUUIDModel):
         Returns:
         - bool: True if followed by, False otherwise.
         """
-        return self.followed_by.filter(pkid=profile.pkid).exists()
+        return graph.is_following(profile.pkid, self.pkid)
+
+    def mutual_follows(self) -> List["Profile"]:
+        """
+        Method to get the profiles this profile follows that follow it back.
+
+        Returns:
+        - List[Profile]: List of profiles following each other with
+            this profile.
+        """
+        return list(Profile.objects.filter(pkid__in=graph.mutual_pkids(self.pkid)))
+
+    @classmethod
+    def followed_pkids(cls, user_pkid: int, profiles: Iterable["Profile"]) -> Set[int]:
+        """
+        Method to check which of several profiles a user follows.
+
+        Resolves a page of profiles in one query on the follows table,
+            without loading the user's own profile.
+
+        Args:
+        - user_pkid (int): The pkid of the following user.
+        - profiles (Iterable[Profile]): Profiles to check.
+
+        Returns:
+        - Set[int]: The pkids of the profiles the user follows.
+        """
+        pkids = [profile.pkid for profile in profiles]
+        if not pkids:
+            return set()
+        return set(
+            cls.follows.through.objects.filter(
+                from_profile__user_id=user_pkid, to_profile_id__in=pkids
+            ).values_list("to_profile_id", flat=True)
+        )
@@ -0,0 +1,180 @@
+import logging
+import time
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from redis import Redis
+from redis.exceptions import RedisError
+
+from core_apps.common.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Sorted set of the user pkids with pending follow notifications, scored
+# by when their digest is due
+DUE_RECIPIENTS_KEY = "notifications:follows:due"
+# Set of the usernames that followed a user since their last digest,
+# formatted with the user pkid
+PENDING_FOLLOWERS_KEY = "notifications:follows:{pkid}"
+# Hash of the failed sends of each user's pending digest, keyed by pkid
+DIGEST_ATTEMPTS_KEY = "notifications:follows:attempts"
+# Followers named in a digest before the rest are only counted
+NAMED_FOLLOWERS = 3
+# Sends of a digest tried before it is dropped
+MAX_DIGEST_ATTEMPTS = 5
+
+
+def queue_follow_notification(recipient_pkid: int, follower_username: str) -> None:
+    """
+    Record that a user gained a follower, to be emailed in a digest.
+
+    The follower is added to the recipient's pending set and the
+        recipient is scheduled FOLLOW_DIGEST_WINDOW seconds from now,
+        unless a digest is already scheduled, so every follow within
+        the window lands in one email. Nothing is sent here. Redis
+        errors are logged and the notification is dropped, so a Redis
+        outage never fails the follow.
+
+    Args:
+    - recipient_pkid (int): The pkid of the followed user.
+    - follower_username (str): The username of the new follower.
+    """
+    due = time.time() + settings.FOLLOW_DIGEST_WINDOW
+    try:
+        pipeline = get_redis().pipeline(transaction=False)
+        pipeline.sadd(
+            PENDING_FOLLOWERS_KEY.format(pkid=recipient_pkid), follower_username
+        )
+        pipeline.zadd(DUE_RECIPIENTS_KEY, {recipient_pkid: due}, nx=True)
+        pipeline.execute()
+    except RedisError as exc:
+        logger.warning(
+            f"could not queue follow notification of {recipient_pkid}: {exc}"
+        )
+
+
+def build_digest(username: str, email: str, followers: List[str]) -> EmailMessage:
+    """
+    Build the email telling a user who followed them.
+
+    Args:
+    - username (str): The recipient's username.
+    - email (str): The recipient's email address.
+    - followers (List[str]): Usernames of the new followers.
+
+    Returns:
+    - EmailMessage: The digest.
+    """
+    if len(followers) == 1:
+        subject = "A new user follows you"
+        body = f"Hi there {username}!!, the user {followers[0]} now follows you"
+    else:
+        named = ", ".join(followers[:NAMED_FOLLOWERS])
+        others = len(followers) - NAMED_FOLLOWERS
+        if others > 0:
+            named += f" and {others} other{'s' if others > 1 else ''}"
+        subject = f"{len(followers)} new users follow you"
+        body = f"Hi there {username}!!, {named} now follow you"
+    return EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [email])
+
+
+def _retry_digests(client: Redis, pending: Dict[int, List[str]], now: float) -> None:
+    """
+    Queue digests that failed to send again, backing off exponentially.
+
+    A digest is retried FOLLOW_DIGEST_WINDOW seconds after its first
+        failure, twice that after the second and so on, and dropped
+        after MAX_DIGEST_ATTEMPTS failures, e.g. to an address the mail
+        server rejects.
+
+    Args:
+    - client (Redis): The Redis client.
+    - pending (Dict[int, List[str]]): Followers of each failed digest,
+        keyed by recipient pkid.
+    - now (float): The current UNIX time.
+    """
+    pipeline = client.pipeline(transaction=False)
+    for pkid in pending:
+        pipeline.hincrby(DIGEST_ATTEMPTS_KEY, pkid, 1)
+    attempts = dict(zip(pending, pipeline.execute()))
+
+    pipeline = client.pipeline(transaction=False)
+    for pkid, followers in pending.items():
+        if attempts[pkid] >= MAX_DIGEST_ATTEMPTS:
+            logger.error(
+                f"dropped follow digest of {pkid} after {attempts[pkid]} attempts"
+            )
+            pipeline.hdel(DIGEST_ATTEMPTS_KEY, pkid)
+            continue
+        due = now + settings.FOLLOW_DIGEST_WINDOW * 2 ** (attempts[pkid] - 1)
+        pipeline.sadd(PENDING_FOLLOWERS_KEY.format(pkid=pkid), *followers)
+        pipeline.zadd(DUE_RECIPIENTS_KEY, {pkid: due})
+    pipeline.execute()
+
+
+def send_due_digests(now: Optional[float] = None) -> int:
+    """
+    Email every user whose follow digest is due.
+
+    Each recipient's pending followers are read and deleted in one
+        MULTI/EXEC, so follows queued meanwhile start the next digest.
+        The digests are sent one by one over a single connection to
+        CELERY_EMAIL_BACKEND, the backend the celery email tasks send
+        with, since this already runs in a worker. Digests that fail
+        to send are queued again by _retry_digests; the others are not
+        affected.
+
+    Args:
+    - now (Optional[float]): The current UNIX time, defaults to now.
+
+    Returns:
+    - int: Number of digests sent.
+    """
+    client = get_redis()
+    now = time.time() if now is None else now
+    pending: Dict[int, List[str]] = {}
+    for member in client.zrangebyscore(DUE_RECIPIENTS_KEY, "-inf", now):
+        key = PENDING_FOLLOWERS_KEY.format(pkid=int(member))
+        pipeline = client.pipeline(transaction=True)
+        pipeline.smembers(key)
+        pipeline.delete(key)
+        pipeline.zrem(DUE_RECIPIENTS_KEY, member)
+        followers, _, _ = pipeline.execute()
+        if followers:
+            pending[int(member)] = sorted(follower.decode() for follower in followers)
+    if not pending:
+        return 0
+
+    recipients = get_user_model().objects.filter(pkid__in=pending)
+    messages = {
+        pkid: build_digest(username, email, pending[pkid])
+        for pkid, username, email in recipients.values_list("pkid", "username", "email")
+        if email
+    }
+    sent: List[int] = []
+    failed: Dict[int, List[str]] = {}
+    connection = get_connection(settings.CELERY_EMAIL_BACKEND)
+    try:
+        connection.open()
+    except Exception as exc:
+        logger.warning(f"could not connect to send follow digests: {exc}")
+        failed = {pkid: pending[pkid] for pkid in messages}
+    else:
+        try:
+            for pkid, message in messages.items():
+                try:
+                    if connection.send_messages([message]):
+                        sent.append(pkid)
+                except Exception as exc:
+                    logger.warning(f"could not send follow digest of {pkid}: {exc}")
+                    failed[pkid] = pending[pkid]
+        finally:
+            connection.close()
+
+    if sent:
+        client.hdel(DIGEST_ATTEMPTS_KEY, *sent)
+    if failed:
+        _retry_digests(client, failed, now)
+    return len(sent)
@@ -1,14 +1,35 @@
-from rest_framework.pagination import PageNumberPagination
+from typing import Sequence
 
+from core_apps.common.pagination import KeysetPagination
 
-class ProfilePagination(PageNumberPagination):
+
+class ProfilePagination(KeysetPagination):
     """
     Pagination class for profile lists.
 
-    This class defines the pagination behavior for profile lists.
+    This class pages profiles newest first with keyset cursors over
+        (created_at, pkid).
 
     Attributes:
     - page_size (int): Number of profiles to include in each page.
+    - ordering (Sequence[str]): Key the profiles are paged by.
     """
 
     page_size: int = 3
+    ordering: Sequence[str] = ("-created_at", "-pkid")
+
+
+class FollowPagination(KeysetPagination):
+    """
+    Pagination class for follower and following lists.
+
+    This class pages rows of the follows table, most recent follow
+        first, with keyset cursors over the table's primary key.
+
+    Attributes:
+    - page_size (int): Number of profiles to include in each page.
+    - ordering (Sequence[str]): Key the follows are paged by.
+    """
+
+    page_size: int = 20
+    ordering: Sequence[str] = ("-id",)
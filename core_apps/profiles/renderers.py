@@ -1,10 +1,7 @@
-import json
-from typing import Any, Dict, Optional
+from core_apps.common.renderers import EnvelopeJSONRenderer
 
-from rest_framework.renderers import JSONRenderer
 
-
-class ProfileJSONRenderer(JSONRenderer):
+class ProfileJSONRenderer(EnvelopeJSONRenderer):
     """
     JSON Renderer for single profile responses.
 
@@ -12,42 +9,13 @@ class ProfileJSONRenderer(JSONRenderer):
         containing a single profile.
 
     Attributes:
-    - charset (str): Character encoding for
-        the rendered JSON.
+    - envelope_key (str): Key the profile is rendered under.
     """
 
-    charset: str = "utf-8"
-
-    def render(
-        self,
-        data: Dict[str, Any],
-        accepted_media_type: Optional[str] = None,
-        renderer_context: Optional[Dict[str, Any]] = None,
-    ) -> bytes:
-        """
-        Render method for JSON rendering.
-
-        Args:
-        - data (Dict[str, Any]): Data to be rendered.
-        - accepted_media_type (Optional[str]): Media type
-            accepted by the renderer.
-        - renderer_context (Optional[Dict[str, Any]]): Context
-            for rendering.
-
-        Returns:
-        - bytes: Encoded JSON data.
-        """
-        status_code: int = renderer_context["response"].status_code
-        errors: Optional[Dict[str, Any]] = data.get("errors", None)
-
-        if errors is not None:
-            return super(ProfileJSONRenderer, self).render(data)
-        return json.dumps({"status_code": status_code, "profile": data}).encode(
-            self.charset
-        )
+    envelope_key: str = "profile"
 
 
-class ProfilesJSONRenderer(JSONRenderer):
+class ProfilesJSONRenderer(EnvelopeJSONRenderer):
     """
     JSON Renderer for multiple profile responses.
 
@@ -55,35 +23,7 @@ class ProfilesJSONRenderer(JSONRenderer):
         containing multiple profiles.
 
     Attributes:
-    - charset (str): Character encoding for the rendered JSON.
+    - envelope_key (str): Key the profiles are rendered under.
     """
 
-    charset: str = "utf-8"
-
-    def render(
-        self,
-        data: Dict[str, Any],
-        accepted_media_type: Optional[str] = None,
-        renderer_context: Optional[Dict[str, Any]] = None,
-    ) -> bytes:
-        """
-        Render method for JSON rendering.
-
-        Args:
-        - data (Dict[str, Any]): Data to be rendered.
-        - accepted_media_type (Optional[str]): Media type accepted
-            by the renderer.
-        - renderer_context (Optional[Dict[str, Any]]): Context for
-            rendering.
-
-        Returns:
-        - bytes: Encoded JSON data.
-        """
-        status_code: int = renderer_context["response"].status_code
-        errors: Optional[Dict[str, Any]] = data.get("errors", None)
-
-        if errors is not None:
-            return super(ProfilesJSONRenderer, self).render(data)
-        return json.dumps({"status_code": status_code, "profiles": data}).encode(
-            self.charset
-        )
+    envelope_key: str = "profiles"
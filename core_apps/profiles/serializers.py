@@ -1,16 +1,61 @@
-from typing import Any, List
+from typing import Any, Dict, List
 
 from django.conf import settings
+from django.db import models
 from rest_framework import serializers
 
+from core_apps.common.serializers import SparseFieldsetMixin
+
 from .models import Profile
 
+# ProfileSerializer fields read from the related user
+USER_FIELDS = {"username", "first_name", "last_name", "full_name", "email"}
+
+
+# Serializer context key holding the pkids of the profiles the requesting
+# user follows, set once per page by ProfileListSerializer
+FOLLOWED_PKIDS_CONTEXT_KEY = "followed_pkids"
+
 
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileListSerializer(serializers.ListSerializer):
+    """
+    List serializer resolving "following" for a whole page at once.
+
+    Methods:
+    - to_representation: Look up which of the profiles the requesting
+        user follows, then serialize them.
+    """
+
+    def to_representation(self, data: Any) -> List[Dict[str, Any]]:
+        """
+        Serialize the profiles, resolving "following" in one query.
+
+        Args:
+        - data (Any): The profiles, a list or queryset.
+
+        Returns:
+        - List[Dict[str, Any]]: The serialized profiles.
+        """
+        profiles = list(data.all() if isinstance(data, models.Manager) else data)
+        request = self.context.get("request")
+        if (
+            "following" in self.child.fields
+            and FOLLOWED_PKIDS_CONTEXT_KEY not in self.context
+            and request is not None
+            and not request.user.is_anonymous
+        ):
+            self.context[FOLLOWED_PKIDS_CONTEXT_KEY] = Profile.followed_pkids(
+                request.user.pkid, profiles
+            )
+        return super().to_representation(profiles)
+
+
+class ProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Profile model.
 
     This class defines the serialization behavior for the Profile model.
+        ?fields= and ?omit= select the fields returned.
 
     Attributes:
     - username (str): Username of the user associated with the profile.
@@ -21,6 +66,9 @@ class ProfileSerializer(serializers.ModelSerializer):
     - profile_photo (str): URL of the profile photo.
     - following (bool): Indicates if the requesting user is following
         the profile owner.
+    - followers_count (int): Number of followers, stored on the profile.
+    - following_count (int): Number of profiles followed, stored on the
+        profile.
     """
 
     username = serializers.CharField(source="user.username")
@@ -33,6 +81,7 @@ class ProfileSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Profile
+        list_serializer_class = ProfileListSerializer
         fields: List[str] = [
             "username",
             "first_name",
@@ -48,7 +97,10 @@ class ProfileSerializer(serializers.ModelSerializer):
             "facebook_account",
             "github_account",
             "following",
+            "followers_count",
+            "following_count",
         ]
+        read_only_fields: List[str] = ["followers_count", "following_count"]
 
     def get_full_name(self, obj: Profile) -> str:
         """
@@ -90,6 +142,10 @@ class ProfileSerializer(serializers.ModelSerializer):
         Returns whether the requesting user is following the
             profile owner.
 
+        Lists read the answer from the set ProfileListSerializer
+            resolved for the page; single profiles are checked with a
+            query.
+
         Args:
         - instance (Profile): Profile instance.
 
@@ -102,6 +158,9 @@ class ProfileSerializer(serializers.ModelSerializer):
             return None
         if request.user.is_anonymous:
             return False
+        followed_pkids = self.context.get(FOLLOWED_PKIDS_CONTEXT_KEY)
+        if followed_pkids is not None:
+            return instance.pkid in followed_pkids
 
         current_user_profile: Profile = request.user.profile
         followee: Profile = instance
@@ -1,10 +1,13 @@
 import logging
 import random
-from typing import Any
+from typing import Any, Optional, Set
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_save, pre_delete
 from django.dispatch import receiver
 
+from core_apps.profiles import graph
 from core_apps.profiles.models import Profile
 from modern_blog_api.settings.base import AUTH_USER_MODEL
 
@@ -79,14 +82,109 @@ def create_user_profile(
 
 # Signal to save the profile when the user is saved
 @receiver(post_save, sender=AUTH_USER_MODEL)
-def save_user_profile(sender: Any, instance: Any, **kwargs: Any) -> None:
+def save_user_profile(
+    sender: Any, instance: Any, update_fields: Any = None, **kwargs: Any
+) -> None:
     """
     Saves the profile when the user is saved.
 
+    Saves that only touch last_login, as on every login, leave the
+        profile alone.
+
     Args:
     - sender (Any): The sender of the signal.
     - instance (Any): The instance triggering the signal.
+    - update_fields (Any): The fields passed to save(), if any.
     - **kwargs (Any): Additional keyword arguments.
     """
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return
     instance.profile.save()
     logger.info(f"{instance}'s profile created")
+
+
+# Signal to keep the follow counts and social graph cache in step with
+# changes made through the follows relation
+@receiver(m2m_changed, sender=Profile.follows.through)
+def update_follows(
+    sender: Any,
+    instance: Profile,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[int]],
+    **kwargs: Any,
+) -> None:
+    """
+    Updates the follow counts and cached sets of changed follows.
+
+    Profile.follow and Profile.unfollow do this themselves; this covers
+        changes made on either side of the relation directly, e.g. in
+        the admin. The sets are updated once the transaction commits;
+        clearing a relation drops the sets of every profile involved
+        instead.
+
+    Args:
+    - sender (Any): The follows through model.
+    - instance (Profile): The profile whose follows changed.
+    - action (str): The m2m_changed action.
+    - reverse (bool): True if changed through instance.followed_by.
+    - pk_set (Optional[Set[int]]): The pkids being added or removed.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    pkid = instance.pkid
+    if action == "post_add":
+        # Django only passes the pkids that weren't already followed
+        follows = [(other, pkid) if reverse else (pkid, other) for other in pk_set]
+        Profile.update_follow_counts(follows, 1)
+        transaction.on_commit(lambda: graph.record_follows(follows, followed=True))
+    elif action == "pre_remove":
+        # pk_set holds every pkid asked to be removed, followed or not, so
+        # the rows that exist are looked up before they are deleted
+        rows = sender.objects.filter(
+            **{"to_profile_id" if reverse else "from_profile_id": pkid},
+            **{"from_profile_id__in" if reverse else "to_profile_id__in": pk_set},
+        )
+        instance._removed_follows = list(
+            rows.values_list("from_profile_id", "to_profile_id")
+        )
+    elif action == "post_remove":
+        follows = instance.__dict__.pop("_removed_follows", [])
+        Profile.update_follow_counts(follows, -1)
+        transaction.on_commit(lambda: graph.record_follows(follows, followed=False))
+    elif action == "pre_clear":
+        rows = sender.objects.filter(
+            **{"to_profile_id" if reverse else "from_profile_id": pkid}
+        )
+        follows = list(rows.values_list("from_profile_id", "to_profile_id"))
+        Profile.update_follow_counts(follows, -1)
+        pkids = {
+            pkid,
+            *(from_pkid if reverse else to_pkid for from_pkid, to_pkid in follows),
+        }
+        transaction.on_commit(lambda: graph.forget(pkids))
+
+
+# Signal to drop a deleted profile's follows from the counts and cache
+@receiver(pre_delete, sender=Profile)
+def forget_follows(sender: Any, instance: Profile, **kwargs: Any) -> None:
+    """
+    Drops the follows of a deleted profile from the counts and cache.
+
+    The follows rows are deleted by cascade without m2m_changed, so the
+        profiles on the other side are counted down before the delete,
+        and their cached sets dropped.
+
+    Args:
+    - sender (Any): The sender of the signal.
+    - instance (Profile): The profile being deleted.
+    - **kwargs (Any): Additional keyword arguments.
+    """
+    pkid = instance.pkid
+    follows = list(
+        Profile.follows.through.objects.filter(
+            Q(from_profile_id=pkid) | Q(to_profile_id=pkid)
+        ).values_list("from_profile_id", "to_profile_id")
+    )
+    Profile.update_follow_counts(follows, -1)
+    pkids = {pkid, *(other for follow in follows for other in follow)}
+    transaction.on_commit(lambda: graph.forget(pkids))
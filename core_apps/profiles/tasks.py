@@ -0,0 +1,23 @@
+import logging
+
+from celery import shared_task
+
+from .notifications import send_due_digests
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def send_follow_digests() -> int:
+    """
+    Email the follow digests that are due.
+
+    Scheduled periodically by celery beat (see CELERY_BEAT_SCHEDULE).
+
+    Returns:
+    - int: Number of digests sent.
+    """
+    sent = send_due_digests()
+    if sent:
+        logger.info(f"sent {sent} follow digest(s)")
+    return sent
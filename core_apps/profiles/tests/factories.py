@@ -12,10 +12,8 @@ faker = FakerFactory.create()
 class ProfileFactory(factory.django.DjangoModelFactory):
     """Factory for Profile model"""
     user = factory.SubFactory(UserFactory)
-    phone_number = factory.LazyAttribute(lambda x: faker.phone_number())
     about_me = factory.LazyAttribute(lambda x: faker.sentence(nb_words=5))
     gender = factory.LazyAttribute(lambda x: faker.random_element(elements=('M', 'F', 'O')))
-    country = factory.LazyAttribute(lambda x: faker.country_code())
     city = factory.LazyAttribute(lambda x: faker.city())
     profile_photo = factory.LazyAttribute(lambda x: faker.file_extension(category="image"))
     twitter_handle = factory.LazyAttribute(lambda x: faker.user_name())
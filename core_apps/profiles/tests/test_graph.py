@@ -0,0 +1,138 @@
+import pytest
+
+from core_apps.profiles import graph
+from core_apps.profiles.models import Profile
+
+
+@pytest.mark.django_db
+def test_follow_writes_through_on_commit(
+    monkeypatch, profile_factory, django_capture_on_commit_callbacks
+):
+    """Test follows and unfollows on either side update the graph sets"""
+    calls = []
+    monkeypatch.setattr(
+        graph,
+        "record_follows",
+        lambda follows, followed: calls.append((sorted(follows), followed)),
+    )
+    follower, followee, other = profile_factory(), profile_factory(), profile_factory()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        follower.follow(followee)
+        followee.followed_by.add(other)
+        follower.unfollow(followee)
+
+    assert calls == [
+        ([(follower.pkid, followee.pkid)], True),
+        ([(other.pkid, followee.pkid)], True),
+        ([(follower.pkid, followee.pkid)], False),
+    ]
+
+
+@pytest.mark.django_db
+def test_graph_lookups(profile_factory):
+    """Test membership, counts and mutual follows match the follows table"""
+    profile, friend, fan = profile_factory(), profile_factory(), profile_factory()
+    profile.follow(friend)
+    friend.follow(profile)
+    fan.follow(profile)
+
+    assert profile.check_following(friend)
+    assert profile.check_is_followed_by(fan)
+    assert not profile.check_following(fan)
+    assert graph.followers_count(profile.pkid) == 2
+    assert graph.following_count(profile.pkid) == 1
+    assert profile.mutual_follows() == [friend]
+
+
+@pytest.mark.django_db
+def test_follow_counts(profile_factory):
+    """Test the stored counts follow every way follows change"""
+    profile, followee, fan = profile_factory(), profile_factory(), profile_factory()
+
+    assert profile.follow(followee)
+    assert not profile.follow(followee)
+    followee.followed_by.add(fan)
+    profile.follows.add(fan)
+    profile.refresh_from_db()
+    followee.refresh_from_db()
+    assert (profile.following_count, followee.followers_count) == (2, 2)
+
+    stranger = profile_factory()
+    profile.follows.remove(stranger)
+    stranger.followed_by.remove(profile)
+    profile.refresh_from_db()
+    stranger.refresh_from_db()
+    assert (profile.following_count, stranger.followers_count) == (2, 0)
+    profile.follows.remove(fan, stranger)
+    profile.refresh_from_db()
+    fan.refresh_from_db()
+    assert (profile.following_count, fan.followers_count) == (1, 0)
+
+    assert profile.unfollow(followee)
+    assert not profile.unfollow(followee)
+    profile.follows.clear()
+    fan.user.delete()
+    profile.refresh_from_db()
+    followee.refresh_from_db()
+    assert (profile.following_count, followee.followers_count) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_graph_sets_load_and_write_through(
+    fake_redis, settings, profile_factory, django_capture_on_commit_callbacks
+):
+    """Test the cached sets load with the marker, expire and take follows"""
+    profile, friend, fan = profile_factory(), profile_factory(), profile_factory()
+    friend.follow(profile)
+    following = graph.FOLLOWING_KEY.format(pkid=profile.pkid)
+    followers = graph.FOLLOWERS_KEY.format(pkid=profile.pkid)
+
+    assert graph.following_count(profile.pkid) == 0
+    assert graph.followers_count(profile.pkid) == 1
+    assert fake_redis.smembers(following) == {b""}
+    assert 0 < fake_redis.ttl(followers) <= settings.SOCIAL_GRAPH_TIMEOUT
+
+    with django_capture_on_commit_callbacks(execute=True):
+        profile.follow(friend)
+        fan.follow(profile)
+    assert fake_redis.smembers(following) == {b"", str(friend.pkid).encode()}
+    assert graph.followers_count(profile.pkid) == 2
+    assert graph.mutual_pkids(profile.pkid) == {friend.pkid}
+    # Sets that weren't loaded are left for the next read to load whole
+    assert not fake_redis.exists(graph.FOLLOWING_KEY.format(pkid=fan.pkid))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        profile.unfollow(friend)
+    assert not graph.is_following(profile.pkid, friend.pkid)
+    assert graph.following_count(profile.pkid) == 0
+
+
+@pytest.mark.django_db
+def test_rebuild_graph_replaces_stale_sets(fake_redis, profile_factory):
+    """Test rebuild_graph reloads sets that drifted from the follows table"""
+    profile, friend = profile_factory(), profile_factory()
+    profile.follow(friend)
+    fake_redis.sadd(graph.FOLLOWING_KEY.format(pkid=profile.pkid), "", 999)
+
+    assert graph.rebuild_graph([profile.pkid, friend.pkid], batch_size=1) == 2
+    assert graph.following_pkids(profile.pkid) == {friend.pkid}
+    assert graph.follower_pkids(friend.pkid) == {profile.pkid}
+
+
+@pytest.mark.django_db
+def test_saving_stale_profiles_keeps_follow_counts(profile_factory):
+    """Test full saves of instances loaded before a follow keep the counts"""
+    follower, followee = profile_factory(), profile_factory()
+    stale = Profile.objects.get(pkid=followee.pkid)
+    follower.follow(followee)
+
+    followee.user.save()
+    follower.save()
+    stale.about_me = "Updated"
+    stale.save()
+
+    followee.refresh_from_db()
+    follower.refresh_from_db()
+    assert (followee.followers_count, followee.about_me) == (1, "Updated")
+    assert follower.following_count == 1
@@ -0,0 +1,85 @@
+import smtplib
+import time
+
+import pytest
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core_apps.profiles import views
+from core_apps.profiles.notifications import (
+    DIGEST_ATTEMPTS_KEY,
+    DUE_RECIPIENTS_KEY,
+    MAX_DIGEST_ATTEMPTS,
+    build_digest,
+    queue_follow_notification,
+    send_due_digests,
+)
+
+
+@pytest.mark.django_db
+def test_follow_queues_notification_without_sending(
+    monkeypatch, test_profile, test_profile2, django_capture_on_commit_callbacks
+):
+    """Test following queues a digest event instead of sending an email"""
+    queued = []
+    monkeypatch.setattr(
+        views, "queue_follow_notification", lambda *event: queued.append(event)
+    )
+    client = APIClient()
+    client.force_authenticate(test_profile.user)
+
+    url = reverse("follow-unfollow", kwargs={"username": test_profile2.user.username})
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(url)
+
+    assert response.status_code == 200
+    assert queued == [(test_profile2.user.pkid, test_profile.user.username)]
+    assert mail.outbox == []
+
+
+def test_digest_names_the_first_followers():
+    """Test a digest names a few followers and counts the rest"""
+    single = build_digest("ama", "ama@example.com", ["kofi"])
+    several = build_digest("ama", "ama@example.com", ["a", "b", "c", "d", "e"])
+
+    assert single.subject == "A new user follows you"
+    assert "the user kofi now follows you" in single.body
+    assert several.subject == "5 new users follow you"
+    assert "a, b, c and 2 others now follow you" in several.body
+    assert several.to == ["ama@example.com"]
+
+
+class RejectingEmailBackend(locmem.EmailBackend):
+    """Outbox backend whose server rejects mail to rejected@example.com"""
+
+    def send_messages(self, messages):
+        if any("rejected@example.com" in message.to for message in messages):
+            raise smtplib.SMTPRecipientsRefused({"rejected@example.com": (550, b"")})
+        return super().send_messages(messages)
+
+
+@pytest.mark.django_db
+def test_failed_digest_is_retried_alone(fake_redis, settings, user_factory):
+    """Test a rejected digest is retried with backoff, then dropped"""
+    settings.CELERY_EMAIL_BACKEND = f"{__name__}.RejectingEmailBackend"
+    settings.FOLLOW_DIGEST_WINDOW = 60
+    accepted = user_factory(email="accepted@example.com")
+    rejected = user_factory(email="rejected@example.com")
+    queue_follow_notification(accepted.pkid, "kofi")
+    queue_follow_notification(rejected.pkid, "kofi")
+
+    now = time.time() + 60
+    assert send_due_digests(now) == 1
+    assert [message.to for message in mail.outbox] == [["accepted@example.com"]]
+    assert fake_redis.zrange(DUE_RECIPIENTS_KEY, 0, -1, withscores=True) == [
+        (str(rejected.pkid).encode(), now + 60)
+    ]
+
+    for attempt in range(1, MAX_DIGEST_ATTEMPTS):
+        now += 60 * 2 ** (attempt - 1)
+        assert send_due_digests(now) == 0
+    assert len(mail.outbox) == 1
+    assert fake_redis.zcard(DUE_RECIPIENTS_KEY) == 0
+    assert not fake_redis.exists(DIGEST_ATTEMPTS_KEY)
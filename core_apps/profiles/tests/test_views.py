@@ -1,7 +1,10 @@
 import pytest
 from django.test import RequestFactory
+from django.urls import reverse
 from rest_framework.exceptions import NotFound
+from rest_framework.test import APIClient
 
+from core_apps.profiles import graph, views
 from core_apps.profiles.views import (FollowUnfollowAPIView,
                                       ProfileDetailAPIView,
                                       ProfileListAPIView)
@@ -16,7 +19,7 @@ def test_get_profile_queryset(profile, rf: RequestFactory):
 
     view.request = request
 
-    assert profile in view.queryset
+    assert profile in view.get_queryset()
 
 def test_get_user_profile_wrong_username(profile, rf: RequestFactory):
     """Test get user profile wrong username"""
@@ -58,3 +61,71 @@ def test_follow_unfollow_user(test_profile, test_profile2, rf: RequestFactory):
     
     assert response.status_code == 200
     assert response.data["detail"] == f"You now follow {test_profile2.user.username}"
+
+
+@pytest.mark.django_db
+def test_followers_are_cursor_paginated(test_profile, profile_factory):
+    """Test followers are paged most recent follow first with cursors"""
+    followers = [profile_factory() for _ in range(3)]
+    for follower in followers:
+        follower.follow(test_profile)
+    client = APIClient()
+    client.force_authenticate(test_profile.user)
+
+    url = reverse("my-followers", kwargs={"username": test_profile.user.username})
+    first_page = client.get(url, {"page_size": 2}).json()
+    second_page = client.get(first_page["next"]).json()
+
+    usernames = [follower.user.username for follower in reversed(followers)]
+    assert [f["username"] for f in first_page["followers"]] == usernames[:2]
+    assert [f["username"] for f in second_page["followers"]] == usernames[2:]
+    assert second_page["next"] is None
+    assert first_page["num_of_followers"] == 3
+
+
+@pytest.mark.django_db
+def test_following_resolved_once_per_page(
+    test_profile, profile_factory, django_assert_max_num_queries
+):
+    """Test listing profiles resolves "following" in a single query"""
+    profiles = [profile_factory() for _ in range(5)]
+    test_profile.follow(profiles[0])
+    test_profile.follow(profiles[2])
+    client = APIClient()
+    client.force_authenticate(test_profile.user)
+
+    with django_assert_max_num_queries(6):
+        response = client.get(reverse("all-profiles"), {"page_size": 10})
+
+    following = {
+        profile["username"]: profile["following"]
+        for profile in response.json()["profiles"]["results"]
+    }
+    assert following[profiles[0].user.username] is True
+    assert following[profiles[2].user.username] is True
+    assert following[profiles[1].user.username] is False
+
+
+@pytest.mark.django_db
+def test_follow_unfollow_decided_by_follows_table(
+    fake_redis, monkeypatch, test_profile, test_profile2
+):
+    """Test a stale cached set doesn't let a user follow or unfollow twice"""
+    queued = []
+    monkeypatch.setattr(
+        views, "queue_follow_notification", lambda *event: queued.append(event)
+    )
+    client = APIClient()
+    client.force_authenticate(test_profile.user)
+    url = reverse("follow-unfollow", kwargs={"username": test_profile2.user.username})
+
+    test_profile.follow(test_profile2)
+    # The set was loaded before the follow and missed its write-through
+    following = graph.FOLLOWING_KEY.format(pkid=test_profile.pkid)
+    fake_redis.sadd(following, "")
+    assert client.post(url).status_code == 400
+
+    test_profile.unfollow(test_profile2)
+    fake_redis.sadd(following, test_profile2.pkid)
+    assert client.delete(url).status_code == 400
+    assert queued == []
@@ -1,7 +1,8 @@
 from typing import Dict, Union
 
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
+from django.db import transaction
+from django.db.models import QuerySet
 from django.http import HttpRequest
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
@@ -10,13 +11,17 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from modern_blog_api.settings.development import DEFAULT_FROM_EMAIL
-
 from .exceptions import CantFollowYourself, NotYourProfile
 from .models import Profile
-from .pagination import ProfilePagination
+from .notifications import queue_follow_notification
+from .pagination import FollowPagination, ProfilePagination
 from .renderers import ProfileJSONRenderer, ProfilesJSONRenderer
-from .serializers import FollowingSerializer, ProfileSerializer, UpdateProfileSerializer
+from .serializers import (
+    USER_FIELDS,
+    FollowingSerializer,
+    ProfileSerializer,
+    UpdateProfileSerializer,
+)
 
 # Get user model
 User = get_user_model()
@@ -34,6 +39,23 @@ class ProfileListAPIView(generics.ListAPIView):
     renderer_classes = (ProfilesJSONRenderer,)
     pagination_class = ProfilePagination
 
+    def get_queryset(self) -> QuerySet:
+        """
+        Get the profiles, loading only what the requested fields read.
+
+        Returns:
+        - QuerySet: The profiles, joined to their users unless no user
+            field was asked for, and without about_me if omitted.
+        """
+        queryset = super().get_queryset()
+        serializer = self.get_serializer_class()(context={"request": self.request})
+        fields = set(serializer.fields)
+        if fields & USER_FIELDS:
+            queryset = queryset.select_related("user")
+        if "about_me" not in fields:
+            queryset = queryset.defer("about_me")
+        return queryset
+
 
 class ProfileDetailAPIView(generics.RetrieveAPIView):
     """
@@ -111,12 +133,21 @@ def get_my_followers(request: Request, username: str) -> Response:
 
     userprofile_instance = Profile.objects.get(user__pkid=specific_user.pkid)
 
-    user_followers = userprofile_instance.followed_by.all()
-    serializer = FollowingSerializer(user_followers, many=True)
+    # Page through the follows table rather than loading every follower
+    paginator = FollowPagination()
+    follows = paginator.paginate_queryset(
+        Profile.follows.through.objects.filter(
+            to_profile=userprofile_instance
+        ).select_related("from_profile__user"),
+        request,
+    )
+    serializer = FollowingSerializer(
+        [follow.from_profile for follow in follows], many=True
+    )
     formatted_response = {
         "status_code": status.HTTP_200_OK,
-        "followers": serializer.data,
-        "num_of_followers": len(serializer.data),
+        **paginator.get_paginated_data(serializer.data, results_key="followers"),
+        "num_of_followers": userprofile_instance.followers_count,
     }
 
     return Response(formatted_response, status=status.HTTP_200_OK)
@@ -129,6 +160,7 @@ class FollowUnfollowAPIView(generics.GenericAPIView):
 
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = FollowingSerializer
+    pagination_class = FollowPagination
 
     def get(self, request: HttpRequest, username: str) -> Response:
         try:
@@ -137,12 +169,23 @@ class FollowUnfollowAPIView(generics.GenericAPIView):
             raise NotFound("User with that username does not exist")
 
         userprofile_instance = Profile.objects.get(user__pkid=specific_user.pkid)
-        my_following_list = userprofile_instance.following_list()
-        serializer = ProfileSerializer(my_following_list, many=True)
+        # Page through the follows table rather than loading every followee
+        follows = self.paginate_queryset(
+            Profile.follows.through.objects.filter(
+                from_profile=userprofile_instance
+            ).select_related("to_profile__user")
+        )
+        serializer = ProfileSerializer(
+            [follow.to_profile for follow in follows],
+            many=True,
+            context=self.get_serializer_context(),
+        )
         formatted_response = {
             "status_code": status.HTTP_200_OK,
-            "users_i_follow": serializer.data,
-            "num_users_i_follow": len(serializer.data),
+            **self.paginator.get_paginated_data(
+                serializer.data, results_key="users_i_follow"
+            ),
+            "num_users_i_follow": userprofile_instance.following_count,
         }
         return Response(formatted_response, status=status.HTTP_200_OK)
 
@@ -158,20 +201,20 @@ class FollowUnfollowAPIView(generics.GenericAPIView):
         userprofile_instance = Profile.objects.get(user__pkid=specific_user.pkid)
         current_user_profile = request.user.profile
 
-        if current_user_profile.check_following(userprofile_instance):
+        # Decided by the follows table, not the cached graph, so only one
+        # of concurrent requests follows and queues a notification
+        if not current_user_profile.follow(userprofile_instance):
             formatted_response = {
                 "status_code": status.HTTP_400_BAD_REQUEST,
                 "errors": f"You already follow {specific_user.username}",
             }
             return Response(formatted_response, status=status.HTTP_400_BAD_REQUEST)
 
-        current_user_profile.follow(userprofile_instance)
-
-        subject = "A new user follows you"
-        message = f"Hi there {specific_user.username}!!, the user {current_user_profile.user.username} now follows you"
-        from_email = DEFAULT_FROM_EMAIL
-        recipient_list = [specific_user.email]
-        send_mail(subject, message, from_email, recipient_list, fail_silently=True)
+        # Emailed in a digest by the send_follow_digests task
+        recipient_pkid, follower = specific_user.pkid, request.user.username
+        transaction.on_commit(
+            lambda: queue_follow_notification(recipient_pkid, follower)
+        )
 
         return Response(
             {
@@ -189,14 +232,13 @@ class FollowUnfollowAPIView(generics.GenericAPIView):
         userprofile_instance = Profile.objects.get(user__pkid=specific_user.pkid)
         current_user_profile = request.user.profile
 
-        if not current_user_profile.check_following(userprofile_instance):
+        if not current_user_profile.unfollow(userprofile_instance):
             formatted_response = {
                 "status_code": status.HTTP_400_BAD_REQUEST,
                 "errors": f"You do not follow {specific_user.username}",
             }
             return Response(formatted_response, status=status.HTTP_400_BAD_REQUEST)
 
-        current_user_profile.unfollow(userprofile_instance)
         formatted_response = {
             "status_code": status.HTTP_200_OK,
             "detail": f"You have unfollowed {specific_user.username}",
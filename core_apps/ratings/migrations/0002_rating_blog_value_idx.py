@@ -0,0 +1,17 @@
+# Generated by Django 3.2.11 on 2026-10-18 00:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ratings", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="rating",
+            index=models.Index(fields=["blog", "value"], name="rating_blog_value_idx"),
+        ),
+    ]
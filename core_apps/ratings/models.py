@@ -62,9 +62,14 @@ class Rating(TimeStampedUUIDModel):
         Attributes:
         - unique_together (list): Specifies the
             unique-together constraint for the model.
+        - indexes (list): Composite index serving per-blog
+            rating aggregates without reading the table.
         """
 
         unique_together: List[str] = ["rated_by", "blog"]
+        indexes: List[models.Index] = [
+            models.Index(fields=["blog", "value"], name="rating_blog_value_idx")
+        ]
 
     def __str__(self) -> str:
         """
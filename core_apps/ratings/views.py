@@ -1,8 +1,9 @@
+from django.db import transaction
 from rest_framework import permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 
-from core_apps.blogs.models import Blog
+from core_apps.blogs.models import Blog, BlogStats
 
 from .exceptions import AlreadyRated, CantRateYourBlog
 from .models import Rating
@@ -41,12 +42,16 @@ def create_blog_rating_view(request, blog_id):
         formatted_response = {"detail": "You can't give a zero rating"}
         return Response(formatted_response, status=status.HTTP_400_BAD_REQUEST)
     else:
-        rating = Rating.objects.create(  # noqa: F841
-            blog=blog,
-            rated_by=request.user,
-            value=data["value"],
-            review=data["review"],
-        )
+        with transaction.atomic():
+            rating = Rating.objects.create(
+                blog=blog,
+                rated_by=request.user,
+                value=data["value"],
+                review=data["review"],
+            )
+            BlogStats.objects.increment(
+                blog, ratings_count=1, ratings_sum=int(rating.value)
+            )
 
         return Response(
             {"success": "Rating has been added"}, status=status.HTTP_201_CREATED
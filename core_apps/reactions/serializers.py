@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from core_apps.common.serializers import DATETIME_FORMAT
+
 from .models import Reaction
 
 
@@ -11,27 +13,13 @@ class ReactionSerializer(serializers.ModelSerializer):
         Reaction model.
 
     Attributes:
-    - created_at (str): Serializer method field to
-        represent the creation date.
+    - created_at (str): Creation date, formatted
+        with DATETIME_FORMAT.
     - Meta (class): Inner class defining metadata
         options for the serializer.
     """
 
-    created_at = serializers.SerializerMethodField()
-
-    def get_created_at(self, obj: Reaction) -> str:
-        """
-        Get the formatted creation date of the reaction.
-
-        Args:
-        - obj (Reaction): The Reaction object.
-
-        Returns:
-        - str: The formatted creation date.
-        """
-        now = obj.created_at
-        formatted_date = now.strftime("%m/%d/%Y, %H:%M:%S")
-        return formatted_date
+    created_at = serializers.DateTimeField(format=DATETIME_FORMAT, read_only=True)
 
     class Meta:
         """
@@ -1,17 +1,33 @@
 from typing import Any, Dict, List, Tuple
 
+from django.db import transaction
 from django.http import HttpRequest
 from rest_framework import permissions, status
 from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from core_apps.blogs.models import Blog
+from core_apps.blogs.models import Blog, BlogStats
 
 from .models import Reaction
 from .serializers import ReactionSerializer
 
 
+def reaction_counter_field(reaction: Any) -> str:
+    """
+    Helper function to map a reaction value to its BlogStats counter.
+
+    Args:
+    - reaction (Any): The reaction value (1 or -1, as int or str).
+
+    Returns:
+    - str: The name of the BlogStats counter field.
+    """
+    if int(reaction) > 0:
+        return "likes_count"
+    return "dislikes_count"
+
+
 def find_blog_helper(slug: str) -> Blog:
     """
     Helper function to find a blog by slug.
@@ -56,16 +72,23 @@ class ReactionAPIView(APIView):
         - Tuple: A tuple containing the response message
             and HTTP status code.
         """
-        try:
-            existing_reaction = Reaction.objects.get(blog=blog, user=user)
-            existing_reaction.delete()
-        except Reaction.DoesNotExist:
-            pass
-
         data = {"blog": blog.pkid, "user": user.pkid, "reaction": reaction}
         serializer = self.serializer_class(data=data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+
+        with transaction.atomic():
+            deltas = {}
+            try:
+                existing_reaction = Reaction.objects.get(blog=blog, user=user)
+                existing_reaction.delete()
+                deltas[reaction_counter_field(existing_reaction.reaction)] = -1
+            except Reaction.DoesNotExist:
+                pass
+
+            new_reaction = serializer.save()
+            counter = reaction_counter_field(new_reaction.reaction)
+            deltas[counter] = deltas.get(counter, 0) + 1
+            BlogStats.objects.increment(blog, **deltas)
 
         response = {"message": "Reaction successfully set"}
         status_code = status.HTTP_201_CREATED
@@ -95,7 +118,11 @@ class ReactionAPIView(APIView):
             existing_same_reaction = Reaction.objects.get(
                 blog=blog, user=user, reaction=reaction
             )
-            existing_same_reaction.delete()
+            with transaction.atomic():
+                existing_same_reaction.delete()
+                BlogStats.objects.increment(
+                    blog, **{reaction_counter_field(reaction): -1}
+                )
             response = {
                 "message": f"You no-longer \
                 {'LIKE' if reaction in [1,'1'] else 'DISLIKE'}"
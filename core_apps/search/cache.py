@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from django.conf import settings
+from rest_framework.request import Request
+
+from core_apps.common.cache import bump_versions, get_versions
+
+# Namespace bumped whenever the search index is written to
+SEARCH_INDEX_NAMESPACE = "search:index"
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache whose entries also expire.
+
+    Attributes:
+    - max_entries (int): Entries kept before the least recently used
+        one is evicted.
+    - timeout (float): Seconds an entry is served for.
+
+    Methods:
+    - get: Get a fresh entry, or None.
+    - set: Store an entry, evicting the least recently used one.
+    - clear: Drop every entry.
+    """
+
+    def __init__(self, max_entries: int, timeout: float) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+        - max_entries (int): Entries kept before evicting.
+        - timeout (float): Seconds an entry is served for.
+        """
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value and mark it as recently used.
+
+        Args:
+        - key (Hashable): The cache key.
+
+        Returns:
+        - Optional[Any]: The value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value, evicting the least recently used entry if full.
+
+        Args:
+        - key (Hashable): The cache key.
+        - value (Any): The value to cache.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Search result pages cached by this process. Entries are keyed by the
+# index version, so an index update shared through the django cache
+# invalidates them in every API process.
+search_results = LRUCache(
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    timeout=settings.SEARCH_CACHE_TIMEOUT,
+)
+
+
+def normalize_query(value: str) -> str:
+    """Case fold a search query and collapse its whitespace."""
+    return " ".join(value.casefold().split())
+
+
+def search_cache_key(request: Request) -> Hashable:
+    """
+    Build the cache key of a search result page.
+
+    Only the q parameter is normalized; filters such as author and tags
+        are matched case-sensitively, so their values are kept as given.
+
+    Args:
+    - request (Request): The search request.
+
+    Returns:
+    - Hashable: The index version, path and query parameters.
+    """
+    version = get_versions([SEARCH_INDEX_NAMESPACE])[SEARCH_INDEX_NAMESPACE]
+    params = []
+    for name, values in request.query_params.lists():
+        if name == "q":
+            values = [normalize_query(value) for value in values]
+        params.append((name, tuple(sorted(values))))
+    return version, request.path, tuple(sorted(params))
+
+
+def invalidate_search_results() -> None:
+    """Invalidate the cached search results of every API process."""
+    bump_versions([SEARCH_INDEX_NAMESPACE])
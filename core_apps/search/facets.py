@@ -0,0 +1,186 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+from django.db.models import Count, QuerySet
+from django.db.models.functions import Trunc
+from django.utils import timezone
+from haystack.query import SearchQuerySet
+from rest_framework import serializers
+from rest_framework.request import Request
+
+from core_apps.blogs.models import Tag
+
+from .filters import index_datetime
+
+# Buckets the created_at histogram can be grouped by, with the span
+# covered when the request doesn't bound created_at
+DATE_GAPS = {
+    "day": timedelta(days=31),
+    "month": timedelta(days=366),
+    "year": timedelta(days=3660),
+}
+DEFAULT_DATE_GAP = "month"
+
+# Values returned per field facet
+DEFAULT_FACET_LIMIT = 10
+MAX_FACET_LIMIT = 50
+
+
+def get_facet_options(request: Request) -> Tuple[str, int]:
+    """
+    Read the facet options a request asks for.
+
+    Args:
+    - request (Request): The facets request.
+
+    Returns:
+    - Tuple[str, int]: The ?date_gap= of the created histogram and the
+        ?facet_limit= on values per field facet, capped at
+        MAX_FACET_LIMIT.
+
+    Raises:
+    - ValidationError: If date_gap is unknown or facet_limit is not a
+        whole number.
+    """
+    params = request.query_params
+    gap = params.get("date_gap", DEFAULT_DATE_GAP)
+    if gap not in DATE_GAPS:
+        raise serializers.ValidationError(
+            {"date_gap": f"Choose one of {', '.join(DATE_GAPS)}."}
+        )
+    try:
+        limit = int(params.get("facet_limit", DEFAULT_FACET_LIMIT))
+    except ValueError:
+        raise serializers.ValidationError(
+            {"facet_limit": "A whole number is required."}
+        )
+    return gap, max(1, min(limit, MAX_FACET_LIMIT))
+
+
+def date_range(filters: Dict[str, Any], gap: str) -> Tuple[datetime, datetime]:
+    """
+    Get the created_at range the date histogram covers.
+
+    Args:
+    - filters (Dict[str, Any]): Filters from get_search_filters.
+    - gap (str): One of DATE_GAPS.
+
+    Returns:
+    - Tuple[datetime, datetime]: The requested created_at bounds, or
+        the span of the gap ending now, with the start rounded down to
+        a bucket boundary.
+    """
+    end = filters["created_before"] or timezone.now()
+    start = (filters["created_after"] or end - DATE_GAPS[gap]).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    if gap != "day":
+        start = start.replace(day=1)
+    if gap == "year":
+        start = start.replace(month=1)
+    return start, end
+
+
+def _field_counts(counts: List[Tuple[Any, int]], limit: int) -> List[Dict[str, Any]]:
+    """Format (value, count) pairs, most frequent first, dropping empty values."""
+    counts = sorted(
+        ((value, count) for value, count in counts if value and count),
+        key=lambda item: (-item[1], item[0]),
+    )
+    return [{"value": value, "count": count} for value, count in counts[:limit]]
+
+
+def haystack_facets(
+    queryset: SearchQuerySet, filters: Dict[str, Any], gap: str, limit: int
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Count the tags, authors and creation dates of search results.
+
+    The counts are computed by the search engine in the same query as
+        the results.
+
+    Args:
+    - queryset (SearchQuerySet): The filtered search results.
+    - filters (Dict[str, Any]): Filters from get_search_filters.
+    - gap (str): One of DATE_GAPS, the width of the date buckets.
+    - limit (int): Values returned per field facet.
+
+    Returns:
+    - Dict[str, List[Dict[str, Any]]]: The tags, authors and created
+        buckets with their counts.
+    """
+    start, end = date_range(filters, gap)
+    counts = (
+        queryset.facet("tags")
+        .facet("author")
+        .date_facet(
+            "created",
+            start_date=index_datetime(start),
+            end_date=index_datetime(end),
+            gap_by=gap,
+        )
+        .facet_counts()
+    )
+    fields = counts.get("fields", {})
+    created = []
+    for bucket, count in counts.get("dates", {}).get("created", []):
+        if count:
+            # Whoosh keys date buckets by their (start, end) range
+            bucket_start = bucket[0] if isinstance(bucket, tuple) else bucket
+            bucket_start = timezone.make_aware(bucket_start, timezone.utc)
+            created.append({"value": bucket_start.isoformat(), "count": count})
+    return {
+        "tags": _field_counts(fields.get("tags", []), limit),
+        "authors": _field_counts(fields.get("author", []), limit),
+        "created": sorted(created, key=lambda bucket: bucket["value"]),
+    }
+
+
+def postgres_facets(
+    blogs: QuerySet, filters: Dict[str, Any], gap: str, limit: int
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Count the tags, authors and creation dates of matching blogs.
+
+    Each facet is one GROUP BY over the matching blog pkids, the
+        PostgreSQL counterpart of haystack_facets.
+
+    Args:
+    - blogs (QuerySet): The filtered search results.
+    - filters (Dict[str, Any]): Filters from get_search_filters.
+    - gap (str): One of DATE_GAPS, the width of the date buckets.
+    - limit (int): Values returned per field facet.
+
+    Returns:
+    - Dict[str, List[Dict[str, Any]]]: The tags, authors and created
+        buckets with their counts.
+    """
+    matching = blogs.order_by().values("pkid")
+    tags = (
+        Tag.objects.filter(blogs__in=matching)
+        .values_list("tag")
+        .annotate(count=Count("blogs"))
+        .order_by("-count", "tag")[:limit]
+    )
+    authors = (
+        blogs.order_by()
+        .values_list("author__username")
+        .annotate(count=Count("pkid"))
+        .order_by("-count", "author__username")[:limit]
+    )
+    start, end = date_range(filters, gap)
+    created = (
+        blogs.order_by()
+        .filter(created_at__gte=start, created_at__lt=end)
+        .annotate(bucket=Trunc("created_at", gap))
+        .values_list("bucket")
+        .annotate(count=Count("pkid"))
+        .order_by("bucket")
+    )
+    return {
+        "tags": _field_counts(list(tags), limit),
+        "authors": _field_counts(list(authors), limit),
+        "created": [
+            {"value": bucket.isoformat(), "count": count} for bucket, count in created
+        ],
+    }
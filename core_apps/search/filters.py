@@ -0,0 +1,159 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from django.db.models import QuerySet
+from django.utils import datetime_safe, timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from drf_haystack.filters import HaystackAutocompleteFilter
+from haystack.query import SQ, SearchQuerySet
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.request import Request
+
+# Query parameters filtering search results
+TAGS_PARAM = "tags"
+AUTHOR_PARAM = "author"
+CREATED_AFTER_PARAM = "created_after"
+CREATED_BEFORE_PARAM = "created_before"
+FILTER_PARAMS = {TAGS_PARAM, AUTHOR_PARAM, CREATED_AFTER_PARAM, CREATED_BEFORE_PARAM}
+
+
+def _parse_datetime_param(params: Any, name: str) -> Optional[datetime]:
+    """
+    Parse an ISO date or datetime query parameter.
+
+    Raises:
+    - ValidationError: If the parameter is not a date or datetime.
+    """
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            date = parse_date(value)
+            parsed = datetime(date.year, date.month, date.day) if date else None
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise serializers.ValidationError({name: "Enter an ISO date or datetime."})
+    return parsed if timezone.is_aware(parsed) else timezone.make_aware(parsed)
+
+
+def index_datetime(value: datetime) -> datetime:
+    """
+    Convert an aware datetime to the form dates are indexed in.
+
+    Whoosh drops the timezone of indexed dates, which Django loads in
+        UTC, so filters and date facets compare naive UTC datetimes.
+        Haystack's Whoosh backend only accepts django's datetime_safe
+        datetimes for date facets.
+    """
+    return datetime_safe.new_datetime(timezone.make_naive(value, timezone.utc))
+
+
+def get_search_filters(request: Request) -> Dict[str, Any]:
+    """
+    Read the search filters a request asks for.
+
+    Args:
+    - request (Request): The search request.
+
+    Returns:
+    - Dict[str, Any]: The tags (any of), author username and created_at
+        bounds to filter by; absent filters are None.
+
+    Raises:
+    - ValidationError: If a created_at bound is not a date or datetime.
+    """
+    params = request.query_params
+    tags = [tag.strip() for tag in params.get(TAGS_PARAM, "").split(",") if tag.strip()]
+    return {
+        "tags": tags or None,
+        "author": params.get(AUTHOR_PARAM) or None,
+        "created_after": _parse_datetime_param(params, CREATED_AFTER_PARAM),
+        "created_before": _parse_datetime_param(params, CREATED_BEFORE_PARAM),
+    }
+
+
+def filter_search_queryset(
+    queryset: SearchQuerySet, filters: Dict[str, Any]
+) -> SearchQuerySet:
+    """
+    Narrow a SearchQuerySet to the search filters.
+
+    Args:
+    - queryset (SearchQuerySet): The search results.
+    - filters (Dict[str, Any]): Filters from get_search_filters.
+
+    Returns:
+    - SearchQuerySet: The results matching every filter.
+    """
+    conditions: List[SQ] = []
+    if filters["tags"]:
+        conditions.append(SQ(tags__in=filters["tags"]))
+    if filters["author"]:
+        conditions.append(SQ(author_exact__exact=filters["author"]))
+    if filters["created_after"]:
+        conditions.append(SQ(created__gte=index_datetime(filters["created_after"])))
+    if filters["created_before"]:
+        conditions.append(SQ(created__lte=index_datetime(filters["created_before"])))
+    for condition in conditions:
+        queryset = queryset.filter(condition)
+    return queryset
+
+
+def filter_blog_queryset(blogs: QuerySet, filters: Dict[str, Any]) -> QuerySet:
+    """
+    Narrow blogs to the search filters, for the postgres search backend.
+
+    Args:
+    - blogs (QuerySet): The blogs matching the search query.
+    - filters (Dict[str, Any]): Filters from get_search_filters.
+
+    Returns:
+    - QuerySet: The blogs matching every filter.
+    """
+    if filters["tags"]:
+        tagged = blogs.model.tags.through.objects.filter(tag__tag__in=filters["tags"])
+        blogs = blogs.filter(pkid__in=tagged.values("blog_id"))
+    if filters["author"]:
+        blogs = blogs.filter(author__username=filters["author"])
+    if filters["created_after"]:
+        blogs = blogs.filter(created_at__gte=filters["created_after"])
+    if filters["created_before"]:
+        blogs = blogs.filter(created_at__lte=filters["created_before"])
+    return blogs
+
+
+class BlogSearchFilter(BaseFilterBackend):
+    """
+    Filter backend narrowing search results by tag, author and date.
+
+    ?tags=a,b keeps blogs with any of the tags, ?author= blogs by that
+        username, and ?created_after=/?created_before= blogs created in
+        that range. The filters run in the search engine.
+    """
+
+    def filter_queryset(
+        self, request: Request, queryset: SearchQuerySet, view: Any
+    ) -> SearchQuerySet:
+        """Narrow the search results to the requested filters."""
+        return filter_search_queryset(queryset, get_search_filters(request))
+
+
+class BlogAutocompleteFilter(HaystackAutocompleteFilter):
+    """
+    Autocomplete filter leaving the BlogSearchFilter parameters alone.
+
+    Without this, ?author= would also be matched word by word against
+        the analyzed author field.
+    """
+
+    @staticmethod
+    def get_request_filters(request: Request) -> Any:
+        """Get the query parameters other than the search filters."""
+        params = request.query_params.copy()
+        for name in FILTER_PARAMS:
+            params.pop(name, None)
+        return params
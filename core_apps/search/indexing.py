@@ -0,0 +1,207 @@
+import logging
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Max, Min, QuerySet
+from haystack import connections
+from redis.exceptions import RedisError
+
+from core_apps.common.redis_client import get_redis
+
+from .cache import invalidate_search_results
+from .search_indexes import BlogIndex
+
+logger = logging.getLogger(__name__)
+
+# Set of blog pkids saved since the last flush, waiting to be reindexed
+PENDING_UPDATES_KEY = "search:blogs:pending"
+# Set of index identifiers of blogs deleted since the last flush
+PENDING_REMOVALS_KEY = "search:blogs:removed"
+
+# Blogs read and written to the search backend per batch
+INDEX_BATCH_SIZE = 500
+
+# SEARCH_BACKEND value serving search from Blog.search_vector
+POSTGRES_BACKEND = "postgres"
+
+
+def uses_postgres() -> bool:
+    """Whether search is served from Blog.search_vector."""
+    return settings.SEARCH_BACKEND == POSTGRES_BACKEND
+
+
+def get_blog_index(using: str = "default") -> BlogIndex:
+    """Get the BlogIndex registered with a search connection."""
+    from core_apps.blogs.models import Blog
+
+    return connections[using].get_unified_index().get_index(Blog)
+
+
+def queue_updates(blog_pkids: Iterable[int]) -> None:
+    """
+    Queue blogs to be reindexed by the next flush_index_queue.
+
+    Repeated saves of a blog before the flush collapse into one entry.
+        Redis errors are logged; the blogs are picked up by the next
+        update_blog_index --since run.
+
+    Args:
+    - blog_pkids (Iterable[int]): The pkids of the blogs that changed.
+    """
+    blog_pkids = list(blog_pkids)
+    if not blog_pkids:
+        return
+    try:
+        get_redis().sadd(PENDING_UPDATES_KEY, *blog_pkids)
+    except RedisError as exc:
+        logger.warning(f"could not queue search index update: {exc}")
+
+
+def queue_removal(identifier: str) -> None:
+    """
+    Queue a deleted blog to be removed from the index.
+
+    Args:
+    - identifier (str): The index identifier of the blog,
+        e.g. "blogs.blog.42".
+    """
+    try:
+        client = get_redis()
+        pipeline = client.pipeline(transaction=False)
+        pipeline.sadd(PENDING_REMOVALS_KEY, identifier)
+        pipeline.srem(PENDING_UPDATES_KEY, identifier.rsplit(".", 1)[-1])
+        pipeline.execute()
+    except RedisError as exc:
+        logger.warning(f"could not queue search index removal: {exc}")
+
+
+def index_blogs(blogs: QuerySet, using: str = "default") -> int:
+    """
+    Write blogs to the search index in one backend update.
+
+    With the postgres search backend their search vectors are
+        recomputed in one UPDATE instead.
+
+    Args:
+    - blogs (QuerySet): The blogs to index, usually a pkid range or set
+        of BlogIndex.build_queryset().
+    - using (str): The search connection to write to.
+
+    Returns:
+    - int: Number of blogs indexed.
+    """
+    if uses_postgres():
+        return blogs.refresh_search_vectors()
+    index = get_blog_index(using)
+    blogs = list(blogs)
+    if blogs:
+        connections[using].get_backend().update(index, blogs)
+    return len(blogs)
+
+
+def flush_index_queue(
+    batch_size: int = INDEX_BATCH_SIZE, using: str = "default"
+) -> Tuple[int, int]:
+    """
+    Apply the queued index updates and removals.
+
+    Pending blogs are popped batch_size at a time and reindexed with a
+        single query and backend update per batch, so a burst of saves
+        costs one index write instead of one per save. A failed batch
+        is put back for the next flush. Cached search results are
+        invalidated once the writes are done.
+
+    Args:
+    - batch_size (int): Number of blogs reindexed per batch.
+    - using (str): The search connection to write to.
+
+    Returns:
+    - Tuple[int, int]: Number of blogs indexed and removed.
+    """
+    client = get_redis()
+    backend = connections[using].get_backend()
+    index = get_blog_index(using)
+
+    removed = 0
+    while True:
+        identifiers = client.spop(PENDING_REMOVALS_KEY, batch_size)
+        if not identifiers:
+            break
+        if uses_postgres():
+            # Search vectors are deleted along with their blogs
+            continue
+        try:
+            for identifier in identifiers:
+                backend.remove(identifier.decode())
+        except Exception:
+            client.sadd(PENDING_REMOVALS_KEY, *identifiers)
+            raise
+        removed += len(identifiers)
+
+    indexed = 0
+    while True:
+        pkids = client.spop(PENDING_UPDATES_KEY, batch_size)
+        if not pkids:
+            break
+        try:
+            indexed += index_blogs(
+                index.build_queryset(using=using).filter(
+                    pkid__in=[int(pkid) for pkid in pkids]
+                ),
+                using=using,
+            )
+        except Exception:
+            client.sadd(PENDING_UPDATES_KEY, *pkids)
+            raise
+    if indexed or removed:
+        invalidate_search_results()
+    return indexed, removed
+
+
+def pkid_ranges(
+    blogs: QuerySet, batch_size: int = INDEX_BATCH_SIZE
+) -> List[Tuple[int, int]]:
+    """
+    Split the pkids of blogs into ranges of at most batch_size pkids.
+
+    Args:
+    - blogs (QuerySet): The blogs to split.
+    - batch_size (int): The width of each range.
+
+    Returns:
+    - List[Tuple[int, int]]: Half-open (start, end) pkid ranges
+        covering every blog.
+    """
+    bounds = blogs.aggregate(first=Min("pkid"), last=Max("pkid"))
+    if bounds["first"] is None:
+        return []
+    return [
+        (start, start + batch_size)
+        for start in range(bounds["first"], bounds["last"] + 1, batch_size)
+    ]
+
+
+def index_range(
+    pkid_range: Tuple[int, int],
+    since: Optional[datetime] = None,
+    using: str = "default",
+) -> int:
+    """
+    Index the blogs in a pkid range, e.g. in a worker process.
+
+    Args:
+    - pkid_range (Tuple[int, int]): Half-open (start, end) pkid range.
+    - since (Optional[datetime]): Only index blogs updated at or after
+        this time.
+    - using (str): The search connection to write to.
+
+    Returns:
+    - int: Number of blogs indexed.
+    """
+    start, end = pkid_range
+    blogs = get_blog_index(using).build_queryset(using=using)
+    blogs = blogs.filter(pkid__gte=start, pkid__lt=end)
+    if since:
+        blogs = blogs.filter(updated_at__gte=since)
+    return index_blogs(blogs, using=using)
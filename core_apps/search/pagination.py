@@ -0,0 +1,16 @@
+from django.conf import settings
+from rest_framework.pagination import PageNumberPagination
+
+
+class SearchPagination(PageNumberPagination):
+    """
+    Page number pagination for search results.
+
+    The search engine returns hits by relevance and counts them itself,
+        so pages are sliced from the SearchQuerySet rather than keyed
+        by a cursor.
+    """
+
+    page_size = settings.HAYSTACK_SEARCH_RESULTS_PER_PAGE
+    page_size_query_param = "page_size"
+    max_page_size = 50
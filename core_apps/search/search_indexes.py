@@ -1,7 +1,8 @@
-from typing import Any
+from typing import Any, List
 
 from django.utils import timezone
 from haystack import indexes
+from whoosh.analysis import IDAnalyzer
 
 from core_apps.blogs.models import Blog
 
@@ -14,8 +15,16 @@ class BlogIndex(indexes.SearchIndex, indexes.Indexable):
         blog articles.
 
     Attributes:
-    - text (indexes.CharField): Field for the full-text search.
+    - text (indexes.CharField): Field for the full-text search, built
+        from the title, description, body, author and tags.
+    - autocomplete (indexes.EdgeNgramField): Prefix-matching field for
+        typeahead search on the title, description, author and tags.
     - author (indexes.CharField): Field for the author's username.
+    - author_exact (indexes.FacetCharField): The author's username as
+        a single term, for the author filter and facet.
+    - tags (indexes.MultiValueField): The blog's tag names, faceted.
+    - created (indexes.DateTimeField): The creation date as a date,
+        for the date range filters and histogram.
     - title (indexes.CharField): Field for the blog title.
     - body (indexes.CharField): Field for the blog body.
     - created_at (indexes.CharField): Field for the creation date.
@@ -23,12 +32,39 @@ class BlogIndex(indexes.SearchIndex, indexes.Indexable):
     """
 
     text = indexes.CharField(document=True)
+    autocomplete = indexes.EdgeNgramField()
     author = indexes.CharField(model_attr="author")
+    # Unanalyzed, so usernames are filtered and counted whole
+    author_exact = indexes.FacetCharField(facet_for="author", analyzer=IDAnalyzer())
+    tags = indexes.MultiValueField(faceted=True)
+    created = indexes.DateTimeField(model_attr="created_at", faceted=True)
     title = indexes.CharField(model_attr="title")
     body = indexes.CharField(model_attr="body")
     created_at = indexes.CharField(model_attr="created_at")
     updated_at = indexes.CharField(model_attr="updated_at")
 
+    @staticmethod
+    def prepare_text(obj: Blog) -> str:
+        """
+        Prepare the document text for full-text search.
+
+        Args:
+        - obj (Blog): The Blog object, with its author and tags loaded.
+
+        Returns:
+        - str: The title, description, body, author's username and
+            tags, one per line.
+        """
+        return "\n".join(
+            (
+                obj.title,
+                obj.description,
+                obj.body,
+                obj.author.username,
+                " ".join(tag.tag for tag in obj.tags.all()),
+            )
+        )
+
     @staticmethod
     def prepare_author(obj: Blog) -> str:
         """
@@ -42,6 +78,19 @@ class BlogIndex(indexes.SearchIndex, indexes.Indexable):
         """
         return "" if not obj.author else obj.author.username
 
+    @staticmethod
+    def prepare_tags(obj: Blog) -> List[str]:
+        """
+        Prepare the tag names for filtering and faceting.
+
+        Args:
+        - obj (Blog): The Blog object, with its tags loaded.
+
+        Returns:
+        - List[str]: The names of the blog's tags.
+        """
+        return [tag.tag for tag in obj.tags.all()]
+
     @staticmethod
     def prepare_autocomplete(obj: Blog) -> str:
         """
@@ -52,9 +101,16 @@ class BlogIndex(indexes.SearchIndex, indexes.Indexable):
 
         Returns:
         - str: Concatenated string of username, title,
-            and description for autocomplete.
+            description and tags for autocomplete.
         """
-        return " ".join((obj.author.username, obj.title, obj.description))
+        return " ".join(
+            (
+                obj.author.username,
+                obj.title,
+                obj.description,
+                *(tag.tag for tag in obj.tags.all()),
+            )
+        )
 
     def get_model(self):
         """
@@ -73,6 +129,21 @@ class BlogIndex(indexes.SearchIndex, indexes.Indexable):
         - using (Any): The database alias.
 
         Returns:
-        - QuerySet: The queryset of Blog objects to be indexed.
+        - QuerySet: The queryset of Blog objects to be indexed, with
+            their authors and tags loaded for the prepare methods.
+        """
+        return (
+            self.get_model()
+            .objects.filter(created_at__lte=timezone.now())
+            .select_related("author")
+            .prefetch_related("tags")
+        )
+
+    def get_updated_field(self) -> str:
+        """
+        Get the field update_index --age compares against.
+
+        Returns:
+        - str: The name of the blog's last update timestamp.
         """
-        return self.get_model().objects.filter(created_at__lte=timezone.now())
+        return "updated_at"
@@ -1,5 +1,7 @@
 from drf_haystack.serializers import HaystackSerializer
+from rest_framework import serializers
 
+from core_apps.blogs.models import Blog
 from core_apps.search.search_indexes import BlogIndex
 
 
@@ -34,3 +36,36 @@ class BlogSearchSerializer(HaystackSerializer):
         fields = ["author", "title", "body", "autocomplete", "created_at", "updated_at"]
         ignore_fields = ["autocomplete"]
         field_aliases = {"q": "autocomplete"}
+
+
+class PostgresBlogSearchSerializer(serializers.ModelSerializer):
+    """
+    Serializer for blogs found by the postgres search backend.
+
+    Renders a blog like BlogSearchSerializer renders a search result,
+        so both backends serve the same response.
+
+    Attributes:
+    - author (CharField): The author's username.
+    - created_at (CharField): The creation date, as indexed.
+    - updated_at (CharField): The last update date, as indexed.
+    - Meta (class): Inner class defining metadata
+        options for the serializer.
+    """
+
+    author = serializers.CharField(source="author.username")
+    created_at = serializers.CharField()
+    updated_at = serializers.CharField()
+
+    class Meta:
+        """
+        Meta options for the PostgresBlogSearchSerializer.
+
+        Attributes:
+        - model (Blog): The model to serialize.
+        - fields (list): List of fields to include in the
+            search results.
+        """
+
+        model = Blog
+        fields = ["author", "title", "body", "created_at", "updated_at"]
@@ -0,0 +1,112 @@
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import signals
+from haystack.signals import BaseSignalProcessor
+from haystack.utils import get_identifier
+
+from core_apps.blogs.models import Blog, Tag
+
+from .indexing import queue_removal, queue_updates
+
+
+class CelerySignalProcessor(BaseSignalProcessor):
+    """
+    Signal processor deferring index writes to a celery task.
+
+    Instead of writing to the search backend inside the request, like
+        haystack's RealtimeSignalProcessor, saved and deleted blogs are
+        queued in Redis once the transaction commits and written in
+        batches by the flush_search_index task (see
+        CELERY_BEAT_SCHEDULE). Renaming a user or a tag, or changing a
+        blog's tags, requeues the blogs affected, since the index stores
+        the author's username and the tag names.
+
+    Methods:
+    - setup: Connect the model signals.
+    - teardown: Disconnect the model signals.
+    - handle_save: Queue a saved blog, or a renamed author's blogs.
+    - handle_delete: Queue the removal of a deleted blog.
+    - handle_tags: Queue blogs whose tags changed or were renamed.
+    """
+
+    def setup(self) -> None:
+        """Connect the model signals."""
+        signals.post_save.connect(self.handle_save, sender=Blog)
+        signals.post_delete.connect(self.handle_delete, sender=Blog)
+        signals.post_save.connect(self.handle_save, sender=get_user_model())
+        signals.post_save.connect(self.handle_tags, sender=Tag)
+        signals.m2m_changed.connect(self.handle_tags, sender=Blog.tags.through)
+
+    def teardown(self) -> None:
+        """Disconnect the model signals."""
+        signals.post_save.disconnect(self.handle_save, sender=Blog)
+        signals.post_delete.disconnect(self.handle_delete, sender=Blog)
+        signals.post_save.disconnect(self.handle_save, sender=get_user_model())
+        signals.post_save.disconnect(self.handle_tags, sender=Tag)
+        signals.m2m_changed.disconnect(self.handle_tags, sender=Blog.tags.through)
+
+    def handle_save(self, sender: Any, instance: Any, **kwargs: Any) -> None:
+        """
+        Queue a saved blog, or the blogs of a saved user, for reindexing.
+
+        Args:
+        - sender (Any): The model class that sent the signal.
+        - instance (Any): The saved blog or user.
+        - **kwargs (Any): Additional keyword arguments.
+        """
+        if isinstance(instance, Blog):
+            pkid = instance.pkid
+            transaction.on_commit(lambda: queue_updates([pkid]))
+            return
+        update_fields = kwargs.get("update_fields")
+        if kwargs.get("created") or (update_fields and "username" not in update_fields):
+            # New users have no blogs, and saves like the last_login
+            # update on login can't have renamed the user
+            return
+        user_pkid = instance.pkid
+        transaction.on_commit(
+            lambda: queue_updates(
+                Blog.objects.filter(author_id=user_pkid).values_list("pkid", flat=True)
+            )
+        )
+
+    def handle_delete(self, sender: Any, instance: Blog, **kwargs: Any) -> None:
+        """
+        Queue a deleted blog for removal from the index.
+
+        Args:
+        - sender (Any): The model class that sent the signal.
+        - instance (Blog): The deleted blog.
+        - **kwargs (Any): Additional keyword arguments.
+        """
+        identifier = get_identifier(instance)
+        transaction.on_commit(lambda: queue_removal(identifier))
+
+    def handle_tags(self, sender: Any, instance: Any, **kwargs: Any) -> None:
+        """
+        Queue the blogs whose tags were changed or renamed.
+
+        Args:
+        - sender (Any): The Tag model, or the blog tags through model.
+        - instance (Any): The saved tag, or the blog or tag whose
+            relations changed.
+        - **kwargs (Any): Additional keyword arguments.
+        """
+        action = kwargs.get("action")
+        if action is None:
+            if kwargs.get("created"):
+                return
+            tag_pkid = instance.pkid
+            transaction.on_commit(
+                lambda: queue_updates(
+                    Blog.objects.filter(tags=tag_pkid).values_list("pkid", flat=True)
+                )
+            )
+        elif action in ("post_add", "post_remove", "post_clear"):
+            if isinstance(instance, Blog):
+                pkids = [instance.pkid]
+            else:
+                pkids = list(kwargs.get("pk_set") or ())
+            transaction.on_commit(lambda: queue_updates(pkids))
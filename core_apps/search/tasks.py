@@ -0,0 +1,23 @@
+import logging
+
+from celery import shared_task
+
+from .indexing import flush_index_queue
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def flush_search_index() -> int:
+    """
+    Write the blogs queued by CelerySignalProcessor to the search index.
+
+    Scheduled periodically by celery beat (see CELERY_BEAT_SCHEDULE).
+
+    Returns:
+    - int: Number of blogs indexed.
+    """
+    indexed, removed = flush_index_queue()
+    if indexed or removed:
+        logger.info(f"indexed {indexed} and removed {removed} blog(s)")
+    return indexed
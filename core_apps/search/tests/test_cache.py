@@ -0,0 +1,86 @@
+import pytest
+from django.urls import reverse
+from rest_framework import mixins
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core_apps.search.cache import (
+    LRUCache,
+    invalidate_search_results,
+    search_cache_key,
+)
+from core_apps.search.search_indexes import BlogIndex
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """Test the cache drops the least recently used entry when full"""
+    cache = LRUCache(max_entries=2, timeout=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_expires_entries():
+    """Test entries are not served past the timeout"""
+    cache = LRUCache(max_entries=2, timeout=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+@pytest.mark.django_db
+def test_index_text_includes_tags_and_author(profile_factory, blog_factory):
+    """Test the document and autocomplete fields cover the author and tags"""
+    blog = blog_factory(author=profile_factory().user)
+    blog.tags.create(tag="Django", slug="django")
+
+    prepared = BlogIndex().full_prepare(blog)
+
+    assert "Django" in prepared["text"]
+    assert blog.author.username in prepared["text"]
+    assert prepared["autocomplete"].endswith("Django")
+
+
+@pytest.mark.django_db
+def test_search_results_cached_until_index_update(
+    client, monkeypatch, profile_factory, blog_factory
+):
+    """Test equivalent queries are served from the cache until invalidated"""
+    blog_factory(author=profile_factory().user, title="Caching search pages")
+    calls = []
+    original = mixins.ListModelMixin.list
+
+    def counting_list(self, request, *args, **kwargs):
+        calls.append(request.query_params.get("q"))
+        return original(self, request, *args, **kwargs)
+
+    monkeypatch.setattr(mixins.ListModelMixin, "list", counting_list)
+    url = reverse("search-article")
+
+    first = client.get(url, {"q": "Caching"})
+    second = client.get(url, {"q": "  caching "})
+    invalidate_search_results()
+    client.get(url, {"q": "caching"})
+
+    assert first.status_code == 200
+    assert first.json()["count"] == 1
+    assert second.json() == first.json()
+    assert len(calls) == 2
+
+
+def test_cache_key_normalizes_only_the_query():
+    """Test q is case folded while filter values keep their case"""
+    factory = APIRequestFactory()
+    url = reverse("search-article")
+
+    def key(params):
+        return search_cache_key(Request(factory.get(url, params)))
+
+    assert key({"q": "Caching"}) == key({"q": " caching "})
+    assert key({"author": "Alice"}) != key({"author": "alice"})
+    assert key({"tags": ["b", "a"]}) == key({"tags": ["a", "b"]})
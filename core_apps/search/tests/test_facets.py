@@ -0,0 +1,88 @@
+import pytest
+from django.urls import reverse
+from haystack import connections as haystack_connections
+
+from core_apps.blogs.models import Blog
+from core_apps.search.indexing import index_blogs
+
+
+@pytest.fixture
+def whoosh_backend(settings, tmp_path):
+    """Search a throwaway whoosh index, which supports facets"""
+    # Engines read their options from the settings, not connections_info
+    settings.HAYSTACK_CONNECTIONS = {
+        "default": {
+            "ENGINE": "haystack.backends.whoosh_backend.WhooshEngine",
+            "PATH": str(tmp_path / "whoosh_index"),
+        }
+    }
+    haystack_connections.connections_info = settings.HAYSTACK_CONNECTIONS
+    haystack_connections.reload("default")
+    yield
+
+
+@pytest.fixture
+def tagged_blogs(profile_factory, blog_factory):
+    """Three indexed blogs by two authors with overlapping tags"""
+    alice = profile_factory(user__username="alice").user
+    bob = profile_factory(user__username="bob").user
+    blogs = [
+        blog_factory(author=alice, title="Django caching"),
+        blog_factory(author=alice, title="Django signals"),
+        blog_factory(author=bob, title="Python packaging"),
+    ]
+    django = blogs[0].tags.create(tag="django", slug="django")
+    python = blogs[2].tags.create(tag="python", slug="python")
+    blogs[1].tags.add(django, python)
+    index_blogs(Blog.objects.filter(pkid__in=[blog.pkid for blog in blogs]))
+    return blogs
+
+
+@pytest.mark.django_db
+def test_search_filters_by_tag_and_author(client, whoosh_backend, tagged_blogs):
+    """Test search results are narrowed by tag and author username"""
+    url = reverse("search-article")
+
+    by_tag = client.get(url, {"tags": "python"}).json()
+    by_author = client.get(url, {"tags": "django,python", "author": "alice"}).json()
+
+    assert sorted(hit["title"] for hit in by_tag["results"]) == [
+        "Django signals",
+        "Python packaging",
+    ]
+    assert by_author["count"] == 2
+
+
+@pytest.mark.django_db
+def test_search_facets_count_tags_authors_and_dates(
+    client, whoosh_backend, tagged_blogs
+):
+    """Test facet counts are computed for the filtered results"""
+    response = client.get(reverse("search-facets"), {"q": "django"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["tags"] == [
+        {"value": "django", "count": 2},
+        {"value": "python", "count": 1},
+    ]
+    assert data["authors"] == [{"value": "alice", "count": 2}]
+    assert [bucket["count"] for bucket in data["created"]] == [2]
+
+
+@pytest.mark.django_db
+def test_search_facets_reject_unknown_date_gap(client):
+    """Test date_gap must be a known bucket width"""
+    response = client.get(reverse("search-facets"), {"date_gap": "week"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_search_filters_by_created_range(client, whoosh_backend, tagged_blogs):
+    """Test created_after/created_before bound the results"""
+    url = reverse("search-article")
+    today = tagged_blogs[0].created_at.date()
+
+    assert client.get(url, {"created_after": today.isoformat()}).json()["count"] == 3
+    assert client.get(url, {"created_before": "2000-01-01"}).json()["count"] == 0
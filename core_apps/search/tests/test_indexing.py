@@ -0,0 +1,83 @@
+import datetime
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.utils import timezone
+
+from core_apps.blogs.models import Blog
+from core_apps.search import signals
+from core_apps.search.indexing import index_range, pkid_ranges
+
+
+@pytest.mark.django_db
+def test_blog_save_queues_update_on_commit(
+    monkeypatch, profile_factory, blog_factory, django_capture_on_commit_callbacks
+):
+    """Test saving a blog queues its pkid instead of writing the index"""
+    queued = []
+    monkeypatch.setattr(signals, "queue_updates", lambda pkids: queued.extend(pkids))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        blog = blog_factory(author=profile_factory().user)
+
+    assert set(queued) == {blog.pkid}
+
+
+@pytest.mark.django_db
+def test_login_does_not_requeue_author_blogs(
+    monkeypatch, profile_factory, blog_factory, django_capture_on_commit_callbacks
+):
+    """Test only saves that may rename a user requeue their blogs"""
+    author = profile_factory().user
+    blog = blog_factory(author=author)
+    queued = []
+    monkeypatch.setattr(
+        signals, "queue_updates", lambda pkids: queued.append(list(pkids))
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        author.last_login = timezone.now()
+        author.save(update_fields=["last_login"])
+        author.username = "renamed"
+        author.save()
+
+    assert queued == [[blog.pkid]]
+
+
+@pytest.mark.django_db
+def test_index_range_filters_by_pkid_and_since(profile_factory, blog_factory):
+    """Test a pkid range only indexes the blogs updated since a time"""
+    author = profile_factory().user
+    old, new = blog_factory(author=author), blog_factory(author=author)
+    Blog.objects.filter(pkid=old.pkid).update(
+        updated_at=timezone.now() - datetime.timedelta(days=10)
+    )
+    since = timezone.now() - datetime.timedelta(days=1)
+
+    ranges = pkid_ranges(Blog.objects.all(), batch_size=1)
+
+    assert ranges == [(old.pkid, old.pkid + 1), (new.pkid, new.pkid + 1)]
+    assert sum(index_range(r) for r in ranges) == 2
+    assert sum(index_range(r, since) for r in ranges) == 1
+
+
+def test_update_blog_index_rejects_bad_since():
+    """Test --since must be a date or datetime"""
+    with pytest.raises(CommandError):
+        call_command("update_blog_index", since="yesterday")
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="search_vector needs PostgreSQL"
+)
+def test_postgres_search_ranks_title_matches_first(profile_factory, blog_factory):
+    """Test prefix matches in the title outrank matches in the body"""
+    author = profile_factory().user
+    in_body = blog_factory(author=author, title="Notes", body="about performance")
+    in_title = blog_factory(author=author, title="Performance notes", body="text")
+    blog_factory(author=author, title="Unrelated", body="nothing")
+    Blog.objects.all().refresh_search_vectors()
+
+    assert list(Blog.objects.search("perf")) == [in_title, in_body]
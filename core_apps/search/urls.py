@@ -1,11 +1,19 @@
 from django.urls import path
 from rest_framework import routers
 
-from .views import SearchBlogView
+from .indexing import uses_postgres
+from .views import PostgresSearchBlogView, SearchBlogView
 
 router = routers.DefaultRouter()
 router.register("search", SearchBlogView, basename="search-article")
 
+search_view_class = PostgresSearchBlogView if uses_postgres() else SearchBlogView
+
 urlpatterns = [
-    path("search/", SearchBlogView.as_view({"get": "list"}), name="search-article")
+    path("search/", search_view_class.as_view({"get": "list"}), name="search-article"),
+    path(
+        "search/facets/",
+        search_view_class.as_view({"get": "facets"}),
+        name="search-facets",
+    ),
 ]
@@ -1,13 +1,96 @@
+from typing import Any
+
+from django.db.models import QuerySet
 from drf_haystack import viewsets
-from drf_haystack.filters import HaystackAutocompleteFilter
-from rest_framework import permissions
+from rest_framework import mixins, permissions
+from rest_framework import viewsets as rest_viewsets
+from rest_framework.request import Request
+from rest_framework.response import Response
 
 from core_apps.blogs.models import Blog
 
-from .serializers import BlogSearchSerializer
+from .cache import search_cache_key, search_results
+from .facets import get_facet_options, haystack_facets, postgres_facets
+from .filters import (
+    BlogAutocompleteFilter,
+    BlogSearchFilter,
+    filter_blog_queryset,
+    get_search_filters,
+)
+from .pagination import SearchPagination
+from .serializers import BlogSearchSerializer, PostgresBlogSearchSerializer
+
+
+class CachedSearchMixin:
+    """
+    View mixin serving search results and facets from the search
+        result cache.
+
+    Views define count_facets, computing the facet counts of their
+        filtered queryset.
+
+    Methods:
+    - list: Serve a page of results, from the search result
+        cache when the index hasn't changed since.
+    - facets: Serve the tag, author and created_at counts of
+        the results, from the search result cache likewise.
+    """
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        List a page of search results.
+
+        Pages are cached per process, keyed by the normalized query
+            parameters and the index version, so repeated typeahead
+            queries skip the search engine.
+
+        Args:
+        - request (Request): The search request.
+        - args (Any): Additional positional arguments.
+        - kwargs (Any): Additional keyword arguments.
+
+        Returns:
+        - Response: The page of search results.
+        """
+        key = search_cache_key(request)
+        data = search_results.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        search_results.set(key, response.data)
+        return response
+
+    def facets(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Count the tags, authors and creation dates of the results.
+
+        Takes the same query and filters as list, plus ?date_gap=
+            (day, month or year) and ?facet_limit=.
+
+        Args:
+        - request (Request): The facets request.
+        - args (Any): Additional positional arguments.
+        - kwargs (Any): Additional keyword arguments.
 
+        Returns:
+        - Response: The facet counts.
+        """
+        key = search_cache_key(request)
+        data = search_results.get(key)
+        if data is None:
+            gap, limit = get_facet_options(request)
+            data = self.count_facets(
+                self.filter_queryset(self.get_queryset()),
+                get_search_filters(request),
+                gap,
+                limit,
+            )
+            search_results.set(key, data)
+        return Response(data)
 
-class SearchBlogView(viewsets.HaystackViewSet):
+
+class SearchBlogView(CachedSearchMixin, viewsets.HaystackViewSet):
     """
     View for searching blog articles.
 
@@ -22,9 +105,59 @@ class SearchBlogView(viewsets.HaystackViewSet):
         class for the view.
     - filter_backends (list): List of filter backends
         for the view.
+    - pagination_class (SearchPagination): Pagination class
+        for the search results.
+    - count_facets (Callable): Facet counts computed by the
+        search engine.
     """
 
     permission_classes = [permissions.AllowAny]
     index_models = [Blog]
     serializer_class = BlogSearchSerializer
-    filter_backends = [HaystackAutocompleteFilter]
+    filter_backends = [BlogAutocompleteFilter, BlogSearchFilter]
+    pagination_class = SearchPagination
+    count_facets = staticmethod(haystack_facets)
+
+
+class PostgresSearchBlogView(
+    CachedSearchMixin, mixins.ListModelMixin, rest_viewsets.GenericViewSet
+):
+    """
+    View for searching blog articles with PostgreSQL full-text search.
+
+    Serves the same ?q= prefix search and response as SearchBlogView
+        from the GIN indexed Blog.search_vector, ranked by ts_rank.
+        Used when SEARCH_BACKEND is "postgres".
+
+    Attributes:
+    - permission_classes (list): List of permission classes
+        for the view.
+    - serializer_class (PostgresBlogSearchSerializer): Serializer
+        class for the view.
+    - pagination_class (SearchPagination): Pagination class
+        for the search results.
+    - count_facets (Callable): Facet counts computed with
+        GROUP BY queries.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    serializer_class = PostgresBlogSearchSerializer
+    pagination_class = SearchPagination
+    count_facets = staticmethod(postgres_facets)
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Get the blogs matching the search query.
+
+        Returns:
+        - QuerySet: The matching blogs with their authors, best first,
+            narrowed to the search filters.
+        """
+        blogs = Blog.objects.search(self.request.query_params.get("q", ""))
+        return (
+            filter_blog_queryset(blogs, get_search_filters(self.request))
+            .select_related("author")
+            .only(
+                "pkid", "title", "body", "created_at", "updated_at", "author__username"
+            )
+        )
@@ -0,0 +1,57 @@
+# Generated by Django 3.2.11 on 2026-10-18 01:05
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Indexes on the expressions BlogFilter's author filters match with,
+# UPPER(column::text): trigram GIN for substring matches and
+# text_pattern_ops btree for prefix matches
+INDEXES = {
+    "user_first_name_upper_trgm": 'USING gin (UPPER("first_name"::text) gin_trgm_ops)',
+    "user_first_name_upper_prefix": '(UPPER("first_name"::text) text_pattern_ops)',
+    "user_username_upper_trgm": 'USING gin (UPPER("username"::text) gin_trgm_ops)',
+    "user_username_upper_prefix": '(UPPER("username"::text) text_pattern_ops)',
+}
+
+
+def add_name_indexes(apps, schema_editor):
+    """
+    Build the name search indexes CONCURRENTLY on PostgreSQL.
+
+    Other databases don't have pg_trgm or operator classes, so they
+        keep scanning the table.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    User = apps.get_model("users", "User")
+    table = schema_editor.quote_name(User._meta.db_table)
+    for name, definition in INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {schema_editor.quote_name(name)} "
+            f"ON {table} {definition}"
+        )
+
+
+def remove_name_indexes(apps, schema_editor):
+    """Drop the name search indexes."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in INDEXES:
+        schema_editor.execute(
+            f"DROP INDEX CONCURRENTLY IF EXISTS {schema_editor.quote_name(name)}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY needs autocommit
+    atomic = False
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(add_name_indexes, remove_name_indexes),
+    ]
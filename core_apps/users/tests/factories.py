@@ -14,7 +14,7 @@ class UserFactory(factory.django.DjangoModelFactory):
     """Factory for User model"""
     first_name = factory.LazyAttribute(lambda x: faker.first_name())
     last_name = factory.LazyAttribute(lambda x: faker.last_name())
-    username = factory.LazyAttribute(lambda x: faker.first_name().lower())
+    username = factory.Sequence(lambda n: f"{faker.first_name().lower()}{n}")
     email = factory.LazyAttribute(lambda o: f"{o.username}@example.org")
     password = factory.LazyAttribute(lambda x: faker.password())
     is_active = True
@@ -28,7 +28,7 @@ class UserFactory(factory.django.DjangoModelFactory):
     def _create(cls, model_class, *args, **kwargs):
         """Override the default _create"""
         manager = cls._get_manager(model_class)
-        if "is_super_user" in kwargs:
+        if "is_superuser" in kwargs:
             return manager.create_superuser(*args, **kwargs)
 
-        return manager.create_superuser(*args, **kwargs)
\ No newline at end of file
+        return manager.create_user(*args, **kwargs)
\ No newline at end of file
@@ -128,18 +128,54 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 # Redis Cache
+REDIS_HOST = "redis"
+REDIS_PORT = 6379
+REDIS_URL = env("REDIS_URL", default=f"redis://{REDIS_HOST}:{REDIS_PORT}/0")
+
+# Options of the connection pool shared by the cache, throttling and view
+# counting (see core_apps.common.redis_client). Once max_connections are
+# in use, callers wait up to timeout seconds for a free connection.
+REDIS_POOL_OPTIONS = {
+    "max_connections": env.int("REDIS_MAX_CONNECTIONS", default=20),
+    "timeout": env.float("REDIS_POOL_TIMEOUT", default=2.0),
+    "socket_timeout": env.float("REDIS_SOCKET_TIMEOUT", default=1.0),
+    "socket_connect_timeout": env.float("REDIS_SOCKET_CONNECT_TIMEOUT", default=1.0),
+    "health_check_interval": env.int("REDIS_HEALTH_CHECK_INTERVAL", default=30),
+    "retry_on_timeout": True,
+}
+
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
-        "LOCATION": "redis://redis:6379/0",  # Replace with your Redis server and port
+        "LOCATION": REDIS_URL,
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # Treat an unavailable Redis as a cache miss instead of an error
+            "IGNORE_EXCEPTIONS": True,
         },
     }
 }
-
-REDIS_HOST = "redis"
-REDIS_PORT = 6379
+DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
+DJANGO_REDIS_CONNECTION_FACTORY = (
+    "core_apps.common.redis_client.SharedConnectionFactory"
+)
+
+# How long blog list and detail responses are cached. Entries are
+# invalidated by version bumps (see core_apps.blogs.cache), not by expiry.
+BLOG_CACHE_TIMEOUT = 60 * 60 * 2
+
+# How long a profile's cached following and followers sets are kept (see
+# core_apps.profiles.graph). Sets are reloaded from the database after
+# this, which bounds how long one missing a follow that raced its load,
+# or a failed write-through, stays wrong.
+SOCIAL_GRAPH_TIMEOUT = 60 * 60
+
+# Home feed timelines (see core_apps.blogs.feed): blogs kept per timeline,
+# followers above which an author's blogs are read on demand instead of
+# fanned out, and how long an unread timeline is kept
+FEED_MAX_LENGTH = 800
+FEED_FAN_OUT_LIMIT = 10_000
+FEED_TIMEOUT = 60 * 60 * 24 * 7
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.1/topics/i18n/
@@ -216,6 +252,25 @@ CELERY_TIMEZONE = "Africa/Accra"
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
+# Backend the celery email tasks, and the follow digests, send with
+CELERY_EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+
+# Follows of a user within this many seconds are emailed as one digest
+FOLLOW_DIGEST_WINDOW = 60 * 5
+CELERY_BEAT_SCHEDULE = {
+    "flush-blog-views": {
+        "task": "core_apps.blogs.tasks.flush_blog_views",
+        "schedule": 30.0,  # seconds
+    },
+    "flush-search-index": {
+        "task": "core_apps.search.tasks.flush_search_index",
+        "schedule": 10.0,  # seconds
+    },
+    "send-follow-digests": {
+        "task": "core_apps.profiles.tasks.send_follow_digests",
+        "schedule": 60.0,  # seconds
+    },
+}
 
 REST_FRAMEWORK = {
     # using the custom exception handler in common
@@ -276,7 +331,20 @@ HAYSTACK_CONNECTIONS = {
 }
 HAYSTACK_SEARCH_RESULTS_PER_PAGE = 10
 
-HAYSTACK_SIGNAL_PROCESSOR = "haystack.signals.RealtimeSignalProcessor"
+# Engine serving SearchBlogView: "haystack" (HAYSTACK_CONNECTIONS) or "postgres"
+# (Blog.search_vector, which needs PostgreSQL and a one-off update_blog_index)
+SEARCH_BACKEND = env("SEARCH_BACKEND", default="haystack")
+# Text search configuration used to build and query Blog.search_vector
+SEARCH_POSTGRES_CONFIG = "english"
+
+# Search result pages cached in each API process (see core_apps.search.cache).
+# Entries are invalidated when the index is written to, and expire after the
+# timeout in case an index write bypassed the invalidation.
+SEARCH_CACHE_MAX_ENTRIES = 1024
+SEARCH_CACHE_TIMEOUT = 60
+
+# Index updates are queued on save and written in batches by celery
+HAYSTACK_SIGNAL_PROCESSOR = "core_apps.search.signals.CelerySignalProcessor"
 
 
 LOGGING = {
@@ -47,6 +47,8 @@ urlpatterns = [
     path("api/v1/comments/", include("core_apps.comments.urls")),
     # route for searching with haystack
     path("api/v1/haystack/", include("core_apps.search.urls")),
+    # route for operational metrics
+    path("api/v1/common/", include("core_apps.common.urls")),
 ]
 
 admin.site.site_header = "Modern Blog API"